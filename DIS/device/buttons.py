@@ -0,0 +1,169 @@
+from machine import Pin
+from array import array
+import utime as time
+
+# Gesture events, one per accepted press or release
+EV_DOWN = 0          # key went down (debounced)
+EV_SHORT = 1         # released before the long-press time
+EV_LONG = 2          # still held at the long-press time
+EV_LONG_RELEASE = 3  # released after a long press
+
+EDGE_RING_SIZE = 32   # power of two
+EVENT_RING_SIZE = 16  # power of two
+
+
+class Buttons:
+    """
+    IRQ-driven push buttons (active low, pull-ups).
+
+    Pin-change IRQs only timestamp the edge and push it into a preallocated
+    ring, so nothing is missed while a slow redraw holds up the main loop.
+    poll() drains the ring through a per-key debouncer and gesture
+    recognizer and queues (key, event) pairs for get(). An edge is acted on
+    immediately and further edges on that key are ignored for debounce_ms;
+    if the bouncing left the key in the other state, poll() catches up from
+    the pin level once the lockout expires.
+
+    get() returns (key, event, latency_us) with latency measured from the
+    edge (or long-press deadline) to the moment the event is consumed.
+    """
+    def __init__(self, pins, debounce_ms=150, longpress_ms=3000, flag=None):
+        self.pins = tuple(pins)
+        self.debounce_us = debounce_ms * 1000
+        self.longpress_us = longpress_ms * 1000
+        self.flag = flag  # uasyncio.ThreadSafeFlag set on every edge, optional
+        n = len(self.pins)
+        now = time.ticks_us()
+
+        # IRQ -> poll() edge ring
+        self._edge_t = array("i", [0] * EDGE_RING_SIZE)
+        self._edge_k = bytearray(EDGE_RING_SIZE)  # key << 1 | level
+        self._edge_head = 0
+        self._edge_tail = 0
+        self.edges_dropped = 0
+
+        # Per-key debouncer / gesture state
+        self._stable = bytearray(n)
+        self._last = array("i", [now] * n)  # last accepted edge
+        self._raw = array("i", [now] * n)   # last edge seen, accepted or not
+        self._press = array("i", [0] * n)
+        self._long = bytearray(n)
+
+        # poll() -> get() event ring
+        self._ev = bytearray(EVENT_RING_SIZE)  # key << 2 | event
+        self._ev_t = array("i", [0] * EVENT_RING_SIZE)
+        self._ev_head = 0
+        self._ev_tail = 0
+
+        self.last_latency_us = 0
+        self.max_latency_us = 0
+
+        handlers = (self._irq0, self._irq1, self._irq2, self._irq3)
+        for k, pin in enumerate(self.pins):
+            self._stable[k] = pin.value()
+            pin.irq(handlers[k], Pin.IRQ_FALLING | Pin.IRQ_RISING, hard=True)
+
+    # ---------------- IRQ side (no allocation) ----------------
+
+    def _push(self, key):
+        t = time.ticks_us()
+        head = self._edge_head
+        nxt = (head + 1) & (EDGE_RING_SIZE - 1)
+        if nxt == self._edge_tail:
+            self.edges_dropped += 1
+            return
+        self._edge_t[head] = t
+        self._edge_k[head] = (key << 1) | self.pins[key].value()
+        self._edge_head = nxt
+        if self.flag is not None:
+            self.flag.set()
+
+    def _irq0(self, pin):
+        self._push(0)
+
+    def _irq1(self, pin):
+        self._push(1)
+
+    def _irq2(self, pin):
+        self._push(2)
+
+    def _irq3(self, pin):
+        self._push(3)
+
+    # ---------------- Recognizer ----------------
+
+    def busy(self):
+        """
+        True while poll() still has time-based work: a key is down (a long
+        press may be timing) or a debounce lockout has not expired yet.
+        Otherwise nothing can happen until the next edge IRQ.
+        """
+        now = time.ticks_us()
+        for k in range(len(self.pins)):
+            if not self._stable[k] or time.ticks_diff(now, self._last[k]) < self.debounce_us:
+                return True
+        return False
+
+    def poll(self):
+        """Drain edges and run long-press timing; call from the main loop."""
+        tail = self._edge_tail
+        while tail != self._edge_head:
+            code = self._edge_k[tail]
+            self._edge(code >> 1, code & 1, self._edge_t[tail])
+            tail = (tail + 1) & (EDGE_RING_SIZE - 1)
+            self._edge_tail = tail
+
+        now = time.ticks_us()
+        for k in range(len(self.pins)):
+            # Bounce ended in the other state than the one we accepted:
+            # take it as of the last edge, when the contact actually settled
+            if time.ticks_diff(now, self._last[k]) >= self.debounce_us:
+                level = self.pins[k].value()
+                if level != self._stable[k]:
+                    t = self._raw[k]
+                    if time.ticks_diff(t, self._last[k]) < self.debounce_us:
+                        t = time.ticks_add(self._last[k], self.debounce_us)
+                    self._edge(k, level, t)
+            if not self._stable[k] and not self._long[k]:
+                if time.ticks_diff(now, self._press[k]) >= self.longpress_us:
+                    self._long[k] = 1
+                    self._emit(k, EV_LONG, time.ticks_add(self._press[k], self.longpress_us))
+
+    def _edge(self, k, level, t):
+        self._raw[k] = t
+        if level == self._stable[k]:
+            return
+        if time.ticks_diff(t, self._last[k]) < self.debounce_us:
+            return
+        self._stable[k] = level
+        self._last[k] = t
+        if not level:
+            self._press[k] = t
+            self._long[k] = 0
+            self._emit(k, EV_DOWN, t)
+        elif self._long[k]:
+            self._emit(k, EV_LONG_RELEASE, t)
+        else:
+            self._emit(k, EV_SHORT, t)
+
+    def _emit(self, k, event, t):
+        head = self._ev_head
+        nxt = (head + 1) & (EVENT_RING_SIZE - 1)
+        if nxt == self._ev_tail:
+            return  # consumer stalled; drop the newest
+        self._ev[head] = (k << 2) | event
+        self._ev_t[head] = t
+        self._ev_head = nxt
+
+    def get(self):
+        """Next (key, event, latency_us), or None when the queue is empty."""
+        tail = self._ev_tail
+        if tail == self._ev_head:
+            return None
+        code = self._ev[tail]
+        latency = time.ticks_diff(time.ticks_us(), self._ev_t[tail])
+        self._ev_tail = (tail + 1) & (EVENT_RING_SIZE - 1)
+        self.last_latency_us = latency
+        if latency > self.max_latency_us:
+            self.max_latency_us = latency
+        return code >> 2, code & 3, latency
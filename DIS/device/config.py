@@ -1,6 +1,8 @@
 from machine import Pin, SPI, UART
 import framebuf, time
 import micropython
+from performance import FLUSH
+from buttons import Buttons, EV_DOWN, EV_SHORT, EV_LONG, EV_LONG_RELEASE
 
 # ------- Pins -------
 DC, RST, MOSI, SCK, CS = 8, 12, 11, 10, 9
@@ -9,15 +11,49 @@ DC, RST, MOSI, SCK, CS = 8, 12, 11, 10, 9
 KEY0 = Pin(15, Pin.IN, Pin.PULL_UP)
 KEY1 = Pin(17, Pin.IN, Pin.PULL_UP)
 
-# UART (unchanged)
-uart = UART(1, baudrate=115200, tx=Pin(4), rx=Pin(5))
+# UART. The controller can send up to ~640 frames/s; a 1 KiB receive buffer
+# holds ~90 ms of that while the render task has the CPU
+uart = UART(1, baudrate=115200, tx=Pin(4), rx=Pin(5), rxbuf=1024)
+
+# Keep CS low for a whole frame flush and switch DC between command and data
+# bytes. Set False to fall back to one CS assertion per transfer.
+OLED_STREAM_FLUSH = True
+
+@micropython.viper
+def _diff_rows(buf, shadow, dirty, stride: int) -> int:
+    """
+    Copy changed rows of buf into shadow and return how many changed.
+    dirty has one flag per row: rows flagged 0 are not compared, and on
+    return a row is flagged 1 only if it changed.
+    """
+    src = ptr8(buf)
+    dst = ptr8(shadow)
+    flags = ptr8(dirty)
+    rows = int(len(dirty))
+    count = 0
+    r = 0
+    while r < rows:
+        if flags[r]:
+            i = r * stride
+            end = i + stride
+            changed = 0
+            while i < end:
+                if src[i] != dst[i]:
+                    dst[i] = src[i]
+                    changed = 1
+                i += 1
+            flags[r] = changed
+            count += changed
+        r += 1
+    return count
 
 # OLED Display Setup
 class OLED_1inch3(framebuf.FrameBuffer):
-    def __init__(self):
+    def __init__(self, streaming=OLED_STREAM_FLUSH):
         self.width = 128
         self.height = 64
         self.rotate = 180
+        self.streaming = streaming
 
         self.cs = Pin(CS, Pin.OUT)
         self.rst = Pin(RST, Pin.OUT)
@@ -29,31 +65,48 @@ class OLED_1inch3(framebuf.FrameBuffer):
         self.dc(1)
         self.buffer = bytearray(self.height * self.width // 8)
         super().__init__(self.buffer, self.width, self.height, framebuf.MONO_HMSB)
+
+        # -------- Dirty page tracking ----------
+        # Each 16-byte framebuffer row is one SH1107 column page. The shadow holds
+        # what the panel last received so show() only sends rows that changed.
+        self._page_bytes = self.width // 8
+        self._shadow = bytearray(len(self.buffer))
+        self._dirty = bytearray(self.height)
+        self._all_rows = b"\x01" * self.height
+        self._force_full = True  # panel RAM is unknown until the first flush
+        self.last_pages_sent = 0
+        self.profiler = None  # PerformanceMonitor timing show() as its flush section
+
+        # -------- Preallocated SPI transfer buffers ----------
+        self._cmd1 = bytearray(1)
+        self._data1 = bytearray(1)
+        self._page_cmd = bytearray(2)  # lower + higher column address
+        mv = memoryview(self.buffer)
+        pb = self._page_bytes
+        self._rows = tuple(mv[i:i + pb] for i in range(0, len(self.buffer), pb))
+
         self.init_display()
 
         # -------- Button state ----------
-        now = time.ticks_ms()
         self.key0 = KEY0
         self.key1 = KEY1
-        self._debounce_ms = 150
-        self._longpress_ms = 3000
-        self._reset_alert_ms = 3000
-        self._last_key0 = self.key0.value()
-        self._last_key1 = self.key1.value()
-        self._last_time_k0 = now
-        self._last_time_k1 = now
-        self._k1_press_start = None
-        self._k1_reset_fired = False
-        
+        self.buttons = Buttons((self.key0, self.key1), debounce_ms=150, longpress_ms=3000)
+
     def write_cmd(self, cmd):
+        self._cmd1[0] = cmd
+        self.write_cmds(self._cmd1)
+
+    def write_cmds(self, buf):
+        """Send several command bytes in a single CS assertion."""
         self.cs(1); self.dc(0); self.cs(0)
-        self.spi.write(bytearray([cmd]))
+        self.spi.write(buf)
         self.cs(1)
 
     def write_data(self, buf):
         self.cs(1); self.dc(1); self.cs(0)
         if isinstance(buf, int):
-            self.spi.write(bytes([buf]))
+            self._data1[0] = buf
+            self.spi.write(self._data1)
         else:
             self.spi.write(buf)  # send the whole buffer/slice as-is
         self.cs(1)
@@ -65,57 +118,86 @@ class OLED_1inch3(framebuf.FrameBuffer):
         self.rst(0)
         time.sleep(0.01)
         self.rst(1)
-        
-        self.write_cmd(0xAE)#turn off OLED display
-
-        self.write_cmd(0x00)   #set lower column address
-        self.write_cmd(0x10)   #set higher column address 
-
-        self.write_cmd(0xB0)   #set page address 
-      
-        self.write_cmd(0xdc)    #et display start line 
-        self.write_cmd(0x00) 
-        self.write_cmd(0x81)    #contract control 
-        self.write_cmd(0x6f)    #128
-        self.write_cmd(0x21)    # Set Memory addressing mode (0x20/0x21) #
-        if self.rotate == 0:
-            self.write_cmd(0xa0)    #set segment remap
-        elif self.rotate == 180:
-            self.write_cmd(0xa1)
-        self.write_cmd(0xc0)    #Com scan direction
-        self.write_cmd(0xa4)   #Disable Entire Display On (0xA4/0xA5) 
-
-        self.write_cmd(0xa6)    #normal / reverse
-        self.write_cmd(0xa8)    #multiplex ratio 
-        self.write_cmd(0x3f)    #duty = 1/64
-  
-        self.write_cmd(0xd3)    #set display offset 
-        self.write_cmd(0x60)
-
-        self.write_cmd(0xd5)    #set osc division 
-        self.write_cmd(0x41)
-    
-        self.write_cmd(0xd9)    #set pre-charge period
-        self.write_cmd(0x22)   
-
-        self.write_cmd(0xdb)    #set vcomh 
-        self.write_cmd(0x35)  
-    
-        self.write_cmd(0xad)    #set charge pump enable 
-        self.write_cmd(0x8a)    #Set DC-DC enable (a=0:disable; a=1:enable)
-        self.write_cmd(0XAF)
-
-    def show(self):
-        self.write_cmd(0xB0)
+
+        # The whole setup goes out in one CS assertion rather than one per byte
+        self.write_cmds(bytes((
+            0xAE,           # turn off OLED display
+            0x00,           # set lower column address
+            0x10,           # set higher column address
+            0xB0,           # set page address
+            0xDC, 0x00,     # set display start line
+            0x81, 0x6F,     # contrast control: 128
+            0x21,           # set memory addressing mode (0x20/0x21)
+            0xA0 if self.rotate == 0 else 0xA1,  # set segment remap
+            0xC0,           # com scan direction
+            0xA4,           # disable entire display on (0xA4/0xA5)
+            0xA6,           # normal / reverse
+            0xA8, 0x3F,     # multiplex ratio: duty = 1/64
+            0xD3, 0x60,     # set display offset
+            0xD5, 0x41,     # set osc division
+            0xD9, 0x22,     # set pre-charge period
+            0xDB, 0x35,     # set vcomh
+            0xAD, 0x8A,     # set charge pump enable: DC-DC enable (a=0:disable; a=1:enable)
+            0xAF,           # turn on OLED display
+        )))
+
+    def show(self, full=False, region=None):
+        """
+        Flush changed pages to the panel.
+        full=True resends every page, e.g. to recover after an alert or glitch.
+        region limits the flush to the framebuffer rows flagged nonzero in it
+        (one byte per row, see layout.py); the rest are not even compared.
+        """
+        prof = self.profiler
+        if prof is None:
+            self._flush(full, region)
+        else:
+            prof.begin(FLUSH)
+            self._flush(full, region)
+            prof.end(FLUSH)
+
+    def _flush(self, full, region=None):
+        full = full or self._force_full
+        dirty = self._dirty
+        dirty[:] = self._all_rows if full or region is None else region
+        changed = _diff_rows(self.buffer, self._shadow, dirty, self._page_bytes)
+        if not full and not changed:
+            self.last_pages_sent = 0
+            return
+        self._force_full = False
+
+        rows = self._rows
+        cmd = self._page_cmd
+        flip = self.rotate != 180
+        stream = self.streaming
+        spi = self.spi
+        sent = 0
+
+        if stream:
+            self.cs(1); self.cs(0)
+            self.dc(0)
+            self._cmd1[0] = 0xB0
+            spi.write(self._cmd1)
+        else:
+            self.write_cmd(0xB0)
+
         for page in range(0, 64):
-            column = page if self.rotate == 180 else (63 - page)
-            self.write_cmd(0x00 + (column & 0x0F))
-            self.write_cmd(0x10 + (column >> 4))
-            # OPTIMIZATION: Slice the buffer and send 16 bytes at once
-            # instead of looping 16 times for 1 byte.
-            start_index = page * 16
-            end_index = start_index + 16
-            self.write_data(self.buffer[start_index:end_index])
+            if not full and not dirty[page]:
+                continue
+            column = (63 - page) if flip else page
+            cmd[0] = 0x00 + (column & 0x0F)
+            cmd[1] = 0x10 + (column >> 4)
+            if stream:
+                self.dc(0); spi.write(cmd)
+                self.dc(1); spi.write(rows[page])
+            else:
+                self.write_cmds(cmd)
+                self.write_data(rows[page])
+            sent += 1
+
+        if stream:
+            self.cs(1)
+        self.last_pages_sent = sent
 
     def set_invert(self, invert):
         """Set the display to inverted mode using a hardware command."""
@@ -126,53 +208,35 @@ class OLED_1inch3(framebuf.FrameBuffer):
 
     def check_button(self):
         """
-        Debounced button handler.
+        Debounced button handler, fed by the pin IRQs in self.buttons.
         - KEY0: short press -> advance screen by 1
         - KEY1: short press -> toggle timer start/stop
         - KEY1: long press (3s) -> reset timer
         - KEY1: release after long press -> clear alert
         Returns (screen_delta, timer_toggle, timer_reset, clear_alert)
         """
-        now = time.ticks_ms()
-        k0 = self.key0.value()
-        k1 = self.key1.value()
+        buttons = self.buttons
+        buttons.poll()
 
         screen_delta = 0
         timer_toggle = False
         timer_reset = False
         clear_alert = False
 
-        # KEY0 short press: detect falling edge with debounce
-        if self._last_key0 == 1 and k0 == 0:
-            if time.ticks_diff(now, self._last_time_k0) > self._debounce_ms:
-                screen_delta = 1
-                self._last_time_k0 = now
-
-        # KEY1 press start
-        if self._last_key1 == 1 and k1 == 0:
-            if time.ticks_diff(now, self._last_time_k1) > self._debounce_ms:
-                self._k1_press_start = now
-                self._k1_reset_fired = False
-
-        # KEY1 long press detection while held
-        if self._k1_press_start is not None and k1 == 0 and not self._k1_reset_fired:
-            press_ms = time.ticks_diff(now, self._k1_press_start)
-            if press_ms >= self._longpress_ms:
+        while True:
+            ev = buttons.get()
+            if ev is None:
+                break
+            key, event, _ = ev
+            if key == 0:
+                # KEY0 acts as soon as it goes down
+                if event == EV_DOWN:
+                    screen_delta += 1
+            elif event == EV_SHORT:
+                timer_toggle = not timer_toggle
+            elif event == EV_LONG:
                 timer_reset = True
-                self._k1_reset_fired = True
-
-        # KEY1 release: decide short vs long press
-        if self._last_key1 == 0 and k1 == 1 and self._k1_press_start is not None:
-            press_ms = time.ticks_diff(now, self._k1_press_start)
-            if not self._k1_reset_fired and press_ms < self._longpress_ms:
-                timer_toggle = True
-            if self._k1_reset_fired:
+            elif event == EV_LONG_RELEASE:
                 clear_alert = True
-                self._k1_reset_fired = False
-            self._k1_press_start = None
-            self._last_time_k1 = now
-
-        self._last_key0 = k0
-        self._last_key1 = k1
 
         return screen_delta, timer_toggle, timer_reset, clear_alert
@@ -0,0 +1,24 @@
+"""
+Values derived from controller telemetry.
+
+Kept out of main.py so the host replay tool (DIS/host/replay.py) runs the
+exact math the car does.
+"""
+
+INCHES_PER_MILE = 63360.0
+
+
+def mph_from_rpm(rpm, wheel_circumference_in):
+    return rpm * wheel_circumference_in * 60 / INCHES_PER_MILE
+
+
+def remaining(goal_distance_mi, distance, goal_time_sec, elapsed_time):
+    """Distance left [mi] and time left [s], never below zero / 1 ms."""
+    remaining_distance = max(goal_distance_mi - distance, 0)
+    remaining_time_sec = max(goal_time_sec - elapsed_time, 0.001)
+    return remaining_distance, remaining_time_sec
+
+
+def target_speed(remaining_distance, remaining_time_sec):
+    """Average mph needed to cover the remaining distance in the remaining time."""
+    return (remaining_distance / (remaining_time_sec / 3600)) if remaining_time_sec > 0 else 0
@@ -1,46 +1,193 @@
 from writer import Writer
-from fonts import font_digits_large, font_digits_med, font_letters_large
+from layout import Widget, Glyphs, Label, Rule, Screen, Text
 import time
 
+# Run-length encoded fonts on flash (DIS/host/build_fonts.py)
+FONT_DIGITS_LARGE = "fonts/digits_large.rlf"
+FONT_DIGITS_MED = "fonts/digits_med.rlf"
+FONT_LETTERS_LARGE = "fonts/letters_large.rlf"
+
+# Rendered alert frames kept for reuse (1 KiB each)
+ALERT_CACHE_SIZE = 3
+
+# Large digit slots (x, y): tens, ones, hundreds' units, '.', tenths. DD.D
+# leaves the third blank and DDD the last two, so its digits keep the same
+# 34 px pitch instead of reading as DD.D with the dot missing
+NUMBER_SLOTS = ((9, 0), (43, 0), (77, 0), (79, 0), (93, 0))
+MILES_SLOTS = ((0, 0), (14, 0), (53, 0), (91, 0))
+
+
+def fmt_number(num):
+    """DD.D for the number slots; 100 and up drop the tenths and show DDD."""
+    if num < 0: num = 0.0
+    if num > 999: num = 999
+    i = int(num)
+    if i >= 100:
+        return "%d  " % i
+    return "%2d .%d" % (i, int((num * 10) % 10))  # tens only if >= 10.0
+
+
+def fmt_clock(seconds):
+    """MM:SS, clamped to 00:00..99:59."""
+    total = int(seconds) if seconds > 0 else 0
+    if total > 99 * 60 + 59: total = 99 * 60 + 59
+    return "%02d:%02d" % (total // 60, total % 60)
+
+
+def fmt_miles(distance):
+    """.DDD miles, capped at .999 for demo purposes only."""
+    return ".%03d" % max(0, min(int(distance * 1000), 999))
+
+
+def shown_delta(value, target):
+    """
+    value - target in whole tenths, both truncated like fmt_number(), so it
+    steps with the digits rather than flickering between roundings. None
+    while there is no target.
+    """
+    if target <= 0:
+        return None
+    return (int(value * 10) - int(target * 10)) / 10
+
+
+def fmt_whole(num):
+    """DD for the tens and ones slots, clamped to 0..99."""
+    if num < 0: num = 0
+    if num > 99: num = 99
+    return "%2d" % int(num)
+
+
+def fmt_delta(mph):
+    """Signed mph against the target, e.g. " +1.2"; "  ---" without a target."""
+    if mph is None:
+        return "  ---"
+    if mph > 99.9: mph = 99.9
+    if mph < -99.9: mph = -99.9
+    return "%+5.1f" % mph
+
+
+def _clock_slots(w):
+    """MM:SS slot positions, which depend on the medium digit widths."""
+    step = w.stringlen("0") - 4
+    y = 5
+    m10 = -4
+    colon = m10 + 2 * step
+    s10 = colon + w.stringlen(":") - 22
+    return ((m10, y), (m10 + step, y), (colon, y - 7), (s10, y), (s10 + step, y))
+
+
+class StatusRow(Widget):
+    """UART blink ("U") and timer state ("REC") on the bottom left."""
+    _TIMER = {"paused": 2, "running": 4}
+
+    def __init__(self, height, uart_blink, timer_state):
+        super().__init__(0, height - 9, 40, 9)
+        self.uart_blink = uart_blink
+        self.timer_state = timer_state
+
+    def read(self):
+        return (1 if self.uart_blink() else 0) | self._TIMER.get(self.timer_state(), 0)
+
+    def draw(self, oled, value):
+        y = self.y + 1
+        oled.fill_rect(0, self.y, self.w, self.h, 0)
+        if value & 1:
+            oled.text("U", 0, y, 1)
+        x_rec = 11
+        if value & 4:
+            oled.fill_rect(x_rec - 1, y - 1, 26, 10, 1)
+            oled.text("REC", x_rec, y, 0)
+        elif value & 2:
+            oled.text("REC", x_rec, y, 1)
+
+
 class DisplayManager:
-    def __init__(self, oled_driver):
+    def __init__(self, oled_driver, use_atlas=True):
         self.oled = oled_driver
         self.width = oled_driver.width
         self.height = oled_driver.height
 
         # --- Custom Font Writers ----
-        self.w_digits_large = Writer(self.oled, font_digits_large, verbose=False)
-        self.w_digits_med = Writer(self.oled, font_digits_med, verbose=False)
-        self.w_letters_big = Writer(self.oled, font_letters_large, verbose=False)
-
-        self.w_digits_large.set_wrap(False)
-        self.w_digits_med.set_wrap(False)
-
-        # ---- Precompute fixed slot positions for DD.D ----
-        self._big_slot_x0 = 9  # tens
-        self._big_slot_x1 = 43  # ones
-        self._big_slot_xdot = 79  # '.'
-        self._big_slot_x2 = 93  # tenths
-        self._big_slot_y = 0
-
-        # ---- Precompute fixed slot positions for MM:SS ----
-        dmed = self.w_digits_med.stringlen("0")
-        colon_w = self.w_digits_med.stringlen(":")
-        x0m = -4
-        self._time_x_m10 = x0m
-        self._time_x_m1 = self._time_x_m10 + dmed - 4
-        self._time_x_colon = self._time_x_m1 + dmed - 4
-        self._time_x_s10 = self._time_x_colon + colon_w - 22
-        self._time_x_s1 = self._time_x_s10 + dmed - 4
-        self._time_y = 5
+        # Each is loaded the first time a screen draws with it (see the
+        # properties below), so fonts a drive never shows cost no RAM.
+        self.use_atlas = use_atlas
+        self._w_digits_large = None
+        self._w_digits_med = None
+        self._w_letters_big = None
+
+        # ---- Screens ----
+        self._screen = None  # layout.Screen on display; None = unknown
+        self._region = bytearray(self.height)  # rows to flush, marked by widgets
+        self._no_rows = bytes(self.height)
+        # Values and screens behind draw_large_num() / draw_time()
+        self._args = [0, False, None, False, False]
+        self._args_status = StatusRow(self.height, lambda: self._args[1], lambda: self._args[2])
+        self._number_screens = {}
+        self._clock_screens = {}
 
         #--------- Alert State ----------------
         self._msg_top = None
         self._msg_bottom = None
         self._msg_until = 0  # ms timestamp; 0 means no active message
+        self._alert_drawn = None   # (top, bottom) currently on screen
+        self._alert_frames = {}    # (top, bottom) -> rendered framebuffer copy
+        self._alert_order = []     # least recently used first
         self._is_inverted = False
         self._screen_changed = True
 
+    # ---- Fonts, loaded on first use ----
+
+    def _digit_writer(self, atlas, font_path, chars):
+        # Digits are copied from pre-rendered sprite atlases (fast path) unless
+        # use_atlas=False, which falls back to Writer + FrameBuffer.blit.
+        if atlas is not None:
+            from sprites import SpriteAtlas
+            w = SpriteAtlas(self.oled, atlas)
+        else:
+            from rlefont import RleFont
+            w = Writer(self.oled, RleFont(font_path), verbose=False)
+            # Digits are drawn every frame; render them once up front
+            w.warm(chars)
+        w.set_wrap(False)
+        return w
+
+    @property
+    def w_digits_large(self):
+        w = self._w_digits_large
+        if w is None:
+            atlas = None
+            if self.use_atlas:
+                from fonts import atlas_digits_large as atlas
+            w = self._w_digits_large = self._digit_writer(atlas, FONT_DIGITS_LARGE, "0123456789.")
+        return w
+
+    @property
+    def w_digits_med(self):
+        w = self._w_digits_med
+        if w is None:
+            atlas = None
+            if self.use_atlas:
+                from fonts import atlas_digits_med as atlas
+            w = self._w_digits_med = self._digit_writer(atlas, FONT_DIGITS_MED, "0123456789:")
+        return w
+
+    @property
+    def w_letters_big(self):
+        w = self._w_letters_big
+        if w is None:
+            from rlefont import RleFont
+            try:
+                font = RleFont(FONT_LETTERS_LARGE)
+            except OSError as e:
+                # Not on flash: alerts fall back to the built-in 8x8 font
+                print("Alert font:", FONT_LETTERS_LARGE, e)
+                w = False
+            else:
+                # Alert letters are rare; keep their glyph cache small
+                w = Writer(self.oled, font, verbose=False, cache_bytes=1024)
+            self._w_letters_big = w
+        return w
+
     def _set_inversion(self, invert):
         """Internal helper to manage hardware inversion state."""
         if invert != self._is_inverted:
@@ -51,180 +198,152 @@ class DisplayManager:
         """Signals that the screen has changed and a full redraw is needed."""
         self._screen_changed = True
 
-    def draw_large_num(self, num, label, uart_blink, timer_state, invert=False, eco=False):
+    # ---- Screens (see layout.py) ----
+
+    def number_screen(self, source, label, status=None, invert=None, eco=None):
         """
-        Draw speed as fixed DD.D using precomputed slots.
-        Set invert=True to flip colors before showing.
+        One number in the large digits as DD.D (DDD from 100 up) with its
+        label bottom right. status is a StatusRow; invert and eco are
+        optional callables for inverting the display and the eco line.
         """
-        self._set_inversion(invert)
-
-        if self._screen_changed:
-            self.oled.fill(0)
-            label_x = self.width - len(label) * 8
-            label_y = self.height - 8
-            self.oled.text(label, label_x, label_y, 1)
-
-        # Clamp range
-        if num < 0: num = 0.0
-        if num > 99.9: num = 99.9
-
-        int_part = int(num)
-        tenths = int((num * 10) % 10)
-        ones = int_part % 10
-        tens = int_part // 10
-
-        # --- DYNAMIC: Number Area ---
-        number_height = self.w_digits_large.height
-        self.oled.fill_rect(0, 0, self.width, number_height, 0)
-
-        y = self._big_slot_y
-
-        # Tens digit (only if >= 10.0)
-        if tens > 0:
-            self.w_digits_large.set_textpos(self._big_slot_x0, y)
-            self.w_digits_large.printstring(str(tens))
-
-        # Ones digit
-        self.w_digits_large.set_textpos(self._big_slot_x1, y)
-        self.w_digits_large.printstring(str(ones))
-
-        # Decimal point
-        self.w_digits_large.set_textpos(self._big_slot_xdot, y)
-        self.w_digits_large.printstring(".")
-
-        # Tenths digit
-        self.w_digits_large.set_textpos(self._big_slot_x2, y)
-        self.w_digits_large.printstring(str(tenths))
-
-        # --- DYNAMIC: Status Area ---
-        self.draw_status(uart_blink, timer_state)
-
-        # --- DYNAMIC: Eco Line ---
-        eco_line_y = self.height - 12
-        self.oled.hline(0, eco_line_y, self.width, 0)
-        if eco:
-            self.oled.line(0, eco_line_y, self.width, eco_line_y, 1)
-
-        self.oled.show()
-        self._screen_changed = False
-
-    def draw_time(self, seconds, label, uart_blink, timer_state):
+        widgets = [Glyphs(lambda: self.w_digits_large, NUMBER_SLOTS, self.width, source, fmt_number),
+                   Label(label, self.width - len(label) * 8, self.height - 8)]
+        if status is not None:
+            widgets.append(status)
+        if eco is not None:
+            widgets.append(Rule(self.height - 12, self.width, eco))
+        return Screen(widgets, invert)
+
+    def clock_screen(self, source, label, status=None):
+        """Seconds as MM:SS in the medium digits, with its label."""
+        widgets = [Glyphs(lambda: self.w_digits_med, _clock_slots, self.width, source, fmt_clock),
+                   Label(label, self.width - len(label) * 8, self.height - 8)]
+        if status is not None:
+            widgets.append(status)
+        return Screen(widgets)
+
+    def distance_screen(self, source):
+        """Distance in miles as .DDD, capped at .999 (demo)."""
+        return Screen((Glyphs(lambda: self.w_digits_large, MILES_SLOTS, self.width, source, fmt_miles),
+                       Label("MILES", self.width - 40, self.height - 8)))
+
+    def dashboard_screen(self, speed, seconds, delta, status=None, invert=None, eco=None):
         """
-        Draw elapsed time as MM:SS using the medium digit font.
+        Speed, elapsed time and target delta in one frame. Whole mph take
+        the tens and ones slots of number_screen(), which leaves a 40 px
+        column on the right for the delta (see shown_delta()) in the
+        built-in font; MM:SS sits bottom right, where labels go.
         """
-        self._set_inversion(False)
-        if self._screen_changed:
+        x = self.width - 40
+        speed_slots = NUMBER_SLOTS[:2]  # each glyph cell is 40 px wide, up to x = 83
+        widgets = [Glyphs(lambda: self.w_digits_large, speed_slots, x, speed, fmt_whole),
+                   Label("MPH", self.width - 24, 16),
+                   Text(x, 40, 40, delta, fmt_delta),
+                   Text(x, self.height - 8, 40, seconds, fmt_clock)]
+        if status is not None:
+            widgets.append(status)
+        if eco is not None:
+            widgets.append(Rule(self.height - 12, self.width, eco))
+        return Screen(widgets, invert)
+
+    def draw_screen(self, screen):
+        """
+        Draw a layout.Screen. A different screen than last time, or a
+        screen_changed() call, clears and redraws it in full; otherwise only
+        widgets whose value changed are redrawn, only their rows are
+        flushed, and nothing is flushed if none changed.
+        """
+        self._set_inversion(screen.inverted())
+        full = self._screen_changed or screen is not self._screen
+        if full:
             self.oled.fill(0)
-            label_x = self.width - len(label) * 8
-            label_y = self.height - 8
-            self.oled.text(label, label_x, label_y, 1)
-
-        if seconds < 0: seconds = 0
-        total = int(seconds)
-
-        max_total = 99 * 60 + 59
-        if total > max_total: total = max_total
-
-        mins = total // 60
-        secs = total % 60
-
-        m10 = mins // 10
-        m1 = mins % 10
-        s10 = secs // 10
-        s1 = secs % 10
-
-        # --- DYNAMIC: Time Area ---
-        time_height = self.w_digits_med.height
-        self.oled.fill_rect(0, 0, self.width, time_height, 0)
-
-        y = self._time_y
-
-        # Minutes (tens and ones)
-        self.w_digits_med.set_textpos(self._time_x_m10, y)
-        self.w_digits_med.printstring(str(m10))
-        self.w_digits_med.set_textpos(self._time_x_m1, y)
-        self.w_digits_med.printstring(str(m1))
-
-        # Colon
-        self.w_digits_med.set_textpos(self._time_x_colon, y - 7)
-        self.w_digits_med.printstring(":")
-
-        # Seconds (tens and ones)
-        self.w_digits_med.set_textpos(self._time_x_s10, y)
-        self.w_digits_med.printstring(str(s10))
-        self.w_digits_med.set_textpos(self._time_x_s1, y)
-        self.w_digits_med.printstring(str(s1))
-
-        # --- DYNAMIC: Status Area ---
-        self.draw_status(uart_blink, timer_state)
-        self.oled.show()
+            self._forget_drawn()
+            self._screen = screen
+        region = self._region
+        if screen.render(self.oled, full, region) or full:
+            self.oled.show(full=full, region=region)
+            region[:] = self._no_rows
         self._screen_changed = False
 
-    def draw_demo_distance(self, distance):
-        """Draw distance that caps at out .999 for demo purposes only"""
-        # This screen has no other dynamic elements, so a full redraw is simpler.
-        self._set_inversion(False)
-        self.oled.fill(0)
-        distance = max(0, min(int(distance * 1000), 999))
-
-        n1 = distance // 100
-        n2 = (distance // 10) % 10
-        n3 = distance % 10
-
-        y = self._big_slot_y
+    def _forget_drawn(self):
+        """Mark whatever is on screen unknown after a full clear."""
+        self._screen = None
+        self._alert_drawn = None
 
-        self.w_digits_large.set_textpos(0, y)
-        self.w_digits_large.printstring(".")
-        self.w_digits_large.set_textpos(14, y)
-        self.w_digits_large.printstring(str(n1))
-        self.w_digits_large.set_textpos(53, y)
-        self.w_digits_large.printstring(str(n2))
-        self.w_digits_large.set_textpos(91, y)
-        self.w_digits_large.printstring(str(n3))
-
-        label = "MILES"
-        label_x = self.width - len(label) * 8
-        label_y = self.height - 8
-        self.oled.text(label, label_x, label_y, 1)
-
-        self.oled.show()
-        self._screen_changed = False
-
-    def draw_status(self, uart_blink, timer_state):
+    def draw_large_num(self, num, label, uart_blink, timer_state, invert=False, eco=False):
         """
-        Draw UART and timer indicators on the bottom row.
+        Draw one number now: number_screen() for callers that hold values
+        rather than sources. One screen is kept per label.
         """
-        y = self.height - 8
-        self.oled.fill_rect(0, y, 40, 8, 0)
-
-        if uart_blink:
-            self.oled.text("U", 0, y, 1)
+        args = self._args
+        args[0] = num
+        args[1] = uart_blink
+        args[2] = timer_state
+        args[3] = invert
+        args[4] = eco
+        screen = self._number_screens.get(label)
+        if screen is None:
+            screen = self._number_screens[label] = self.number_screen(
+                lambda: args[0], label, self._args_status, invert=lambda: args[3], eco=lambda: args[4])
+        self.draw_screen(screen)
 
-        x_rec = 11
-        if timer_state == "running":
-            self.oled.fill_rect(x_rec - 1, y - 1, 26, 10, 1)
-            self.oled.text("REC", x_rec, y, 0)
-        elif timer_state == "paused":
-            self.oled.text("REC", x_rec, y, 1)
+    def draw_time(self, seconds, label, uart_blink, timer_state):
+        """Draw elapsed seconds now as MM:SS; see draw_large_num()."""
+        args = self._args
+        args[0] = seconds
+        args[1] = uart_blink
+        args[2] = timer_state
+        screen = self._clock_screens.get(label)
+        if screen is None:
+            screen = self._clock_screens[label] = self.clock_screen(lambda: args[0], label, self._args_status)
+        self.draw_screen(screen)
 
     def draw_alert(self, top, bottom):
         """
-        Draw two words in the letter font, centered.
+        Draw two words in the letter font, centered. An alert already on
+        screen costs nothing; one shown recently is copied from a small
+        LRU of rendered frames instead of being drawn letter by letter.
         """
         self._set_inversion(False)
-        self.oled.fill(0)
-        if top:
-            top = top.upper()
-            x_top = max(0, (self.width - self.w_letters_big.stringlen(top)) // 2)
-            self.w_letters_big.set_textpos(x_top, 0)
-            self.w_letters_big.printstring(top)
-        if bottom:
-            bottom = bottom.upper()
-            x_bottom = max(0, (self.width - self.w_letters_big.stringlen(bottom)) // 2)
-            self.w_letters_big.set_textpos(x_bottom, 24)
-            self.w_letters_big.printstring(bottom)
+        key = (top, bottom)
+        if key == self._alert_drawn:
+            return
+        self._forget_drawn()
+        self._alert_drawn = key
+
+        frames = self._alert_frames
+        order = self._alert_order
+        frame = frames.get(key)
+        if frame is not None:
+            order.remove(key)
+            order.append(key)
+            self.oled.buffer[:] = frame
+            self.oled.show()
+            return
+
+        self._render_alert(top, bottom)
+        if len(order) >= ALERT_CACHE_SIZE:
+            frame = frames.pop(order.pop(0))  # reuse the evicted buffer
+            frame[:] = self.oled.buffer
+        else:
+            frame = bytearray(self.oled.buffer)
+        frames[key] = frame
+        order.append(key)
         self.oled.show()
 
+    def _render_alert(self, top, bottom):
+        self.oled.fill(0)
+        w = self.w_letters_big
+        for text, y in ((top, 0), (bottom, 24)):
+            if not text:
+                continue
+            text = text.upper()
+            if w:
+                w.set_textpos(max(0, (self.width - w.stringlen(text)) // 2), y)
+                w.printstring(text)
+            else:
+                self.oled.text(text, max(0, (self.width - len(text) * 8) // 2), y + 8, 1)
+
     def show_alert(self, top, bottom, seconds):
         """
         Schedule an alert for a certain amount of seconds.
@@ -241,6 +360,8 @@ class DisplayManager:
         self._msg_top = None
         self._msg_bottom = None
         self._msg_until = 0
+        # The alert wiped the labels; redraw and resend the whole screen
+        self._screen_changed = True
 
     def update_alert(self):
         """
@@ -0,0 +1,92 @@
+"""
+Energy and efficiency from controller telemetry.
+
+Efficiency (miles per kWh) is what the competition scores, so the DIS
+keeps it live: energy is integrated on every decoded message with the
+trapezoidal rule over the message timestamps, and a ring of per-second
+snapshots gives a rolling-window figure without re-summing anything.
+"""
+from array import array
+import utime as time
+
+# Shown instead of an infinite efficiency (coasting, regen)
+MI_PER_KWH_MAX = 999.0
+
+# A longer gap than this between messages is a dropped link, not driving;
+# integrate at most this much of it
+MAX_GAP_MS = 2000
+
+
+class EnergyMeter:
+    """
+    Running accumulators, updated in O(1) per telemetry sample:
+
+        wh              energy used since reset() [Wh]
+        power_w         latest instantaneous power [W]
+        avg_power_w     average power while counting [W]
+        mi_per_kwh      over the last window_s seconds
+        mi_per_kwh_now  instantaneous, mph / kW
+
+    Like the odometer, energy only accumulates while counting (the race
+    timer is running); the previous sample is still tracked so a pause is
+    never integrated. distance_mi is the trip distance, reset together
+    with the meter.
+    """
+    def __init__(self, window_s=30, slot_ms=1000):
+        self.slot_ms = slot_ms
+        n = window_s * 1000 // slot_ms + 1
+        self._ring_wh = array("f", [0.0] * n)
+        self._ring_mi = array("f", [0.0] * n)
+        self._slots = n
+        self.reset()
+
+    def reset(self):
+        self.wh = 0.0
+        self.power_w = 0.0
+        self.avg_power_w = 0.0
+        self.mi_per_kwh = 0.0
+        self.mi_per_kwh_now = 0.0
+        self.counted_ms = 0
+        self._last_t = None
+        self._last_p = 0.0
+        self._head = 0
+        self._filled = 0
+        self._slot_t = 0
+
+    def update(self, t_ms, voltage, current, mph, distance_mi, counting=True):
+        power = voltage * current
+        self.power_w = power
+        self.mi_per_kwh_now = _efficiency(mph, power / 1000)
+
+        last = self._last_t
+        self._last_t = t_ms
+        p0 = self._last_p
+        self._last_p = power
+        if not counting or last is None:
+            return
+        dt_ms = time.ticks_diff(t_ms, last)
+        if dt_ms <= 0:
+            return
+        if dt_ms > MAX_GAP_MS:
+            dt_ms = MAX_GAP_MS
+        self.wh += (p0 + power) * dt_ms / 7200000  # trapezoid: mean power x dt [h]
+        self.counted_ms += dt_ms
+        self.avg_power_w = self.wh * 3600000 / self.counted_ms
+
+        # Rolling window: one snapshot per slot_ms of counted time
+        if self.counted_ms >= self._slot_t:
+            self._slot_t = self.counted_ms + self.slot_ms
+            self._ring_wh[self._head] = self.wh
+            self._ring_mi[self._head] = distance_mi
+            self._head = (self._head + 1) % self._slots
+            if self._filled < self._slots:
+                self._filled += 1
+        oldest = (self._head - self._filled) % self._slots
+        self.mi_per_kwh = _efficiency(distance_mi - self._ring_mi[oldest], (self.wh - self._ring_wh[oldest]) / 1000)
+
+
+def _efficiency(miles, kwh):
+    if kwh <= 0:
+        return MI_PER_KWH_MAX if miles > 0 else 0.0
+    e = miles / kwh
+    return e if e < MI_PER_KWH_MAX else MI_PER_KWH_MAX
@@ -0,0 +1,184 @@
+# Code generated by build_atlas.py. Do not edit.
+# Source: font_digits_large.py Char set: 0123456789.
+# Glyph rows are MONO_HMSB (bit 0 = leftmost pixel), 5 bytes per row.
+
+def chars():
+    return '0123456789.'
+
+def height():
+    return 48
+
+def stride():
+    return 5
+
+widths =\
+b'\x27\x28\x27\x27\x28\x28\x27\x28\x27\x28\x28'
+
+_atlas =\
+b'\x00\x00\x00\x00\x00\x00\x00\x7f\x00\x00\x00\xe0\xff\x01\x00\x00'\
+b'\xf0\xff\x07\x00\x00\xf8\xff\x0f\x00\x00\xfc\xff\x1f\x00\x00\xfe'\
+b'\xc0\x3f\x00\x00\x7f\x00\x3f\x00\x00\x3f\x00\x7e\x00\x80\x1f\x00'\
+b'\xfc\x00\x80\x0f\x00\xfc\x00\xc0\x0f\x00\xf8\x00\xc0\x07\x00\xf8'\
+b'\x01\xc0\x07\x00\xf8\x01\xe0\x07\x00\xf0\x03\xe0\x07\x00\xf0\x03'\
+b'\xe0\x03\x00\xf0\x03\xe0\x03\x00\xf0\x03\xf0\x03\x00\xe0\x03\xf0'\
+b'\x03\x00\xe0\x07\xf0\x03\x00\xe0\x07\xf0\x03\x00\xe0\x07\xf0\x03'\
+b'\x00\xe0\x07\xf0\x03\x00\xe0\x07\xf0\x03\x00\xe0\x07\xf0\x03\x00'\
+b'\xe0\x07\xf0\x03\x00\xe0\x07\xf0\x03\x00\xe0\x07\xf0\x03\x00\xe0'\
+b'\x07\xf0\x03\x00\xe0\x07\xf0\x03\x00\xe0\x07\xe0\x07\x00\xe0\x03'\
+b'\xe0\x07\x00\xe0\x03\xe0\x07\x00\xf0\x03\xe0\x07\x00\xf0\x03\xc0'\
+b'\x0f\x00\xf0\x01\xc0\x0f\x00\xf0\x01\xc0\x0f\x00\xf8\x01\x80\x1f'\
+b'\x00\xf8\x00\x80\x1f\x00\xfc\x00\x00\x3f\x00\x7e\x00\x00\x7e\x00'\
+b'\x7f\x00\x00\xfe\x81\x3f\x00\x00\xfc\xff\x1f\x00\x00\xf8\xff\x0f'\
+b'\x00\x00\xf0\xff\x07\x00\x00\xc0\xff\x03\x00\x00\x00\x7f\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x78\x00\x00\x00\x00\xfc\x00\x00\x00'\
+b'\x00\xfe\x00\x00\x00\x00\xff\x00\x00\x00\x80\xff\x00\x00\x00\xc0'\
+b'\xf7\x00\x00\x00\xe0\xff\x00\x00\x00\xf8\xfb\x00\x00\x00\xfc\xf9'\
+b'\x00\x00\x00\xfe\xf8\x00\x00\x00\xff\xfc\x00\x00\x80\x7f\xfc\x00'\
+b'\x00\xc0\x1f\xfc\x00\x00\xc0\x0f\xfc\x00\x00\x80\x07\xfc\x00\x00'\
+b'\x00\x03\xfc\x00\x00\x00\x00\xfc\x00\x00\x00\x00\xfc\x00\x00\x00'\
+b'\x00\xfc\x00\x00\x00\x00\xfc\x00\x00\x00\x00\xfc\x00\x00\x00\x00'\
+b'\xfc\x00\x00\x00\x00\xfc\x00\x00\x00\x00\xfc\x00\x00\x00\x00\xfc'\
+b'\x00\x00\x00\x00\xfc\x00\x00\x00\x00\xfc\x00\x00\x00\x00\xfc\x00'\
+b'\x00\x00\x00\xfc\x00\x00\x00\x00\xfc\x00\x00\x00\x00\xfc\x00\x00'\
+b'\x00\x00\xfc\x00\x00\x00\x00\xfc\x00\x00\x00\x00\xfc\x00\x00\x00'\
+b'\x00\xfc\x00\x00\x00\x00\xfc\x00\x00\x00\x00\xfc\x00\x00\x00\x00'\
+b'\xfc\x00\x00\x00\x00\xfc\x00\x00\x00\x00\xfc\x00\x00\x00\x00\xfc'\
+b'\x00\x00\x80\xff\xff\xff\x07\x80\xff\xff\xff\x07\x80\xff\xff\xff'\
+b'\x07\x80\xff\xff\xff\x07\x80\xff\xff\xff\x07\x00\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\x80\x7f\x00\x00\x00\xf0\xff\x01\x00\x00'\
+b'\xfc\xff\x07\x00\x00\xfe\xff\x0f\x00\x00\xff\xff\x1f\x00\x80\x7f'\
+b'\xe0\x3f\x00\x80\x1f\x80\x3f\x00\xc0\x0f\x00\x7f\x00\xe0\x07\x00'\
+b'\x7e\x00\x80\x07\x00\xfe\x00\x00\x02\x00\xfc\x00\x00\x00\x00\xfc'\
+b'\x00\x00\x00\x00\xfc\x00\x00\x00\x00\xfc\x00\x00\x00\x00\xfc\x00'\
+b'\x00\x00\x00\xfe\x00\x00\x00\x00\x7e\x00\x00\x00\x00\x7f\x00\x00'\
+b'\x00\x00\x3f\x00\x00\x00\x80\x3f\x00\x00\x00\xc0\x1f\x00\x00\x00'\
+b'\xe0\x1f\x00\x00\x00\xf0\x0f\x00\x00\x00\xf8\x07\x00\x00\x00\xfc'\
+b'\x03\x00\x00\x00\xfc\x01\x00\x00\x00\xfe\x00\x00\x00\x00\xff\x00'\
+b'\x00\x00\x80\x7f\x00\x00\x00\xc0\x3f\x00\x00\x00\xe0\x1f\x00\x00'\
+b'\x00\xe0\x0f\x00\x00\x00\xf0\x07\x00\x00\x00\xf8\x03\x00\x00\x00'\
+b'\xfc\x03\x00\x00\x00\xfe\x01\x00\x00\x00\xfe\x00\x00\x00\x00\x7f'\
+b'\x00\x00\x00\x80\x3f\x00\x00\x00\xc0\x3f\x00\x00\x00\xc0\x1f\x00'\
+b'\x00\x00\xc0\xff\xff\xff\x03\xc0\xff\xff\xff\x03\xc0\xff\xff\xff'\
+b'\x03\xc0\xff\xff\xff\x03\xc0\xff\xff\xff\x03\x00\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\xff\xff\x7f\x00\x00\xff\xff\x7f\x00\x00'\
+b'\xff\xff\x7f\x00\x80\xff\xff\x7f\x00\x80\xff\x7f\x7e\x00\x00\x00'\
+b'\x00\x7e\x00\x00\x00\x00\x3f\x00\x00\x00\x80\x1f\x00\x00\x00\xc0'\
+b'\x1f\x00\x00\x00\xe0\x0f\x00\x00\x00\xf0\x07\x00\x00\x00\xf8\x03'\
+b'\x00\x00\x00\xfc\x01\x00\x00\x00\xfe\x00\x00\x00\x00\x7f\x00\x00'\
+b'\x00\xc0\x1f\x00\x00\x00\xe0\x0f\x00\x00\x00\xf0\xff\x01\x00\x00'\
+b'\xf0\xff\x0f\x00\x00\xf0\xff\x1f\x00\x00\xf0\xff\x7f\x00\x00\xf0'\
+b'\xff\xff\x00\x00\x00\xe0\xff\x00\x00\x00\x00\xff\x01\x00\x00\x00'\
+b'\xfc\x01\x00\x00\x00\xf8\x03\x00\x00\x00\xf8\x03\x00\x00\x00\xf0'\
+b'\x03\x00\x00\x00\xf0\x03\x00\x00\x00\xf0\x03\x00\x00\x00\xf0\x03'\
+b'\x00\x00\x00\xf0\x03\x00\x00\x00\xf8\x03\x00\x00\x00\xf8\x01\x00'\
+b'\x00\x00\xfc\x01\x00\x00\x00\xfe\x00\x00\x00\x00\xff\x00\x00\x00'\
+b'\x80\x7f\x00\x00\x00\xe0\x3f\x00\x00\x00\xfc\x1f\x00\x00\xe0\xff'\
+b'\x0f\x00\x00\xff\xff\x03\x00\x00\xff\xff\x00\x00\x00\xff\x3f\x00'\
+b'\x00\x00\xff\x07\x00\x00\x00\x7f\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\xf8\x00\x00\x00\x00\xf8\x01\x00\x00'\
+b'\x00\xfc\x00\x00\x00\x00\xfc\x00\x00\x00\x00\x7e\x00\x00\x00\x00'\
+b'\x7e\x00\x00\x00\x00\x7e\x00\x00\x00\x00\x3f\x00\x00\x00\x00\x3f'\
+b'\x00\x00\x00\x80\x1f\x00\x00\x00\x80\x1f\x00\x00\x00\xc0\x0f\x00'\
+b'\x00\x00\xc0\x0f\x00\x00\x00\xe0\x07\x00\x00\x00\xe0\x07\x00\x00'\
+b'\x00\xf0\x03\x00\x00\x00\xf0\x03\x00\x00\x00\xf0\x01\x00\x00\x00'\
+b'\xf8\x01\x00\x00\x00\xf8\x01\x00\x00\x00\xfc\x80\x1f\x00\x00\xfc'\
+b'\x80\x1f\x00\x00\x7e\x80\x1f\x00\x00\x7e\x80\x1f\x00\x00\x3f\x80'\
+b'\x1f\x00\x00\x3f\x80\x1f\x00\x80\x1f\x80\x1f\x00\x80\x1f\x80\x1f'\
+b'\x00\xc0\x0f\x80\x1f\x00\xc0\x0f\x80\x1f\x00\xc0\x07\x80\x1f\x00'\
+b'\xe0\x03\x80\x1f\x00\xe0\xff\xff\xff\x07\xe0\xff\xff\xff\x07\xe0'\
+b'\xff\xff\xff\x07\xe0\xff\xff\xff\x07\xe0\xff\xff\xff\x07\x00\x00'\
+b'\x80\x1f\x00\x00\x00\x80\x1f\x00\x00\x00\x80\x1f\x00\x00\x00\x80'\
+b'\x1f\x00\x00\x00\x80\x1f\x00\x00\x00\x80\x1f\x00\x00\x00\x80\x1f'\
+b'\x00\x00\x00\x80\x1f\x00\x00\x00\x80\x1f\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\xff\xff\x7f\x00\x00\xff\xff\x7f\x00\x00'\
+b'\xff\xff\x7f\x00\x00\xff\xff\x7f\x00\x00\xff\xff\x7f\x00\x00\x3f'\
+b'\x00\x00\x00\x00\x3f\x00\x00\x00\x00\x3f\x00\x00\x00\x00\x3f\x00'\
+b'\x00\x00\x00\x3f\x00\x00\x00\x00\x3f\x00\x00\x00\x00\x3f\x00\x00'\
+b'\x00\x00\x3f\x00\x00\x00\x00\x3f\x00\x00\x00\x00\x3f\x00\x00\x00'\
+b'\x00\x3f\xfe\x00\x00\x00\xff\xff\x07\x00\x00\xff\xff\x0f\x00\x00'\
+b'\xff\xff\x1f\x00\x00\xff\xff\x3f\x00\x00\x7f\xc0\x7f\x00\x00\x1f'\
+b'\x00\xff\x00\x00\x00\x00\xfe\x00\x00\x00\x00\xfc\x00\x00\x00\x00'\
+b'\xfc\x01\x00\x00\x00\xf8\x01\x00\x00\x00\xf8\x01\x00\x00\x00\xf8'\
+b'\x01\x00\x00\x00\xf8\x01\x00\x00\x00\xf8\x01\x00\x00\x00\xf8\x01'\
+b'\x00\x00\x00\xfc\x00\x00\x00\x00\xfc\x00\x00\x00\x00\xfe\x00\x00'\
+b'\x00\x00\x7f\x00\x00\x00\x80\x7f\x00\x00\x00\xc0\x3f\x00\x00\x00'\
+b'\xf0\x1f\x00\x00\x00\xfc\x0f\x00\x00\x00\xff\x07\x00\x00\xf0\xff'\
+b'\x03\x00\x00\xff\xff\x00\x00\x00\xff\x7f\x00\x00\x00\xff\x1f\x00'\
+b'\x00\x00\xff\x03\x00\x00\x00\x3f\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x80\x3f\x00\x00\x00\xf0\x3f\x00\x00'\
+b'\x00\xfc\x3f\x00\x00\x00\xff\x1f\x00\x00\x80\xff\x1f\x00\x00\xc0'\
+b'\xff\x00\x00\x00\xe0\x3f\x00\x00\x00\xf0\x0f\x00\x00\x00\xf8\x03'\
+b'\x00\x00\x00\xfc\x01\x00\x00\x00\xfe\x00\x00\x00\x00\x7e\x00\x00'\
+b'\x00\x00\x7f\x00\x00\x00\x00\x3f\x00\x00\x00\x80\x1f\x00\x00\x00'\
+b'\x80\x1f\x00\x00\x00\xc0\x0f\x00\x00\x00\xc0\x0f\x00\x00\x00\xc0'\
+b'\x0f\xfc\x03\x00\xc0\x87\xff\x0f\x00\xe0\xe7\xff\x3f\x00\xe0\xf7'\
+b'\xff\x7f\x00\xe0\xff\xff\xff\x00\xe0\xfb\x03\xff\x01\xe0\x7f\x00'\
+b'\xfc\x03\xe0\x1f\x00\xf8\x03\xe0\x0f\x00\xf0\x03\xe0\x07\x00\xf0'\
+b'\x07\xe0\x07\x00\xe0\x07\xe0\x07\x00\xe0\x07\xe0\x07\x00\xe0\x07'\
+b'\xe0\x07\x00\xe0\x07\xe0\x07\x00\xe0\x07\xe0\x07\x00\xe0\x07\xc0'\
+b'\x07\x00\xe0\x07\xc0\x0f\x00\xf0\x03\xc0\x0f\x00\xf0\x03\x80\x1f'\
+b'\x00\xf0\x03\x80\x1f\x00\xf8\x01\x00\x3f\x00\xfc\x01\x00\x7f\x00'\
+b'\xfe\x00\x00\xfe\x81\x7f\x00\x00\xfc\xff\x7f\x00\x00\xf8\xff\x1f'\
+b'\x00\x00\xf0\xff\x0f\x00\x00\xe0\xff\x07\x00\x00\x00\xff\x00\x00'\
+b'\x00\x00\x00\x00\x00\xe0\xff\xff\xff\x03\xe0\xff\xff\xff\x03\xe0'\
+b'\xff\xff\xff\x03\xe0\xff\xff\xff\x03\xe0\xff\xff\xff\x03\x00\x00'\
+b'\x00\xf8\x03\x00\x00\x00\xf8\x03\x00\x00\x00\xf8\x01\x00\x00\x00'\
+b'\xfc\x01\x00\x00\x00\xfc\x00\x00\x00\x00\xfe\x00\x00\x00\x00\x7f'\
+b'\x00\x00\x00\x00\x3f\x00\x00\x00\x80\x3f\x00\x00\x00\xc0\x1f\x00'\
+b'\x00\x00\xc0\x1f\x00\x00\x00\xe0\x0f\x00\x00\x00\xe0\x07\x00\x00'\
+b'\x00\xf0\x07\x00\x00\x00\xf8\x03\x00\x00\x00\xf8\x03\x00\x00\x00'\
+b'\xfc\x01\x00\x00\x00\xfc\x01\x00\x00\x00\xfe\x00\x00\x00\x00\x7e'\
+b'\x00\x00\x00\x00\x7f\x00\x00\x00\x00\x3f\x00\x00\x00\x00\x3f\x00'\
+b'\x00\x00\x80\x3f\x00\x00\x00\x80\x1f\x00\x00\x00\xc0\x1f\x00\x00'\
+b'\x00\xc0\x0f\x00\x00\x00\xc0\x0f\x00\x00\x00\xc0\x0f\x00\x00\x00'\
+b'\xe0\x0f\x00\x00\x00\xe0\x0f\x00\x00\x00\xe0\x07\x00\x00\x00\xe0'\
+b'\x07\x00\x00\x00\xe0\x07\x00\x00\x00\xe0\x07\x00\x00\x00\xe0\x07'\
+b'\x00\x00\x00\xe0\x07\x00\x00\x00\xe0\x07\x00\x00\x00\xe0\x07\x00'\
+b'\x00\x00\xe0\x07\x00\x00\x00\xe0\x07\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x7f\x00\x00\x00\xe0\xff\x03\x00\x00'\
+b'\xf8\xff\x0f\x00\x00\xfc\xff\x1f\x00\x00\xfe\xff\x3f\x00\x00\xfe'\
+b'\xc1\x7f\x00\x00\x7f\x00\x7f\x00\x00\x3f\x00\xfe\x00\x80\x3f\x00'\
+b'\xfc\x00\x80\x1f\x00\xfc\x00\x80\x1f\x00\xfc\x00\x80\x1f\x00\xfc'\
+b'\x00\x80\x1f\x00\xfc\x00\x80\x3f\x00\xfc\x00\x00\x3f\x00\x7e\x00'\
+b'\x00\xff\x00\x7f\x00\x00\xfe\x81\x3f\x00\x00\xfc\xe7\x3f\x00\x00'\
+b'\xf8\xff\x1f\x00\x00\xf0\xff\x07\x00\x00\xc0\xff\x03\x00\x00\xf0'\
+b'\xff\x07\x00\x00\xf8\xff\x1f\x00\x00\xfe\xff\x3f\x00\x00\xff\xc1'\
+b'\x7f\x00\x00\x7f\x80\xff\x00\x80\x3f\x00\xfe\x01\xc0\x1f\x00\xfc'\
+b'\x03\xc0\x0f\x00\xf8\x03\xc0\x0f\x00\xf0\x03\xe0\x07\x00\xf0\x07'\
+b'\xe0\x07\x00\xe0\x07\xe0\x07\x00\xe0\x07\xe0\x07\x00\xe0\x07\xe0'\
+b'\x07\x00\xe0\x07\xe0\x07\x00\xe0\x07\xe0\x07\x00\xe0\x07\xc0\x0f'\
+b'\x00\xf0\x07\xc0\x1f\x00\xf0\x03\xc0\x1f\x00\xf8\x03\x80\x7f\x00'\
+b'\xfe\x01\x00\xff\x81\xff\x01\x00\xff\xff\xff\x00\x00\xfe\xff\x7f'\
+b'\x00\x00\xf8\xff\x1f\x00\x00\xf0\xff\x07\x00\x00\x80\xff\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\x80\xff\x00\x00\x00\xe0\xff\x03\x00\x00'\
+b'\xf8\xff\x0f\x00\x00\xfc\xff\x1f\x00\x00\xfe\xff\x3f\x00\x00\xff'\
+b'\x81\x7f\x00\x80\x7f\x00\xfe\x00\xc0\x1f\x00\xfc\x00\xc0\x1f\x00'\
+b'\xf8\x01\xc0\x0f\x00\xf8\x01\xe0\x0f\x00\xf0\x01\xe0\x07\x00\xf0'\
+b'\x03\xe0\x07\x00\xf0\x03\xe0\x07\x00\xe0\x03\xe0\x07\x00\xe0\x07'\
+b'\xe0\x07\x00\xe0\x07\xe0\x07\x00\xe0\x07\xe0\x0f\x00\xe0\x07\xc0'\
+b'\x0f\x00\xf0\x07\xc0\x0f\x00\xf8\x07\xc0\x1f\x00\xfc\x07\x80\x3f'\
+b'\x00\xfe\x07\x80\xff\x80\xff\x07\x00\xff\xff\xef\x07\x00\xfe\xff'\
+b'\xef\x07\x00\xf8\xff\xe7\x03\x00\xf0\xff\xf1\x03\x00\x80\x7f\xf0'\
+b'\x03\x00\x00\x00\xf0\x03\x00\x00\x00\xf8\x01\x00\x00\x00\xf8\x01'\
+b'\x00\x00\x00\xf8\x01\x00\x00\x00\xfc\x00\x00\x00\x00\xfe\x00\x00'\
+b'\x00\x00\x7e\x00\x00\x00\x00\x7f\x00\x00\x00\x80\x3f\x00\x00\x00'\
+b'\xc0\x1f\x00\x00\x00\xe0\x1f\x00\x00\x00\xf8\x0f\x00\x00\x00\xfe'\
+b'\x07\x00\x00\xc0\xff\x03\x00\x00\xf8\xff\x01\x00\x00\xf8\x7f\x00'\
+b'\x00\x00\xf8\x1f\x00\x00\x00\xf0\x07\x00\x00\x00\xf0\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x07\x00\x00\x00\xc0\x0f'\
+b'\x00\x00\x00\xe0\x1f\x00\x00\x00\xf0\x3f\x00\x00\x00\xf0\x3f\x00'\
+b'\x00\x00\xf0\x3f\x00\x00\x00\xf0\x3f\x00\x00\x00\xf0\x3f\x00\x00'\
+b'\x00\xe0\x1f\x00\x00\x00\xc0\x0f\x00\x00\x00\x80\x07\x00\x00\x00'
+
+atlas = memoryview(_atlas)
@@ -0,0 +1,157 @@
+# Code generated by build_atlas.py. Do not edit.
+# Source: font_digits_med.py Char set: 0123456789:
+# Glyph rows are MONO_HMSB (bit 0 = leftmost pixel), 5 bytes per row.
+
+def chars():
+    return '0123456789:'
+
+def height():
+    return 40
+
+def stride():
+    return 5
+
+widths =\
+b'\x22\x22\x22\x22\x22\x22\x22\x22\x22\x21\x22'
+
+_atlas =\
+b'\x00\x00\x00\x00\x00\x00\xc0\x0f\x00\x00\x00\xf8\x3f\x00\x00\x00'\
+b'\xfc\xff\x00\x00\x00\xfe\xff\x01\x00\x00\x3f\xf8\x01\x00\x80\x1f'\
+b'\xe0\x03\x00\x80\x0f\xc0\x07\x00\xc0\x07\xc0\x07\x00\xc0\x07\x80'\
+b'\x0f\x00\xc0\x03\x80\x0f\x00\xe0\x03\x00\x1f\x00\xe0\x03\x00\x1f'\
+b'\x00\xe0\x01\x00\x1f\x00\xf0\x01\x00\x1f\x00\xf0\x01\x00\x3e\x00'\
+b'\xf0\x01\x00\x3e\x00\xf0\x01\x00\x3e\x00\xf0\x01\x00\x3e\x00\xf0'\
+b'\x01\x00\x3e\x00\xf0\x01\x00\x3e\x00\xf0\x01\x00\x3e\x00\xf0\x01'\
+b'\x00\x3e\x00\xf0\x01\x00\x3e\x00\xf0\x01\x00\x3e\x00\xf0\x01\x00'\
+b'\x3e\x00\xe0\x03\x00\x1e\x00\xe0\x03\x00\x1e\x00\xe0\x03\x00\x1f'\
+b'\x00\xe0\x03\x00\x1f\x00\xc0\x07\x00\x0f\x00\xc0\x07\x80\x0f\x00'\
+b'\x80\x0f\x80\x0f\x00\x80\x0f\xc0\x07\x00\x00\x1f\xe0\x07\x00\x00'\
+b'\x7f\xf0\x03\x00\x00\xfe\xff\x01\x00\x00\xfc\xff\x00\x00\x00\xf0'\
+b'\x7f\x00\x00\x00\xc0\x0f\x00\x00\x00\x00\x0f\x00\x00\x00\x80\x0f'\
+b'\x00\x00\x00\xc0\x0f\x00\x00\x00\xe0\x0f\x00\x00\x00\xf0\x0f\x00'\
+b'\x00\x00\xf8\x0f\x00\x00\x00\x7e\x0f\x00\x00\x00\x3f\x0f\x00\x00'\
+b'\x80\x9f\x0f\x00\x00\xc0\x9f\x0f\x00\x00\xe0\x8f\x0f\x00\x00\xe0'\
+b'\x83\x0f\x00\x00\xc0\x81\x0f\x00\x00\x80\x80\x0f\x00\x00\x00\x80'\
+b'\x0f\x00\x00\x00\x80\x0f\x00\x00\x00\x80\x0f\x00\x00\x00\x80\x0f'\
+b'\x00\x00\x00\x80\x0f\x00\x00\x00\x80\x0f\x00\x00\x00\x80\x0f\x00'\
+b'\x00\x00\x80\x0f\x00\x00\x00\x80\x0f\x00\x00\x00\x80\x0f\x00\x00'\
+b'\x00\x80\x0f\x00\x00\x00\x80\x0f\x00\x00\x00\x80\x0f\x00\x00\x00'\
+b'\x80\x0f\x00\x00\x00\x80\x0f\x00\x00\x00\x80\x0f\x00\x00\x00\x80'\
+b'\x0f\x00\x00\x00\x80\x0f\x00\x00\x00\x80\x0f\x00\x00\x00\x80\x0f'\
+b'\x00\x00\x00\x80\x0f\x00\x00\x00\x80\x0f\x00\x00\xc0\xff\xff\x1f'\
+b'\x00\xc0\xff\xff\x1f\x00\xc0\xff\xff\x1f\x00\xc0\xff\xff\x1f\x00'\
+b'\x00\x00\x00\x00\x00\x00\xe0\x1f\x00\x00\x00\xf8\x7f\x00\x00\x00'\
+b'\xfe\xff\x00\x00\x00\xff\xff\x01\x00\x80\x3f\xf8\x03\x00\xc0\x0f'\
+b'\xe0\x07\x00\xc0\x07\xc0\x07\x00\xe0\x03\xc0\x0f\x00\x00\x01\x80'\
+b'\x0f\x00\x00\x00\x80\x0f\x00\x00\x00\x80\x0f\x00\x00\x00\x80\x0f'\
+b'\x00\x00\x00\x80\x0f\x00\x00\x00\xc0\x0f\x00\x00\x00\xc0\x07\x00'\
+b'\x00\x00\xe0\x07\x00\x00\x00\xf0\x03\x00\x00\x00\xf8\x03\x00\x00'\
+b'\x00\xfc\x01\x00\x00\x00\xfe\x00\x00\x00\x00\x7f\x00\x00\x00\x00'\
+b'\x3f\x00\x00\x00\x80\x1f\x00\x00\x00\xc0\x1f\x00\x00\x00\xe0\x0f'\
+b'\x00\x00\x00\xf0\x07\x00\x00\x00\xf8\x03\x00\x00\x00\xfc\x01\x00'\
+b'\x00\x00\xfe\x00\x00\x00\x00\x7e\x00\x00\x00\x00\x3f\x00\x00\x00'\
+b'\x80\x3f\x00\x00\x00\xc0\x1f\x00\x00\x00\xc0\x0f\x00\x00\x00\xe0'\
+b'\x07\x00\x00\x00\xe0\xff\xff\x1f\x00\xe0\xff\xff\x1f\x00\xe0\xff'\
+b'\xff\x1f\x00\xe0\xff\xff\x1f\x00\x00\x00\x00\x00\x00\xc0\xff\xff'\
+b'\x03\x00\xc0\xff\xff\x03\x00\xc0\xff\xff\x03\x00\xc0\xff\xcf\x03'\
+b'\x00\x00\x00\xe0\x03\x00\x00\x00\xf0\x03\x00\x00\x00\xf8\x01\x00'\
+b'\x00\x00\xfc\x00\x00\x00\x00\x7e\x00\x00\x00\x00\x3f\x00\x00\x00'\
+b'\x80\x1f\x00\x00\x00\xe0\x0f\x00\x00\x00\xf0\x07\x00\x00\x00\xf8'\
+b'\x01\x00\x00\x00\xfc\x1f\x00\x00\x00\xfc\xff\x00\x00\x00\xfc\xff'\
+b'\x03\x00\x00\xfc\xff\x07\x00\x00\x00\xfc\x07\x00\x00\x00\xe0\x0f'\
+b'\x00\x00\x00\xc0\x0f\x00\x00\x00\x80\x1f\x00\x00\x00\x00\x1f\x00'\
+b'\x00\x00\x00\x1f\x00\x00\x00\x00\x1f\x00\x00\x00\x00\x1f\x00\x00'\
+b'\x00\x00\x1f\x00\x00\x00\x80\x1f\x00\x00\x00\x80\x0f\x00\x00\x00'\
+b'\xc0\x0f\x00\x00\x00\xe0\x07\x00\x00\x00\xf0\x07\x00\x00\x00\xfc'\
+b'\x03\x00\x00\x00\xff\x01\x00\x00\xf0\x7f\x00\x00\x80\xff\x3f\x00'\
+b'\x00\x80\xff\x0f\x00\x00\x80\xff\x01\x00\x00\x80\x1f\x00\x00\x00'\
+b'\x00\x00\x3e\x00\x00\x00\x00\x1f\x00\x00\x00\x00\x1f\x00\x00\x00'\
+b'\x80\x1f\x00\x00\x00\x80\x0f\x00\x00\x00\xc0\x0f\x00\x00\x00\xc0'\
+b'\x07\x00\x00\x00\xe0\x07\x00\x00\x00\xe0\x03\x00\x00\x00\xf0\x03'\
+b'\x00\x00\x00\xf0\x01\x00\x00\x00\xf8\x01\x00\x00\x00\xf8\x01\x00'\
+b'\x00\x00\xf8\x00\x00\x00\x00\xfc\x00\x00\x00\x00\x7c\x00\x00\x00'\
+b'\x00\x7e\x00\x00\x00\x00\x3e\x70\x00\x00\x00\x3f\xf0\x01\x00\x00'\
+b'\x1f\xf0\x01\x00\x80\x1f\xf0\x01\x00\x80\x1f\xf0\x01\x00\xc0\x0f'\
+b'\xf0\x01\x00\xc0\x0f\xf0\x01\x00\xe0\x07\xf0\x01\x00\xe0\x03\xf0'\
+b'\x01\x00\xf0\x03\xf0\x01\x00\xf0\x01\xf0\x01\x00\xf0\xff\xff\x3f'\
+b'\x00\xf0\xff\xff\x3f\x00\xf0\xff\xff\x3f\x00\xf0\xff\xff\x3f\x00'\
+b'\x00\x00\xf0\x01\x00\x00\x00\xf0\x01\x00\x00\x00\xf0\x01\x00\x00'\
+b'\x00\xf0\x01\x00\x00\x00\xf0\x01\x00\x00\x00\xf0\x01\x00\x00\x00'\
+b'\xf0\x01\x00\x00\x00\xf0\x01\x00\x00\x00\x00\x00\x00\xc0\xff\xff'\
+b'\x01\x00\xc0\xff\xff\x01\x00\xc0\xff\xff\x01\x00\xc0\xff\xff\x01'\
+b'\x00\xc0\x07\x00\x00\x00\xc0\x07\x00\x00\x00\xc0\x07\x00\x00\x00'\
+b'\xc0\x07\x00\x00\x00\xc0\x07\x00\x00\x00\xc0\x07\x00\x00\x00\xc0'\
+b'\x07\x00\x00\x00\xc0\x07\x00\x00\x00\xc0\xe7\x0f\x00\x00\xc0\xff'\
+b'\x7f\x00\x00\xc0\xff\xff\x00\x00\xc0\xff\xff\x01\x00\xc0\x0f\xf8'\
+b'\x03\x00\xc0\x03\xf0\x07\x00\x00\x00\xe0\x07\x00\x00\x00\xc0\x0f'\
+b'\x00\x00\x00\x80\x0f\x00\x00\x00\x80\x0f\x00\x00\x00\x80\x0f\x00'\
+b'\x00\x00\x80\x0f\x00\x00\x00\x80\x0f\x00\x00\x00\x80\x0f\x00\x00'\
+b'\x00\xc0\x0f\x00\x00\x00\xc0\x07\x00\x00\x00\xe0\x07\x00\x00\x00'\
+b'\xf0\x03\x00\x00\x00\xf8\x03\x00\x00\x00\xfc\x01\x00\x00\x00\xff'\
+b'\x00\x00\x00\xe0\x7f\x00\x00\x00\xfc\x1f\x00\x00\xc0\xff\x0f\x00'\
+b'\x00\xc0\xff\x03\x00\x00\xc0\x7f\x00\x00\x00\xc0\x07\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\xf0\x03\x00\x00\x00\xfe\x03\x00\x00'\
+b'\x80\xff\x01\x00\x00\xe0\xff\x01\x00\x00\xf0\x1f\x00\x00\x00\xf8'\
+b'\x03\x00\x00\x00\xfc\x00\x00\x00\x00\x7e\x00\x00\x00\x00\x3f\x00'\
+b'\x00\x00\x00\x1f\x00\x00\x00\x80\x0f\x00\x00\x00\xc0\x0f\x00\x00'\
+b'\x00\xc0\x07\x00\x00\x00\xc0\x07\x00\x00\x00\xe0\x03\x00\x00\x00'\
+b'\xe0\x83\x3f\x00\x00\xe0\xf1\xff\x01\x00\xf0\xf9\xff\x03\x00\xf0'\
+b'\xfd\xff\x07\x00\xf0\x7f\xe0\x0f\x00\xf0\x0f\x80\x1f\x00\xf0\x07'\
+b'\x00\x1f\x00\xf0\x03\x00\x3f\x00\xf0\x01\x00\x3e\x00\xf0\x01\x00'\
+b'\x3e\x00\xf0\x01\x00\x3e\x00\xf0\x01\x00\x3e\x00\xe0\x01\x00\x3e'\
+b'\x00\xe0\x03\x00\x3e\x00\xe0\x03\x00\x1f\x00\xe0\x03\x00\x1f\x00'\
+b'\xc0\x07\x00\x1f\x00\xc0\x0f\x80\x0f\x00\x80\x1f\xc0\x0f\x00\x00'\
+b'\x3f\xf0\x07\x00\x00\xff\xff\x03\x00\x00\xfc\xff\x01\x00\x00\xf8'\
+b'\x7f\x00\x00\x00\xe0\x1f\x00\x00\x00\x00\x00\x00\x00\xe0\xff\xff'\
+b'\x1f\x00\xe0\xff\xff\x1f\x00\xe0\xff\xff\x1f\x00\xe0\xff\xff\x1f'\
+b'\x00\x00\x00\x80\x1f\x00\x00\x00\x80\x1f\x00\x00\x00\x80\x0f\x00'\
+b'\x00\x00\xc0\x0f\x00\x00\x00\xe0\x07\x00\x00\x00\xe0\x07\x00\x00'\
+b'\x00\xf0\x03\x00\x00\x00\xf0\x01\x00\x00\x00\xf8\x01\x00\x00\x00'\
+b'\xfc\x00\x00\x00\x00\xfc\x00\x00\x00\x00\x7e\x00\x00\x00\x00\x3e'\
+b'\x00\x00\x00\x00\x3f\x00\x00\x00\x80\x1f\x00\x00\x00\x80\x1f\x00'\
+b'\x00\x00\xc0\x0f\x00\x00\x00\xc0\x0f\x00\x00\x00\xc0\x07\x00\x00'\
+b'\x00\xe0\x07\x00\x00\x00\xe0\x03\x00\x00\x00\xf0\x03\x00\x00\x00'\
+b'\xf0\x01\x00\x00\x00\xf0\x01\x00\x00\x00\xf0\x01\x00\x00\x00\xf8'\
+b'\x01\x00\x00\x00\xf8\x01\x00\x00\x00\xf8\x00\x00\x00\x00\xf8\x00'\
+b'\x00\x00\x00\xf8\x00\x00\x00\x00\xf8\x00\x00\x00\x00\xf8\x00\x00'\
+b'\x00\x00\xf8\x00\x00\x00\x00\xf8\x00\x00\x00\x00\xf8\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\xe0\x0f\x00\x00\x00\xf8\x7f\x00\x00\x00'\
+b'\xfe\xff\x00\x00\x00\xff\xff\x01\x00\x80\x3f\xf8\x03\x00\x80\x1f'\
+b'\xe0\x07\x00\xc0\x0f\xc0\x07\x00\xc0\x07\xc0\x07\x00\xc0\x07\x80'\
+b'\x0f\x00\xc0\x07\xc0\x0f\x00\xc0\x07\xc0\x07\x00\xc0\x0f\xc0\x07'\
+b'\x00\x80\x1f\xe0\x07\x00\x80\x3f\xf0\x03\x00\x00\xff\xf8\x01\x00'\
+b'\x00\xfc\xff\x00\x00\x00\xf8\x7f\x00\x00\x00\xf8\x7f\x00\x00\x00'\
+b'\xfe\xff\x01\x00\x00\x7f\xfe\x03\x00\x80\x1f\xf8\x07\x00\xc0\x0f'\
+b'\xe0\x0f\x00\xe0\x07\xc0\x1f\x00\xe0\x03\x80\x1f\x00\xf0\x03\x00'\
+b'\x1f\x00\xf0\x01\x00\x3f\x00\xf0\x01\x00\x3e\x00\xf0\x01\x00\x3e'\
+b'\x00\xf0\x01\x00\x3e\x00\xf0\x01\x00\x3e\x00\xf0\x01\x00\x3e\x00'\
+b'\xe0\x03\x00\x1f\x00\xe0\x07\x80\x1f\x00\xc0\x0f\xc0\x1f\x00\xc0'\
+b'\x3f\xf0\x0f\x00\x80\xff\xff\x07\x00\x00\xff\xff\x03\x00\x00\xfc'\
+b'\xff\x00\x00\x00\xe0\x1f\x00\x00\x00\x00\x00\x00\x00\x00\xf0\x0f'\
+b'\x00\x00\x00\xfc\x3f\x00\x00\x00\xff\xff\x00\x00\x80\xff\xff\x01'\
+b'\x00\xc0\x3f\xf8\x03\x00\xc0\x0f\xe0\x03\x00\xe0\x07\xe0\x07\x00'\
+b'\xe0\x03\xc0\x07\x00\xf0\x03\x80\x0f\x00\xf0\x01\x80\x0f\x00\xf0'\
+b'\x01\x80\x0f\x00\xf0\x01\x00\x0f\x00\xf0\x01\x00\x1f\x00\xf0\x01'\
+b'\x00\x1f\x00\xf0\x01\x00\x1f\x00\xf0\x03\x80\x1f\x00\xe0\x03\x80'\
+b'\x1f\x00\xe0\x07\xc0\x1f\x00\xc0\x0f\xe0\x1f\x00\xc0\x1f\x78\x1f'\
+b'\x00\x80\xff\x7f\x1f\x00\x00\xff\x3f\x1f\x00\x00\xfc\x9f\x0f\x00'\
+b'\x00\xf0\x87\x0f\x00\x00\x00\x80\x0f\x00\x00\x00\xc0\x07\x00\x00'\
+b'\x00\xc0\x07\x00\x00\x00\xe0\x07\x00\x00\x00\xe0\x03\x00\x00\x00'\
+b'\xf0\x01\x00\x00\x00\xf8\x01\x00\x00\x00\xfc\x00\x00\x00\x00\x7f'\
+b'\x00\x00\x00\x80\x3f\x00\x00\x00\xf0\x1f\x00\x00\x00\xfe\x0f\x00'\
+b'\x00\x00\xfe\x03\x00\x00\x00\xfe\x00\x00\x00\x00\x1c\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0'\
+b'\x03\x00\x00\x00\xe0\x07\x00\x00\x00\xf0\x0f\x00\x00\x00\xf0\x0f'\
+b'\x00\x00\x00\xf0\x0f\x00\x00\x00\xf0\x0f\x00\x00\x00\xe0\x07\x00'\
+b'\x00\x00\xc0\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\xc0\x03\x00\x00\x00\xe0\x07\x00\x00\x00\xf0'\
+b'\x0f\x00\x00\x00\xf0\x0f\x00\x00\x00\xf0\x0f\x00\x00\x00\xe0\x07'\
+b'\x00\x00\x00\xc0\x03\x00\x00\x00'
+
+atlas = memoryview(_atlas)
@@ -0,0 +1,129 @@
+import _thread
+from array import array
+import utime as time
+
+# Slots in a published sample
+VOLTAGE, CURRENT, RPM, DUTY, THROTTLE, ECO, BLINK = range(7)
+SAMPLE_FIELDS = 7
+
+
+class SeqlockSnapshot:
+    """
+    Latest decoded telemetry, written by one core and read by the other
+    without a lock.
+
+    The writer bumps the sequence number to odd, stores the fields and bumps
+    it back to even. A reader copies the fields between two reads of the
+    sequence and retries if it changed or was odd, so it never sees half of
+    one sample and half of the next. rp2 runs the two cores without a GIL,
+    which is exactly the case this guards.
+    """
+    def __init__(self):
+        self._seq = array("I", [0])
+        self._data = array("f", [0.0] * SAMPLE_FIELDS)
+        self._edges = array("I", [0])  # 32-bit counter does not fit a float
+        self.retries = 0
+
+    def publish(self, mgr):
+        seq = self._seq
+        data = self._data
+        seq[0] += 1  # odd: write in progress
+        data[VOLTAGE] = mgr.voltage
+        data[CURRENT] = mgr.current
+        data[RPM] = mgr.rpm
+        data[DUTY] = mgr.duty
+        data[THROTTLE] = mgr.throttle
+        data[ECO] = 1 if mgr.eco else 0
+        data[BLINK] = 1 if mgr.uart_blink else 0
+        self._edges[0] = mgr.edges
+        seq[0] += 1  # even: sample complete
+
+    def read(self, out, edges_out):
+        """
+        Copy the latest sample into out (array('f', SAMPLE_FIELDS)) and its
+        edge count into edges_out (array('I', 1)); return the sequence number.
+        """
+        seq = self._seq
+        data = self._data
+        while True:
+            s1 = seq[0]
+            if s1 & 1:
+                self.retries += 1
+                continue
+            for i in range(SAMPLE_FIELDS):
+                out[i] = data[i]
+            edges_out[0] = self._edges[0]
+            if seq[0] == s1:
+                return s1
+            self.retries += 1
+
+
+class Sample:
+    """The live values main.py reads from a UartManager, filled from a snapshot."""
+    def __init__(self):
+        self.voltage = 0.0
+        self.current = 0.0
+        self.rpm = 0
+        self.duty = 0
+        self.throttle = 0.0
+        self.eco = False
+        self.uart_blink = False
+        self.new_data = False
+        self.edges = 0
+        self.has_edges = False
+
+
+class CoreIngest:
+    """
+    Runs UartManager.update() on the second core and publishes every decoded
+    message through a SeqlockSnapshot, so a slow flush on core 0 can no
+    longer delay draining the UART FIFO. The render loop calls apply() once
+    per frame to pull the latest sample into `sample`.
+    """
+    def __init__(self, uart_manager, idle_ms=1):
+        self.uart_manager = uart_manager
+        self.snapshot = SeqlockSnapshot()
+        self.sample = Sample()
+        self.idle_ms = idle_ms
+        self.running = False
+        self._buf = array("f", [0.0] * SAMPLE_FIELDS)
+        self._edges = array("I", [0])
+        self._seen = 0
+
+    def start(self):
+        self.running = True
+        _thread.start_new_thread(self._run, ())
+
+    def stop(self):
+        self.running = False
+
+    def _run(self):
+        mgr = self.uart_manager
+        publish = self.snapshot.publish
+        while self.running:
+            mgr.update()
+            if mgr.new_data:
+                publish(mgr)
+            else:
+                time.sleep_ms(self.idle_ms)
+
+    def apply(self):
+        """Refresh sample from the snapshot; sets sample.new_data if a message arrived since last call."""
+        seq = self.snapshot.read(self._buf, self._edges)
+        s = self.sample
+        if seq == self._seen:
+            s.new_data = False
+            return s
+        self._seen = seq
+        buf = self._buf
+        s.voltage = buf[VOLTAGE]
+        s.current = buf[CURRENT]
+        s.rpm = int(buf[RPM])
+        s.duty = int(buf[DUTY])
+        s.throttle = buf[THROTTLE]
+        s.eco = buf[ECO] != 0
+        s.uart_blink = buf[BLINK] != 0
+        s.edges = self._edges[0]
+        s.has_edges = self.uart_manager.has_edges
+        s.new_data = True
+        return s
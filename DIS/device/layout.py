@@ -0,0 +1,170 @@
+"""
+Declarative screens for the DIS.
+
+A Screen is a list of widgets. Each widget owns a box on the display, reads
+its value from a source callable and formats it; render() redraws only the
+widgets whose formatted value differs from what is on screen and flags the
+framebuffer rows their boxes cover, so show(region=...) flushes just those.
+DisplayManager.draw_screen() handles clearing, inversion and the flush.
+"""
+import micropython
+
+
+@micropython.viper
+def _mark_rows(region, y0: int, y1: int):
+    """Flag rows y0..y1-1 of region, clipped to its length."""
+    flags = ptr8(region)
+    n = int(len(region))
+    if y0 < 0:
+        y0 = 0
+    if y1 > n:
+        y1 = n
+    while y0 < y1:
+        flags[y0] = 1
+        y0 += 1
+
+
+class Widget:
+    """
+    A box (x, y, w, h) showing fmt(source()). Subclasses override draw(),
+    which paints a new value over self.drawn (None after a clear) and must
+    stay inside the box; the base class draws nothing.
+    """
+    def __init__(self, x, y, w, h, source=None, fmt=None):
+        self.x = x
+        self.y = y
+        self.w = w
+        self.h = h
+        self.source = source
+        self.fmt = fmt
+        self.drawn = None  # formatted value on screen; None = unknown
+
+    def read(self):
+        v = self.source()
+        return v if self.fmt is None else self.fmt(v)
+
+    def draw(self, oled, value):
+        pass
+
+
+class Text(Widget):
+    """A line in the built-in 8x8 font, left or right aligned in its box."""
+    def __init__(self, x, y, w, source, fmt=None, right=False):
+        super().__init__(x, y, w, 8, source, fmt)
+        self.right = right
+
+    def draw(self, oled, value):
+        oled.fill_rect(self.x, self.y, self.w, self.h, 0)
+        x = self.x + self.w - len(value) * 8 if self.right else self.x
+        oled.text(value, x, self.y, 1)
+
+
+class Label(Text):
+    """Fixed text; drawn once after each full redraw."""
+    def __init__(self, text, x, y, right=False):
+        super().__init__(x, y, len(text) * 8, None, right=right)
+        self.text = text
+
+    def read(self):
+        return self.text
+
+
+class Rule(Widget):
+    """A full-width horizontal line, drawn while the value is true."""
+    def __init__(self, y, width, source):
+        super().__init__(0, y, width, 1, source, bool)
+
+    def draw(self, oled, value):
+        oled.hline(self.x, self.y, self.w, 1 if value else 0)
+
+
+class Glyphs(Widget):
+    """
+    One character per fixed slot, drawn with a Writer or SpriteAtlas.
+    font is a callable returning the renderer, so it is only loaded when
+    the widget is first drawn. slots is a tuple of (x, y) positions, or a
+    callable taking the renderer and returning them when they depend on
+    glyph widths. A space leaves its slot blank.
+
+    Slots may overlap their right neighbour, and glyphs are drawn opaquely
+    in slot order, so once one slot changes every slot to its right is
+    redrawn too. The box runs from the first slot to x_end, usually
+    the screen width.
+    """
+    def __init__(self, font, slots, x_end, source, fmt=None):
+        super().__init__(0, 0, 0, 0, source, fmt)
+        self.font = font
+        self.slots = slots
+        self.x_end = x_end
+        self.writer = None
+
+    def _load(self):
+        w = self.writer = self.font()
+        slots = self.slots
+        if not isinstance(slots, tuple):
+            slots = self.slots = slots(w)
+        top = [y for _, y in slots]
+        for i in range(len(top) - 2, -1, -1):
+            if top[i + 1] < top[i]:
+                top[i] = top[i + 1]
+        self._tops = tuple(top)  # highest glyph top from each slot rightwards
+        self.x = slots[0][0]
+        self.y = top[0]
+        self.w = self.x_end - self.x
+        self.h = max(y for _, y in slots) + w.height - self.y
+
+    def draw(self, oled, value):
+        w = self.writer
+        if w is None:
+            self._load()
+            w = self.writer
+        slots = self.slots
+        drawn = self.drawn
+        n = len(slots)
+        start = 0
+        if drawn is not None:
+            while start < n and value[start] == drawn[start]:
+                start += 1
+            if start == n:
+                return
+        x = slots[start][0]
+        y = self._tops[start]
+        oled.fill_rect(x, y, self.x_end - x, self.y + self.h - y, 0)
+        for i in range(start, n):
+            c = value[i]
+            if c != " ":
+                x, y = slots[i]
+                w.set_textpos(x, y)
+                w.printstring(c)
+
+
+class Screen:
+    """
+    Widgets drawn together, in order; later widgets paint over earlier ones
+    where boxes overlap. invert is an optional callable; the display is
+    inverted while it returns True.
+    """
+    def __init__(self, widgets, invert=None):
+        self.widgets = tuple(widgets)
+        self.invert = invert
+
+    def inverted(self):
+        return bool(self.invert()) if self.invert is not None else False
+
+    def render(self, oled, full, region):
+        """
+        Redraw the widgets whose formatted value changed (all of them if
+        full, after the caller cleared the framebuffer) and flag the rows
+        they cover in region. Returns True if anything was drawn.
+        """
+        changed = False
+        for w in self.widgets:
+            if full:
+                w.drawn = None
+            value = w.read()
+            if value != w.drawn:
+                w.draw(oled, value)
+                w.drawn = value
+                _mark_rows(region, w.y, w.y + w.h)
+                changed = True
+        return changed
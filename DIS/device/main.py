@@ -1,13 +1,23 @@
+# Boot order: only what the splash frame and UART ingest need is imported
+# here; boot() loads the rest with both already running.
 import config
+import uasyncio as asyncio
 import utime as time
-from display import DisplayManager
-from performance import PerformanceMonitor
+from performance import PerformanceMonitor, UART, BUTTONS, DERIVED, RENDER
 from uart_manager import UartManager
+from derived import mph_from_rpm, remaining, target_speed
+from scheduler import Periodic
 import math
+import gc
 
 # --- Hardware Setup ---
 oled_driver = config.OLED_1inch3()
-display = DisplayManager(oled_driver)
+# Splash in the built-in 8x8 font, so it needs no font or display module
+oled_driver.text("TAMU", 48, 20, 1)
+oled_driver.text("ECO-MARATHON", 16, 36, 1)
+oled_driver.show()
+splash_ms = time.ticks_ms()
+display = None  # DisplayManager, created by boot()
 
 # --- Debug Flags ---
 DEBUG_PERFORMANCE = True
@@ -16,6 +26,23 @@ DEBUG_SIMULATE_SPEED = True
 perf_monitor = (
     PerformanceMonitor(verbose=DEBUG_VERBOSE) if DEBUG_PERFORMANCE else None
 )
+oled_driver.profiler = perf_monitor
+
+# --- Task rates ---
+# The controller sends every 50 ms (sooner on a big change), so 20 fps
+# shows every regular sample. Buttons wake their task by IRQ and are only
+# polled at BUTTON_PERIOD_MS while a key is held, to time long presses.
+RENDER_FPS = 20
+BUTTON_PERIOD_MS = 10
+STATS_PERIOD_MS = 1000
+# After the first byte of a message wakes the UART task, let the rest of it
+# (21 bytes ASCII, 18 binary = ~2 ms at 115200) land before reading again
+UART_BATCH_MS = 2
+# Flight recorder: full blocks are written within RECORDER_PERIOD_MS of
+# filling, right after the next frame is shown; the partial block is synced
+# this often and whenever the timer stops, bounding what a crash can lose
+RECORDER_PERIOD_MS = 500
+RECORDER_SYNC_MS = 30000
 
 # Debug value
 below = True
@@ -40,13 +67,27 @@ def simulate_speed_data(uart_manager, current_mph, target_mph, below_state):
     return below_state
 
 # --- Managers ---
+# DUAL_CORE_INGEST moves UART parsing to core 1; the render task then reads
+# the latest sample through a seqlock instead of from the parser directly.
+DUAL_CORE_INGEST = False
 uart_manager = UartManager(config.uart)
+ingest = None
+if DUAL_CORE_INGEST:
+    from ingest import CoreIngest
+    ingest = CoreIngest(uart_manager)
+    uart_manager = ingest.sample  # same live-value attributes, refreshed by apply()
+
+# Log every decoded message to flash (see recorder.py)
+FLIGHT_RECORDER = True
+recorder = None
+recorder_sync = False  # set by the buttons to sync the partial block
 
 # Live values
 screen = 0
 last_screen = screen
-NUM_SCREENS = 6
+screens = ()  # layout.Screen per KEY0 press, built by boot()
 distance = 0
+driven = 0.0  # miles since boot, timer or not; never reset (the recorder logs this)
 timer_running = False
 timer_state = 'reset'
 timer_elapsed_ms = 0
@@ -63,117 +104,300 @@ RACE_TIME_MIN = 4
 goal_distance_mi = RACE_DISTANCE_MI
 goal_time_sec = RACE_TIME_MIN * 60
 
+# Per-track speed plan; without one the target is the average speed needed
+# to cover the remaining distance in the remaining time
+TRACK_PROFILE = "tracks/practice.csv"
+pacer = None
+
 # Wheel parameters
 wheel_diameter_in = 16
 wheel_circumference_in = math.pi * wheel_diameter_in  # inches
-
-print("Waiting for UART data...\n")
+odometer = None
+energy = None
 
 # ----------------- TIME VARIABLES -----------------
 last_sample_time = time.ticks_ms()
 elapsed_time = 0.0
 sample_dt = 0.0
+remaining_distance = goal_distance_mi
+remaining_time_sec = goal_time_sec
+uart_wakeups = 0
 # ---------------------------------------------------
 
-while True:
-    # Time Calculation always runs
-    current_time = time.ticks_ms()
-    sample_dt = time.ticks_diff(current_time, last_sample_time) / 1000
-    last_sample_time = current_time
+def on_message(mgr):
+    """Per-message work that must not be limited to the render rate."""
+    energy.update(time.ticks_ms(), mgr.voltage, mgr.current,
+                  mph_from_rpm(mgr.rpm, wheel_circumference_in), distance, timer_running)
+    if recorder:
+        recorder.log(mgr, driven)
 
-    # -------- Input Handling ---------------
-    uart_manager.update()
+def build_screens():
+    """The screens KEY0 steps through, in order. Sources are read every frame."""
+    from display import StatusRow, shown_delta
+    status = StatusRow(display.height, lambda: uart_manager.uart_blink, lambda: timer_state)
+    number = display.number_screen
+    below_target = lambda: target_mph > 0 and mph < target_mph
+    return (
+        display.dashboard_screen(lambda: mph, lambda: elapsed_time,
+                                 lambda: shown_delta(mph, target_mph),
+                                 status, invert=below_target, eco=lambda: uart_manager.eco),
+        number(lambda: mph, "MPH", status,
+               invert=below_target, eco=lambda: uart_manager.eco),
+        display.clock_screen(lambda: elapsed_time, "ELAPSED", status),
+        number(lambda: uart_manager.current, "AMPS", status),
+        number(lambda: uart_manager.voltage, "VOLTS", status),
+        display.distance_screen(lambda: distance),
+        number(lambda: target_mph, "TARGET MPH", status),
+        number(lambda: energy.mi_per_kwh, "MI/KWH", status),
+        number(lambda: energy.mi_per_kwh_now, "MI/KWH NOW", status),
+        number(lambda: energy.wh, "WH USED", status),
+        number(lambda: energy.avg_power_w, "AVG WATTS", status),
+    )
 
-    # --------- Derived Values (runs even with stale data)
-    power = uart_manager.voltage * uart_manager.current
-    mph = uart_manager.rpm * wheel_circumference_in * 60 / 63360.0
-    if timer_running:
-        distance += mph * sample_dt / 3600  # distance in miles
+button_period = Periodic("buttons", BUTTON_PERIOD_MS)
+render_period = Periodic("render", 1000 // RENDER_FPS)
+recorder_period = Periodic("recorder", RECORDER_PERIOD_MS)
+frame_shown = asyncio.Event()  # set by render_task after every frame
+stats_period = Periodic("stats", STATS_PERIOD_MS)
 
-    # -------- Simulate Speed if no UART data ---------------
-    if DEBUG_SIMULATE_SPEED and not uart_manager.new_data:
-        below = simulate_speed_data(uart_manager, mph, target_mph, below)
 
-    # --------- Button Handling via config -------------
-    screen_delta, timer_toggle, timer_reset, clear_alert_signal = oled_driver.check_button()
+async def uart_task():
+    """Parse controller data as soon as the UART has bytes; idle otherwise."""
+    global uart_wakeups
+    reader = asyncio.StreamReader(config.uart)
+    buf = bytearray(64)
+    while True:
+        n = await reader.readinto(buf)
+        if perf_monitor: perf_monitor.begin(UART)
+        uart_manager.feed(buf, n)
+        if perf_monitor: perf_monitor.end(UART)
+        uart_wakeups += 1
+        await asyncio.sleep_ms(UART_BATCH_MS)
 
-    if clear_alert_signal:
-        display.clear_alert()
 
-    if timer_toggle:
-        if timer_running:
-            timer_elapsed_ms += time.ticks_diff(current_time, timer_start_ms)
-            timer_running = False
-            timer_state = 'paused'
-            print("Timer stopped")
+async def button_task():
+    global screen, last_screen, distance, timer_running, timer_state, timer_elapsed_ms, timer_start_ms
+    global recorder_sync
+    buttons = oled_driver.buttons
+    buttons.flag = asyncio.ThreadSafeFlag()
+    while True:
+        if buttons.busy():
+            await button_period.wait()
         else:
+            await buttons.flag.wait()  # sleep until a key IRQ
+            button_period.restart()
+        if perf_monitor: perf_monitor.begin(BUTTONS)
+        current_time = time.ticks_ms()
+        screen_delta, timer_toggle, timer_reset, clear_alert_signal = oled_driver.check_button()
+
+        if clear_alert_signal:
+            display.clear_alert()
+
+        if timer_toggle:
+            if timer_running:
+                timer_elapsed_ms += time.ticks_diff(current_time, timer_start_ms)
+                timer_running = False
+                timer_state = 'paused'
+                recorder_sync = True
+                print("Timer stopped")
+            else:
+                timer_start_ms = current_time
+                timer_running = True
+                timer_state = 'running'
+                print("Timer started")
+
+        if timer_reset:
+            timer_elapsed_ms = 0
+            distance = 0
+            odometer.reset()
+            energy.reset()
+            timer_running = False
+            timer_state = 'reset'
             timer_start_ms = current_time
-            timer_running = True
-            timer_state = 'running'
-            print("Timer started")
-
-    if timer_reset:
-        timer_elapsed_ms = 0
-        distance = 0
-        timer_running = False
-        timer_state = 'reset'
-        timer_start_ms = current_time
-        display.show_alert("TIMER", "RESET", 3)
-
-    if screen_delta:
-        screen += screen_delta
-
-    # Wrap screen
-    new_screen = screen % NUM_SCREENS
-    if new_screen != last_screen:
-        print("screen: ", new_screen)
-        last_screen = new_screen
-        display.screen_changed()
-    screen = new_screen
-
-    # --------- Timer Calculation ----------------------
-    if timer_running:
-        elapsed_time = (timer_elapsed_ms + time.ticks_diff(current_time, timer_start_ms)) / 1000
-    else:
-        elapsed_time = timer_elapsed_ms / 1000
-    
-    # --------- Target Speed Calculation ----------------------
-    remaining_distance = max(goal_distance_mi - distance, 0)
-    if timer_running:
-        remaining_time_sec = max(goal_time_sec - elapsed_time, 0.001)
-    else:
-        remaining_time_sec = max(goal_time_sec - elapsed_time, 0.001)
-    target_mph = (remaining_distance / (remaining_time_sec / 3600)) if remaining_time_sec > 0 else 0
-
-    # --------- DISPLAY (always runs) ------------------
-    if display.update_alert():
-        continue
-
-    if perf_monitor: perf_monitor.start()
-
-    if screen == 0:
-        invert_speed = target_mph > 0 and mph < target_mph
-        display.draw_large_num(mph, "MPH", uart_manager.uart_blink, timer_state, invert=invert_speed, eco=uart_manager.eco)
-    elif screen == 1:
-        display.draw_time(elapsed_time, "ELAPSED", uart_manager.uart_blink, timer_state)
-    elif screen == 2:
-        display.draw_large_num(uart_manager.current, "AMPS", uart_manager.uart_blink, timer_state)
-    elif screen == 3:
-        display.draw_large_num(uart_manager.voltage, "VOLTS", uart_manager.uart_blink, timer_state)
-    elif screen == 4:
-        display.draw_demo_distance(distance)
-    elif screen == 5:
-        display.draw_large_num(target_mph, "TARGET MPH", uart_manager.uart_blink, timer_state)
-
-    if perf_monitor: perf_monitor.stop()
-
-    # --------- DEBUG LOGGING ----------------------
-    if perf_monitor:
+            recorder_sync = True
+            display.show_alert("TIMER", "RESET", 3)
+
+        if screen_delta:
+            screen += screen_delta
+
+        # Wrap screen
+        new_screen = screen % len(screens)
+        if new_screen != last_screen:
+            print("screen: ", new_screen)
+            last_screen = new_screen
+            display.screen_changed()
+        screen = new_screen
+        if perf_monitor: perf_monitor.end(BUTTONS)
+
+
+async def render_task():
+    global last_sample_time, sample_dt, mph, distance, driven, below, elapsed_time
+    global remaining_distance, remaining_time_sec, target_mph
+    while True:
+        await render_period.wait()
+        if perf_monitor: perf_monitor.tick()
+
+        # Time Calculation always runs
+        current_time = time.ticks_ms()
+        sample_dt = time.ticks_diff(current_time, last_sample_time) / 1000
+        last_sample_time = current_time
+
+        # --------- Derived Values (runs even with stale data)
+        if perf_monitor: perf_monitor.begin(DERIVED)
+        if ingest:
+            ingest.apply()
+            if uart_manager.new_data:
+                on_message(uart_manager)  # latest sample per frame only
+        mph = mph_from_rpm(uart_manager.rpm, wheel_circumference_in)
+        if uart_manager.has_edges:
+            # Exact: counted commutation edges, independent of the loop rate
+            distance = odometer.update(uart_manager.edges, timer_running)
+            driven += odometer.moved
+        else:
+            step = mph * sample_dt / 3600  # distance in miles (ASCII / v1 frames)
+            driven += step
+            if timer_running:
+                distance += step
+
+        # -------- Simulate Speed if no UART data ---------------
+        if DEBUG_SIMULATE_SPEED and not uart_manager.new_data:
+            below = simulate_speed_data(uart_manager, mph, target_mph, below)
+        uart_manager.new_data = False
+
+        # --------- Timer Calculation ----------------------
+        if timer_running:
+            elapsed_time = (timer_elapsed_ms + time.ticks_diff(current_time, timer_start_ms)) / 1000
+        else:
+            elapsed_time = timer_elapsed_ms / 1000
+
+        # --------- Target Speed Calculation ----------------------
+        remaining_distance, remaining_time_sec = remaining(goal_distance_mi, distance, goal_time_sec, elapsed_time)
+        if pacer:
+            target_mph = pacer.update(distance, elapsed_time)
+        else:
+            target_mph = target_speed(remaining_distance, remaining_time_sec)
+        if perf_monitor: perf_monitor.end(DERIVED)
+
+        # --------- DISPLAY (always runs) ------------------
+        if display.update_alert():
+            frame_shown.set()
+            continue
+
+        if perf_monitor: perf_monitor.begin(RENDER)
+
+        display.draw_screen(screens[screen])
+
+        if perf_monitor: perf_monitor.end(RENDER)
+        frame_shown.set()
+
+
+async def recorder_task():
+    """
+    Move filled log blocks to flash between frames. A flash erase or
+    program stalls both cores, so each write starts right after a frame
+    has been shown and uses the gap before the next one.
+    """
+    global recorder_sync
+    last_sync = time.ticks_ms()
+    while True:
+        await recorder_period.wait()
+        if not (recorder.pending() or recorder_sync
+                or time.ticks_diff(time.ticks_ms(), last_sync) >= RECORDER_SYNC_MS):
+            continue
+        frame_shown.clear()
+        await frame_shown.wait()
+        recorder.flush()
+        if recorder_sync or time.ticks_diff(time.ticks_ms(), last_sync) >= RECORDER_SYNC_MS:
+            recorder.sync()
+            recorder_sync = False
+            last_sync = time.ticks_ms()
+
+
+async def stats_task():
+    global uart_wakeups
+    periods = (button_period, render_period, recorder_period, stats_period)
+    while True:
+        await stats_period.wait()
+        # --------- DEBUG LOGGING ----------------------
+        if not perf_monitor:
+            continue
         if timer_running:
             # Pass race data when the timer is active
-            perf_monitor.update(
+            printed = perf_monitor.update(
                 remaining_time=remaining_time_sec, remaining_dist=remaining_distance
             )
         else:
             # Otherwise, just update for performance stats
-            perf_monitor.update()
+            printed = perf_monitor.update()
+        if printed:
+            # Task runs/deadline misses over the same interval
+            print("tasks: " + ", ".join(p.summary() for p in periods) + f", uart wakeups {uart_wakeups}"
+                  + f", key latency {oled_driver.buttons.last_latency_us}/{oled_driver.buttons.max_latency_us}us")
+            print(f"heap: {gc.mem_alloc()} used, {gc.mem_free()} free")
+            if recorder:
+                print(f"log: {recorder.path()} {recorder.records} records, {recorder.dropped} dropped, "
+                      f"{recorder.blocks_written} blocks, write {recorder.last_write_us}/{recorder.max_write_us}us")
+            if timer_running:
+                print(f"energy: {energy.wh:.2f} Wh, {energy.avg_power_w:.0f} W avg, "
+                      f"{energy.mi_per_kwh:.1f} mi/kWh ({energy.mi_per_kwh_now:.1f} now)")
+            if pacer and timer_running:
+                print(f"pace: segment {pacer.segment}, target {pacer.target_mph:.1f} mph, "
+                      f"{pacer.delta_s:+.1f}s vs plan, projected finish {pacer.finish_s:.0f}s")
+            for p in periods:
+                p.reset()
+            uart_wakeups = 0
+
+
+async def boot():
+    """
+    Finish initialization behind the splash. UART ingest is already running,
+    and each step yields so it keeps draining the receive buffer; messages
+    before the end of boot update the live values but are not logged.
+    """
+    global display, screens, pacer, recorder, odometer, energy
+    from display import DisplayManager
+    display = DisplayManager(oled_driver)
+    await asyncio.sleep_ms(0)
+
+    from odometry import Odometer
+    from energy import EnergyMeter
+    odometer = Odometer(wheel_circumference_in)
+    energy = EnergyMeter()
+    screens = build_screens()
+    await asyncio.sleep_ms(0)
+
+    from pacing import Pacer, load_profile
+    try:
+        pacer = Pacer(load_profile(TRACK_PROFILE), goal_time_sec)
+        print("Pacing profile:", TRACK_PROFILE)
+    except (OSError, ValueError) as e:
+        # Missing (not synced to flash?) or malformed: race without pacing, but say so
+        print("Pacing off, profile error:", TRACK_PROFILE, e)
+        pacer = None
+    await asyncio.sleep_ms(0)
+
+    if FLIGHT_RECORDER:
+        from recorder import FlightRecorder
+        recorder = FlightRecorder()
+        await asyncio.sleep_ms(0)
+
+    if not ingest:
+        uart_manager.on_message = on_message
+    print(f"boot: splash at {splash_ms} ms, ready at {time.ticks_ms()} ms")
+    print("Waiting for UART data...\n")
+
+
+async def main():
+    if ingest:
+        ingest.start()
+    else:
+        asyncio.create_task(uart_task())
+    await boot()
+    asyncio.create_task(button_task())
+    asyncio.create_task(render_task())
+    if recorder:
+        asyncio.create_task(recorder_task())
+    await stats_task()
+
+
+asyncio.run(main())
@@ -0,0 +1,55 @@
+"""
+Distance from the controller's commutation edge counter.
+
+Every hall state change on the controller bumps a 32-bit counter that is
+sent in each telemetry frame, so distance is a count of wheel motion
+rather than mph integrated over a jittery loop period.
+"""
+from derived import INCHES_PER_MILE
+
+# Hall state changes per wheel revolution: 23 pole pairs x 6 commutation
+# states, the same constants easycontroller.c uses to turn edges into rpm.
+EDGES_PER_REV = 23 * 6
+
+COUNTER_MASK = 0xFFFFFFFF
+
+# Deltas above this cannot be real motion between two frames (the hub would
+# need ~10^5 rpm); treat them as a controller reset that restarted the count.
+MAX_EDGE_DELTA = 100000
+
+
+class Odometer:
+    def __init__(self, wheel_circumference_in, edges_per_rev=EDGES_PER_REV):
+        self.miles_per_edge = wheel_circumference_in / edges_per_rev / INCHES_PER_MILE
+        self.edges = 0          # edges counted since reset()
+        self.distance = 0.0     # miles since reset()
+        self.resets_seen = 0    # controller restarts detected
+        self.moved = 0.0        # miles the last update() saw, counted or not
+        self._last = -1
+
+    def update(self, counter, counting=True):
+        """
+        Fold in the latest raw counter from a telemetry frame. Motion is only
+        added while counting (the race timer is running), but the reference
+        is always advanced so pausing does not bank distance for later.
+        """
+        self.moved = 0.0
+        if self._last < 0:
+            self._last = counter
+            return self.distance
+        delta = (counter - self._last) & COUNTER_MASK
+        if delta > MAX_EDGE_DELTA:
+            # Controller rebooted: its counter started over from zero
+            self.resets_seen += 1
+            delta = counter if counter <= MAX_EDGE_DELTA else 0
+        self._last = counter
+        self.moved = delta * self.miles_per_edge
+        if counting and delta:
+            self.edges += delta
+            self.distance = self.edges * self.miles_per_edge
+        return self.distance
+
+    def reset(self):
+        """Zero the trip; the counter reference is kept."""
+        self.edges = 0
+        self.distance = 0.0
@@ -0,0 +1,155 @@
+"""
+Race pacing against a per-track speed plan.
+
+A track profile is a list of distance-indexed segments, each with the
+speed and throttle the strategy team recommends for that stretch (hard on
+the launch, easy on the climb, coast into the finish). Pacer scales the
+plan to the race time limit once, then every frame looks up the segment
+under the odometer and reports the target speed, how far ahead or behind
+plan the car is and the finish time that pace projects.
+
+Profiles live in tracks/*.csv on the Pico:
+
+    # start_mi, mph, throttle_pct
+    0.00, 12, 90
+    0.10, 16, 45
+    1.00            <- a row with only a distance marks the finish
+"""
+from array import array
+
+FEET_PER_MILE = 5280
+
+# Never ask for more than this multiple of the planned speed to make up time
+# (or less than its inverse to burn it off); keeps the target sane as the
+# time left runs out.
+MAX_CATCHUP = 1.5
+
+
+class TrackProfile:
+    """Segments stored column-wise in flat arrays, sorted by start distance."""
+    def __init__(self, starts_mi, mph, throttle, finish_mi, name="track"):
+        if not starts_mi or len(starts_mi) != len(mph) or len(mph) != len(throttle):
+            raise ValueError("profile needs matching start/mph/throttle columns")
+        if finish_mi <= starts_mi[-1]:
+            raise ValueError("finish must be past the last segment start")
+        for i in range(len(mph)):
+            if mph[i] <= 0 or (i and starts_mi[i] <= starts_mi[i - 1]):
+                raise ValueError("segment {}: speeds must be positive and starts increasing".format(i))
+        self.name = name
+        self.start_ft = array("i", [int(d * FEET_PER_MILE) for d in starts_mi])
+        self.start_mi = array("f", starts_mi)
+        self.mph = array("f", mph)
+        self.throttle = bytearray(throttle)
+        self.finish_mi = finish_mi
+
+    def __len__(self):
+        return len(self.mph)
+
+    def planned_time_s(self):
+        """Time the profile takes as written, at exactly the listed speeds."""
+        total = 0.0
+        for i in range(len(self.mph)):
+            end = self.start_mi[i + 1] if i + 1 < len(self.mph) else self.finish_mi
+            total += (end - self.start_mi[i]) * 3600 / self.mph[i]
+        return total
+
+
+def load_profile(path):
+    """Read a tracks/*.csv profile (see module docstring)."""
+    starts, mph, throttle = [], [], []
+    finish = None
+    with open(path) as f:
+        for line in f:
+            line = line.split("#")[0].strip()
+            if not line:
+                continue
+            fields = [x.strip() for x in line.split(",")]
+            if len(fields) == 1:
+                finish = float(fields[0])
+                continue
+            starts.append(float(fields[0]))
+            mph.append(float(fields[1]))
+            throttle.append(int(fields[2]) if len(fields) > 2 and fields[2] else 0)
+    if finish is None:
+        raise ValueError("{}: no finish distance".format(path))
+    name = path.split("/")[-1].split(".")[0]
+    return TrackProfile(starts, mph, throttle, finish, name)
+
+
+class Pacer:
+    """
+    Plan-following target speed.
+
+    On construction the profile's speeds are scaled so the whole plan takes
+    exactly goal_time_sec, and the planned time at the start of every
+    segment is precomputed. update() is then a binary search over integer
+    segment starts (checked against the previous segment first, since the
+    car only moves forward) plus a few multiplies, and stores its results
+    in attributes rather than returning a new tuple each frame.
+    """
+    def __init__(self, profile, goal_time_sec):
+        n = len(profile)
+        self.profile = profile
+        self.goal_time_sec = goal_time_sec
+        scale = profile.planned_time_s() / goal_time_sec
+        self.plan_mph = array("f", [v * scale for v in profile.mph])
+        self.plan_t = array("f", [0.0] * (n + 1))  # planned elapsed time at each segment start, then at the finish
+        for i in range(n):
+            end = profile.start_mi[i + 1] if i + 1 < n else profile.finish_mi
+            self.plan_t[i + 1] = self.plan_t[i] + (end - profile.start_mi[i]) * 3600 / self.plan_mph[i]
+        self.segment = 0
+        self.target_mph = self.plan_mph[0]
+        self.plan_speed_mph = self.plan_mph[0]
+        self.throttle = profile.throttle[0]
+        self.delta_s = 0.0      # elapsed minus planned time at this distance; > 0 is behind plan
+        self.finish_s = goal_time_sec  # projected finish at the current pace relative to plan
+        self.finished = False
+
+    def find(self, distance_ft):
+        """Index of the segment containing distance_ft (integer feet)."""
+        starts = self.profile.start_ft
+        n = len(starts)
+        i = self.segment
+        if starts[i] <= distance_ft and (i + 1 == n or distance_ft < starts[i + 1]):
+            return i
+        lo = 0
+        hi = n
+        while hi - lo > 1:
+            mid = (lo + hi) >> 1
+            if starts[mid] <= distance_ft:
+                lo = mid
+            else:
+                hi = mid
+        return lo
+
+    def update(self, distance_mi, elapsed_s):
+        profile = self.profile
+        i = self.find(int(distance_mi * FEET_PER_MILE))
+        self.segment = i
+        self.throttle = profile.throttle[i]
+        if distance_mi >= profile.finish_mi:
+            self.finished = True
+            self.target_mph = 0.0
+            self.plan_speed_mph = 0.0
+            self.delta_s = elapsed_s - self.plan_t[len(profile)]
+            self.finish_s = elapsed_s
+            return self.target_mph
+        self.finished = False
+        plan_mph = self.plan_mph[i]
+        planned = self.plan_t[i] + (distance_mi - profile.start_mi[i]) * 3600 / plan_mph
+        plan_left = self.plan_t[len(profile)] - planned
+        self.plan_speed_mph = plan_mph
+        self.delta_s = elapsed_s - planned
+        self.finish_s = elapsed_s + plan_left * (elapsed_s / planned) if planned > 0 else self.goal_time_sec
+
+        # Spread the delta over the rest of the run: follow the plan's shape,
+        # scaled so what is left of it fits in the time that is left
+        time_left = self.goal_time_sec - elapsed_s
+        if time_left * MAX_CATCHUP <= plan_left:
+            catchup = MAX_CATCHUP
+        elif time_left >= plan_left * MAX_CATCHUP:
+            catchup = 1 / MAX_CATCHUP
+        else:
+            catchup = plan_left / time_left
+        self.target_mph = plan_mph * catchup
+        return self.target_mph
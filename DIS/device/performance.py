@@ -1,28 +1,132 @@
 import utime as time
+from array import array
+
+# Default sections, in the order main.py runs them. LOOP is the time from one
+# tick() to the next, so its average gives the loop rate.
+SECTIONS = ("loop", "uart", "buttons", "derived", "render", "flush")
+LOOP, UART, BUTTONS, DERIVED, RENDER, FLUSH = range(6)
+
+# Per-section fields in report(): sample count, min, avg, p95, max [us]
+STAT_COUNT, STAT_MIN, STAT_AVG, STAT_P95, STAT_MAX = range(5)
+STAT_FIELDS = 5
+
 
 class PerformanceMonitor:
-    """A simple class to monitor and report performance metrics."""
-    def __init__(self, print_interval_ms=5000, verbose=False):
+    """
+    Per-section loop profiler.
+
+    begin(section)/end(section) time a named section into a fixed ring of
+    the last `samples` durations. Sections nest freely (render can contain
+    flush) since each keeps its own start time, but one section cannot be
+    re-entered before it ends. Recording only stores small ints into
+    preallocated arrays, so it does not allocate or trigger a GC.
+    """
+    def __init__(self, print_interval_ms=5000, verbose=False, sections=SECTIONS, samples=64):
         self.print_interval_ms = print_interval_ms
         self.verbose = verbose
         self.last_perf_print_ms = time.ticks_ms()
-        self.draw_start_us = 0
 
-        self.total_draw_time_us = 0
-        self.draw_count = 0
+        self.names = tuple(sections)
+        n = len(self.names)
+        self.samples = samples
+        self._ring = array("i", [0] * (n * samples))
+        self._pos = array("i", [0] * n)
+        self._count = array("i", [0] * n)
+        self._start = array("i", [0] * n)
+        self._last_tick = -1
+        self._sorted = array("i", [0] * samples)  # p95 scratch
+        self._report = array("i", [0] * (n * STAT_FIELDS))
+
+    # ---------------- Recording ----------------
+
+    def section(self, name):
+        """Index of a section name, for code that registered its own sections."""
+        return self.names.index(name)
+
+    def begin(self, section):
+        self._start[section] = time.ticks_us()
 
+    def end(self, section):
+        self._record(section, time.ticks_diff(time.ticks_us(), self._start[section]))
+
+    def tick(self):
+        """Call once at the top of every loop iteration."""
+        now = time.ticks_us()
+        if self._last_tick >= 0:
+            self._record(LOOP, time.ticks_diff(now, self._last_tick))
+        self._last_tick = now
+
+    def _record(self, section, us):
+        pos = self._pos[section]
+        self._ring[section * self.samples + pos] = us
+        pos += 1
+        self._pos[section] = 0 if pos == self.samples else pos
+        self._count[section] += 1
+
+    # Previous single-timer API: times the render section
     def start(self):
         """Start the timer for a measurement."""
-        self.draw_start_us = time.ticks_us()
+        self.begin(RENDER)
 
     def stop(self):
         """Stop the timer and record the measurement."""
-        draw_duration_us = time.ticks_diff(time.ticks_us(), self.draw_start_us)
-        self.total_draw_time_us += draw_duration_us
-        self.draw_count += 1
+        self.end(RENDER)
+
+    # ---------------- Stats ----------------
+
+    def report(self):
+        """
+        Fill and return an array('i') of STAT_FIELDS ints per section
+        (count since last reset, min, avg, p95, max in us over the ring).
+        The same array is reused on every call.
+        """
+        out = self._report
+        ring = self._ring
+        scratch = self._sorted
+        size = self.samples
+        for s in range(len(self.names)):
+            count = self._count[s]
+            n = count if count < size else size
+            base = s * size
+            o = s * STAT_FIELDS
+            out[o + STAT_COUNT] = count
+            if not n:
+                out[o + STAT_MIN] = out[o + STAT_AVG] = out[o + STAT_P95] = out[o + STAT_MAX] = 0
+                continue
+            # Insertion sort into the scratch buffer; n is at most `samples`
+            total = 0
+            for i in range(n):
+                v = ring[base + i]
+                total += v
+                j = i
+                while j and scratch[j - 1] > v:
+                    scratch[j] = scratch[j - 1]
+                    j -= 1
+                scratch[j] = v
+            out[o + STAT_MIN] = scratch[0]
+            out[o + STAT_AVG] = total // n
+            out[o + STAT_P95] = scratch[(n * 95 - 1) // 100]
+            out[o + STAT_MAX] = scratch[n - 1]
+        return out
+
+    def loop_hz(self):
+        """Loop rate from the LOOP samples in the ring; 0 before the second tick()."""
+        count = self._count[LOOP]
+        n = count if count < self.samples else self.samples
+        ring = self._ring
+        base = LOOP * self.samples
+        total = 0
+        for i in range(n):
+            total += ring[base + i]
+        return 1000000 * n / total if total else 0
+
+    def reset(self):
+        for s in range(len(self.names)):
+            self._count[s] = 0
+            self._pos[s] = 0
 
     def update(self, remaining_time=None, remaining_dist=None):
-        """Check if it's time to print stats and do so if needed."""
+        """Check if it's time to print stats and do so if needed. Returns True if it printed."""
         if time.ticks_diff(time.ticks_ms(), self.last_perf_print_ms) > self.print_interval_ms:
             self.last_perf_print_ms = time.ticks_ms()
 
@@ -33,14 +137,18 @@ class PerformanceMonitor:
                 verbose_str = f"rem_t: {remaining_time:.0f}s, rem_d: {remaining_dist:.3f}mi"
                 log_parts.append(verbose_str)
 
-            # Always add performance part
-            avg_us = (self.total_draw_time_us / self.draw_count) if self.draw_count > 0 else 0
-            perf_str = f"Draw: {avg_us:.0f}us (n={self.draw_count})"
-            log_parts.append(perf_str)
+            # Loop rate, then avg/p95/max per section that ran this interval
+            stats = self.report()
+            log_parts.append(f"{self.loop_hz():.0f}Hz")
+            for s in range(1, len(self.names)):
+                o = s * STAT_FIELDS
+                if stats[o + STAT_COUNT]:
+                    log_parts.append(f"{self.names[s]} {stats[o + STAT_AVG]}/{stats[o + STAT_P95]}/{stats[o + STAT_MAX]}us")
 
             # Print the combined log line
             print(" | ".join(log_parts))
 
             # Reset for the next interval
-            self.total_draw_time_us = 0
-            self.draw_count = 0
\ No newline at end of file
+            self.reset()
+            return True
+        return False
@@ -0,0 +1,235 @@
+"""
+Binary flight recorder for controller telemetry.
+
+Every decoded message is packed into a fixed 16-byte record in a RAM
+block, so logging a message never touches the filesystem. Full blocks
+are written to flash by a background task, but on the same uasyncio
+thread as rendering, and while the RP2040 erases or programs flash both
+cores stall (code executes from that flash). A block write therefore
+delays whatever would run next by its full duration; main.py starts
+writes right after a frame has gone out, and max_write_us tracks the
+worst one. Logs rotate across a bounded set of files in logs/.
+
+File layout:
+
+    header   HEADER_SIZE bytes, written and flushed once when the file is
+             opened and never rewritten
+    records  RECORD_SIZE bytes each, appended in whole records only
+
+The first block of a file is HEADER_SIZE bytes short, so every later block
+write starts on a BLOCK_SIZE boundary of the file. A reset or brown-out can
+lose the records still in RAM but never leaves a torn header or a partial
+record: a reader takes (size - header_size) // record_size records.
+"""
+import os
+import struct
+import utime as time
+
+LOG_DIR = "logs"
+LOG_PREFIX = "run"
+LOG_EXT = ".bin"
+
+MAGIC = b"DISREC"
+LOG_VERSION = 2  # 1 logged the trip distance, which resets with the timer
+# magic, version, record size, header size, block size, run number, ticks_ms the recorder started at
+HEADER_FMT = "<6sBBHHHI"
+HEADER_SIZE = 64
+
+# t [ms since the recorder started], distance [cm driven since boot, never reset], voltage [0.1 V], current [10 mA], rpm,
+# duty [%], throttle [%] | eco. Little-endian.
+RECORD_FMT = "<IIHhHBB"
+RECORD_SIZE = struct.calcsize(RECORD_FMT)
+FLAG_ECO = 0x80  # throttle is 0..100, so its top bit carries eco
+
+CM_PER_MILE = 160934.4
+
+# littlefs on the Pico uses 4 KiB erase blocks
+BLOCK_SIZE = 4096
+# At the controller's 20 Hz telemetry a file holds ~10 min. Rotation deletes
+# the oldest file only when a new one opens, so the last 4 full files (~41
+# min) always survive: a whole attempt, in 960 KiB of the ~1.4 MB filesystem.
+# Early sends on a change in rpm or current add records beyond 20 Hz.
+MAX_FILE_BYTES = 192 * 1024
+MAX_FILES = 5
+
+
+def _sync():
+    if hasattr(os, "sync"):
+        os.sync()
+
+
+class FlightRecorder:
+    """
+    Double-buffered block logger.
+
+    log() packs a record into the active block; when the block fills it is
+    handed to flush() and logging continues in the other one. If flush() has
+    not written the previous block by then the record is dropped and
+    counted, never blocking the caller. sync() additionally writes the
+    records of the active block that are not on flash yet, e.g. when the
+    timer stops, without breaking block alignment.
+    """
+    def __init__(self, log_dir=LOG_DIR, block_size=BLOCK_SIZE,
+                 max_file_bytes=MAX_FILE_BYTES, max_files=MAX_FILES):
+        self.log_dir = log_dir
+        self.block_size = block_size
+        self.max_file_bytes = max_file_bytes
+        self.max_files = max_files
+        self._bufs = (bytearray(block_size), bytearray(block_size))
+        self._views = (memoryview(self._bufs[0]), memoryview(self._bufs[1]))
+        self._active = 0
+        self._fill = HEADER_SIZE     # end of records in the active block
+        self._written = HEADER_SIZE  # active block bytes already on flash
+        self._pending = -1           # full block waiting for flush(), or -1
+        self._pending_from = 0
+        self._pending_end = 0
+        self._rotate = False
+        self._file_bytes = block_size  # file size once the active block is written
+        self._file = None
+        self._t0 = time.ticks_ms()
+
+        self.records = 0
+        self.dropped = 0
+        self.blocks_written = 0
+        self.last_write_us = 0
+        self.max_write_us = 0
+
+        try:
+            os.mkdir(log_dir)
+        except OSError:
+            pass  # already there
+        self.run = self._last_run() + 1
+        self._open()
+
+    # ---------------- Files ----------------
+
+    def _runs(self):
+        runs = []
+        for name in os.listdir(self.log_dir):
+            if name.startswith(LOG_PREFIX) and name.endswith(LOG_EXT):
+                try:
+                    runs.append(int(name[len(LOG_PREFIX):-len(LOG_EXT)]))
+                except ValueError:
+                    pass
+        runs.sort()
+        return runs
+
+    def _last_run(self):
+        runs = self._runs()
+        return runs[-1] if runs else 0
+
+    def path(self, run=None):
+        return "{}/{}{:04d}{}".format(self.log_dir, LOG_PREFIX, self.run if run is None else run, LOG_EXT)
+
+    def _open(self):
+        # Make room first so the new file never pushes the set over max_files
+        runs = self._runs()
+        while len(runs) >= self.max_files:
+            os.remove(self.path(runs.pop(0)))
+        header = bytearray(HEADER_SIZE)
+        struct.pack_into(HEADER_FMT, header, 0, MAGIC, LOG_VERSION, RECORD_SIZE, HEADER_SIZE,
+                         self.block_size, self.run & 0xFFFF, self._t0)
+        self._file = open(self.path(), "wb")
+        self._file.write(header)
+        self._file.flush()
+        _sync()
+
+    def _next_file(self):
+        self._file.close()
+        self.run += 1
+        self._open()
+
+    # ---------------- Producer (no flash access) ----------------
+
+    def log(self, mgr, distance_mi):
+        """Append one record for the UartManager's current values."""
+        fill = self._fill
+        if fill + RECORD_SIZE > self.block_size:
+            if self._pending >= 0:
+                self.dropped += 1
+                return
+            # Hand the full block to flush() and start the next one
+            self._pending = self._active
+            self._pending_from = self._written
+            self._pending_end = fill
+            self._active ^= 1
+            if self._file_bytes + self.block_size > self.max_file_bytes:
+                # Next block opens a new file, behind its header
+                self._rotate = True
+                fill = HEADER_SIZE
+                self._file_bytes = self.block_size
+            else:
+                fill = 0
+                self._file_bytes += self.block_size
+            self._written = fill
+        current = round(mgr.current * 100)
+        if current > 32767: current = 32767
+        elif current < -32768: current = -32768
+        throttle = int(mgr.throttle) & 0x7F
+        if mgr.eco:
+            throttle |= FLAG_ECO
+        struct.pack_into(RECORD_FMT, self._bufs[self._active], fill,
+                         time.ticks_diff(time.ticks_ms(), self._t0) & 0xFFFFFFFF,
+                         int(distance_mi * CM_PER_MILE), round(mgr.voltage * 10) & 0xFFFF, current,
+                         int(mgr.rpm) & 0xFFFF, int(mgr.duty) & 0xFF, throttle)
+        self._fill = fill + RECORD_SIZE
+        self.records += 1
+
+    # ---------------- Consumer (flash writes) ----------------
+
+    def pending(self):
+        return self._pending >= 0
+
+    def flush(self):
+        """Write the full block waiting from log(), if any. Returns True if it wrote."""
+        if self._pending < 0:
+            return False
+        self._write(self._views[self._pending][self._pending_from:self._pending_end])
+        self._pending = -1
+        self.blocks_written += 1
+        if self._rotate:
+            self._rotate = False
+            self._next_file()
+        return True
+
+    def sync(self):
+        """flush(), then also put the records logged so far in the active block on flash."""
+        self.flush()
+        fill = self._fill
+        if fill > self._written:
+            self._write(self._views[self._active][self._written:fill])
+            self._written = fill
+
+    def _write(self, data):
+        t0 = time.ticks_us()
+        self._file.write(data)
+        self._file.flush()
+        us = time.ticks_diff(time.ticks_us(), t0)
+        self.last_write_us = us
+        if us > self.max_write_us:
+            self.max_write_us = us
+
+    def close(self):
+        self.sync()
+        self._file.close()
+        _sync()
+
+
+def read_header(data):
+    """(version, record_size, header_size, block_size, run, start ticks_ms) from the start of a log."""
+    magic, version, record_size, header_size, block_size, run, ticks = struct.unpack_from(HEADER_FMT, data, 0)
+    if magic != MAGIC:
+        raise ValueError("not a flight recorder log")
+    return version, record_size, header_size, block_size, run, ticks
+
+
+def iter_records(data):
+    """
+    Decode a whole log file's bytes into (t_s, voltage, current, rpm, duty,
+    throttle, eco, distance_mi) tuples. A trailing partial record is ignored.
+    """
+    _, record_size, header_size, _, _, _ = read_header(data)
+    for off in range(header_size, len(data) - record_size + 1, record_size):
+        t_ms, dist_cm, voltage, current, rpm, duty, throttle = struct.unpack_from(RECORD_FMT, data, off)
+        yield (t_ms / 1000, voltage / 10, current / 100, rpm, duty, throttle & 0x7F,
+               bool(throttle & FLAG_ECO), dist_cm / CM_PER_MILE)
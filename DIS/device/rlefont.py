@@ -0,0 +1,117 @@
+import micropython
+import struct
+from array import array
+
+# File layout: see DIS/host/build_fonts.py
+MAGIC = b"RLF1"
+HEADER_FMT = "<4sBBBBBH"
+HEADER_SIZE = struct.calcsize(HEADER_FMT)
+ENTRY_FMT = "<BBH"
+ENTRY_SIZE = 4
+
+
+@micropython.viper
+def _decode_runs(dst, src, p) -> int:
+    """
+    Paint nibble-coded off/on pixel runs into a zeroed MONO_HLSB glyph.
+    p = [source bytes, glyph width, bytes per row, glyph pixels]
+    Returns the number of pixels decoded.
+    """
+    d = ptr8(dst)
+    s = ptr8(src)
+    a = ptr32(p)
+    nibbles = int(a[0]) * 2
+    width = int(a[1])
+    stride = int(a[2])
+    total = int(a[3])
+    i = 0
+    x = 0
+    o = 0
+    done = 0
+    on = 0
+    while done < total and i < nibbles:
+        b = s[i >> 1]
+        v = (b >> 4) if (i & 1) == 0 else (b & 15)
+        i += 1
+        if v == 15 and i + 1 < nibbles:
+            b = s[i >> 1]
+            hi = (b >> 4) if (i & 1) == 0 else (b & 15)
+            i += 1
+            b = s[i >> 1]
+            lo = (b >> 4) if (i & 1) == 0 else (b & 15)
+            i += 1
+            v = 15 + ((hi << 4) | lo)
+        done += v
+        if on:
+            while v > 0:
+                d[o + (x >> 3)] |= 0x80 >> (x & 7)
+                x += 1
+                if x == width:
+                    x = 0
+                    o += stride
+                v -= 1
+        else:
+            x += v
+            while x >= width:
+                x -= width
+                o += stride
+        on ^= 1
+    return done
+
+
+class RleFont:
+    """
+    font_to_py-compatible font read from a run-length encoded .rlf file
+    (DIS/host/build_fonts.py). Only the glyph index is held in RAM; get_ch()
+    reads and decodes one glyph from flash, so pair it with a Writer, whose
+    glyph cache keeps the decoded ones that are actually drawn.
+    """
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            magic, self._height, self._baseline, self._max_width, count, self._default, largest = \
+                struct.unpack(HEADER_FMT, f.read(HEADER_SIZE))
+            if magic != MAGIC:
+                raise ValueError("not an RLE font: " + path)
+            self._index = f.read((count + 1) * ENTRY_SIZE)
+        self._data = HEADER_SIZE + len(self._index)
+        self._glyphs = {chr(self._index[i * ENTRY_SIZE]): i for i in range(count)}
+        self._src = bytearray(largest)
+        self._p = array("i", [0] * 4)
+
+    def height(self):
+        return self._height
+
+    def baseline(self):
+        return self._baseline
+
+    def max_width(self):
+        return self._max_width
+
+    def hmap(self):
+        return True
+
+    def reverse(self):
+        return False
+
+    def get_ch(self, ch):
+        """Return (MONO_HLSB glyph bytearray, height, width); unknown characters get the default glyph."""
+        i = self._glyphs.get(ch, self._default)
+        _, width, start = struct.unpack_from(ENTRY_FMT, self._index, i * ENTRY_SIZE)
+        end = struct.unpack_from(ENTRY_FMT, self._index, (i + 1) * ENTRY_SIZE)[2]
+        n = end - start
+
+        src = self._src
+        with open(self.path, "rb") as f:
+            f.seek(self._data + start)
+            f.readinto(memoryview(src)[:n])
+
+        stride = (width - 1) // 8 + 1
+        glyph = bytearray(stride * self._height)
+        p = self._p
+        p[0] = n
+        p[1] = width
+        p[2] = stride
+        p[3] = width * self._height
+        _decode_runs(glyph, src, p)
+        return glyph, self._height, width
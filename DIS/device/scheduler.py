@@ -0,0 +1,51 @@
+import uasyncio as asyncio
+import utime as time
+
+
+class Periodic:
+    """
+    Fixed-rate release for a uasyncio task with deadline-miss accounting.
+
+    Each run is released period_ms after the previous release. A run that
+    starts a whole period late (the task overran or another task hogged the
+    CPU) counts as a miss, and the schedule restarts from now instead of
+    bursting through the skipped slots.
+
+        tick = Periodic("buttons", 10)
+        while True:
+            await tick.wait()
+            ...
+    """
+    def __init__(self, name, period_ms):
+        self.name = name
+        self.period_ms = period_ms
+        self.runs = 0
+        self.misses = 0
+        self.max_late_ms = 0
+        self._next = time.ticks_ms()
+
+    async def wait(self):
+        release = time.ticks_add(self._next, self.period_ms)
+        delay = time.ticks_diff(release, time.ticks_ms())
+        await asyncio.sleep_ms(delay if delay > 0 else 0)
+        late = time.ticks_diff(time.ticks_ms(), release)
+        if late > self.max_late_ms:
+            self.max_late_ms = late
+        if late >= self.period_ms:
+            self.misses += 1
+            release = time.ticks_ms()
+        self._next = release
+        self.runs += 1
+
+    def restart(self):
+        """Next release one period from now, e.g. after the task slept on an event."""
+        self._next = time.ticks_ms()
+
+    def summary(self):
+        """'name runs/misses late<=Nms' for the stats log line."""
+        return f"{self.name} {self.runs}/{self.misses} late<={self.max_late_ms}ms"
+
+    def reset(self):
+        self.runs = 0
+        self.misses = 0
+        self.max_late_ms = 0
@@ -0,0 +1,130 @@
+import micropython
+from array import array
+
+
+@micropython.viper
+def _copy_sprite(dst, src, p) -> int:
+    """
+    Opaque copy of MONO_HMSB sprite rows into a MONO_HMSB framebuffer.
+    p = [dst index of first byte, src index of first row, rows, dst stride,
+         src stride, bit shift, first byte, end byte, left mask, right mask, bytes per row]
+    """
+    d = ptr8(dst)
+    s = ptr8(src)
+    a = ptr32(p)
+    di = int(a[0])
+    si = int(a[1])
+    rows = int(a[2])
+    dstride = int(a[3])
+    sstride = int(a[4])
+    shift = int(a[5])
+    k0 = int(a[6])
+    k1 = int(a[7])
+    lmask = int(a[8])
+    rmask = int(a[9])
+    last = int(a[10]) - 1
+    r = 0
+    while r < rows:
+        k = k0
+        o = di
+        while k < k1:
+            v = 0
+            if k < sstride:
+                v = s[si + k] << shift
+            if k > 0 and shift:
+                v |= s[si + k - 1] >> (8 - shift)
+            m = 0xFF
+            if k == 0:
+                m = lmask
+            if k == last:
+                m &= rmask
+            d[o] = (d[o] & (m ^ 0xFF)) | (v & m)
+            k += 1
+            o += 1
+        di += dstride
+        si += sstride
+        r += 1
+    return rows
+
+
+class SpriteAtlas:
+    """
+    Writer-compatible renderer for a baked glyph atlas (DIS/host/build_atlas.py).
+    Glyph rows are copied straight into the MONO_HMSB framebuffer instead of
+    being decoded through get_ch() and FrameBuffer.blit().
+    """
+    def __init__(self, device, atlas):
+        self.device = device
+        self.height = atlas.height()
+        self.stride = atlas.stride()
+        self._src = atlas.atlas
+        self._widths = atlas.widths
+        self._index = {c: i for i, c in enumerate(atlas.chars())}
+        self._glyph_bytes = self.height * self.stride
+
+        self._dst = device.buffer
+        self._dst_stride = device.width // 8
+        self._dst_height = device.height
+        self._p = array("i", [0] * 11)
+
+        self.col = 0
+        self.row = 0
+
+    # -------------- Writer-compatible interface ---------------------------
+
+    def set_wrap(self, wrap):
+        pass  # digits are placed in fixed slots; nothing wraps
+
+    def set_textpos(self, col, row):
+        self.col = col
+        self.row = row
+
+    def printstring(self, s, invert=False):
+        for c in s:
+            i = self._index.get(c)
+            if i is None:
+                continue  # unsupported character
+            self.draw(i, self.col, self.row)
+            self.col += self._widths[i]
+
+    def stringlen(self, s):
+        l = 0
+        for c in s:
+            i = self._index.get(c)
+            if i is not None:
+                l += self._widths[i]
+        return l
+
+    # ----------------- Block copy ---------------------
+
+    def draw(self, i, x, y):
+        """Copy glyph i with its top-left corner at (x, y), clipped to the screen."""
+        h = self.height
+        w = self._widths[i]
+        r0 = -y if y < 0 else 0
+        r1 = self._dst_height - y if y + h > self._dst_height else h
+        if r1 <= r0:
+            return
+
+        dstride = self._dst_stride
+        shift = x & 7
+        bx = x >> 3
+        nb = (shift + w + 7) >> 3
+        k0 = -bx if bx < 0 else 0
+        k1 = dstride - bx if bx + nb > dstride else nb
+        if k1 <= k0:
+            return
+
+        p = self._p
+        p[0] = (y + r0) * dstride + bx + k0
+        p[1] = i * self._glyph_bytes + r0 * self.stride
+        p[2] = r1 - r0
+        p[3] = dstride
+        p[4] = self.stride
+        p[5] = shift
+        p[6] = k0
+        p[7] = k1
+        p[8] = (0xFF << shift) & 0xFF
+        p[9] = (1 << (shift + w - 8 * (nb - 1))) - 1
+        p[10] = nb
+        _copy_sprite(self._dst, self._src, p)
@@ -1,7 +1,132 @@
+import micropython
+import struct
+from array import array
+from micropython import const
+
+# ------- Receive ring buffer -------
+# Power of two so indices wrap with a mask; one slot is kept free so that
+# head == tail always means "empty". Lines are consumed after every read,
+# so the ring only ever holds one partial line plus one read chunk.
+RX_RING_SIZE = const(128)
+RX_MASK = const(RX_RING_SIZE - 1)
+
+# Legacy ASCII line: s VVV CCCCCC RRR DDD TTT E
+LINE_MIN_LEN = 20
+# (offset, width) of each field after the 's'; the last runs to the end of the line
+LINE_FIELDS = bytes((1, 3, 4, 6, 10, 3, 13, 3, 16, 3, 19, 0))
+
+# ------- Binary telemetry frame (see send_telemetry_frame() in easycontroller.c) -------
+# sync, version, seq, voltage [0.1 V], current [mA], rpm, duty [%], throttle [%],
+# flags (bit 0 = eco), commutation edges (u32, cumulative, wraps),
+# CRC-16/CCITT over every preceding byte. Little-endian.
+# Version 1 frames (no edge count) from older controller firmware are still accepted.
+FRAME_SYNC = const(0xA5)  # never appears in the printable ASCII protocol
+FRAME_VERSION = 2
+FRAME_FMT = "<BBBHhHBBBIH"
+FRAME_LEN = struct.calcsize(FRAME_FMT)
+FRAME_FMT_V1 = "<BBBHhHBBBH"
+FRAME_LEN_V1 = struct.calcsize(FRAME_FMT_V1)
+FLAG_ECO = 0x01
+
+
+def _make_crc_table():
+    table = array("H", [0] * 256)
+    for i in range(256):
+        crc = i << 8
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x1021) if crc & 0x8000 else (crc << 1)
+        table[i] = crc & 0xFFFF
+    return table
+
+_CRC_TABLE = _make_crc_table()
+
+
+@micropython.viper
+def _copy_bytes(dst, at: int, src, start: int, n: int):
+    """dst[at:at + n] = src[start:start + n] without allocating a slice."""
+    d = ptr8(dst)
+    s = ptr8(src)
+    i = 0
+    while i < n:
+        d[at + i] = s[start + i]
+        i += 1
+
+
+@micropython.viper
+def _scan_line(ring, i: int, head: int) -> int:
+    """Index of the first newline or sync byte from i up to head, else head."""
+    buf = ptr8(ring)
+    while i != head:
+        b = buf[i]
+        if b == 10 or b == FRAME_SYNC:
+            break
+        i = (i + 1) & RX_MASK
+    return i
+
+
+@micropython.viper
+def _decode_line(ring, start: int, length: int, layout, out) -> int:
+    """
+    Decode the signed decimal fields of the line at ring index start into
+    out, one per (offset, width) pair in layout; width 0 runs to the end of
+    the line. Fields may hold spaces and a leading '-'. Returns 0 if a byte
+    is anything else or a field has no digits.
+    """
+    buf = ptr8(ring)
+    spec = ptr8(layout)
+    vals = ptr32(out)
+    fields = int(len(layout)) >> 1
+    f = 0
+    while f < fields:
+        pos = start + spec[f * 2]
+        n = spec[f * 2 + 1]
+        if n == 0:
+            n = length - spec[f * 2]
+        val = 0
+        neg = 0
+        seen = 0
+        while n > 0:
+            b = buf[pos & RX_MASK]
+            if b >= 48 and b <= 57:
+                val = val * 10 + b - 48
+                seen = 1
+            elif b == 45 and seen == 0 and neg == 0:
+                neg = 1
+            elif b != 32:
+                return 0
+            pos += 1
+            n -= 1
+        if seen == 0:
+            return 0
+        vals[f] = -val if neg else val
+        f += 1
+    return 1
+
+
+def crc16_ccitt(buf, n, crc=0xFFFF):
+    """CRC-16/CCITT-FALSE (poly 0x1021, init 0xFFFF) over the first n bytes of buf."""
+    table = _CRC_TABLE
+    for i in range(n):
+        crc = ((crc << 8) & 0xFFFF) ^ table[((crc >> 8) ^ buf[i]) & 0xFF]
+    return crc
+
+
 class UartManager:
     def __init__(self, uart_instance):
         self.uart = uart_instance
-        self.buffer = ""
+
+        # Preallocated receive storage; nothing below grows at runtime
+        self._ring = bytearray(RX_RING_SIZE)
+        # One view per start offset so update()'s readinto() never has to
+        # slice at runtime. Built on the first update(): feed(), main.py's
+        # default path, never uses them, and they take ~3 KiB
+        self._views = None
+        self._head = 0  # next write index
+        self._tail = 0  # start of the oldest unconsumed byte
+        self._scan = 0  # next index to check for a newline
+        self._frame = bytearray(FRAME_LEN)  # contiguous copy of a binary frame
+        self._fields = array("i", [0] * (len(LINE_FIELDS) // 2))  # decoded ASCII fields
+        self._last_seq = -1
 
         # Live values
         self.voltage = 0.0
@@ -12,6 +137,17 @@ class UartManager:
         self.eco = False
         self.uart_blink = False
         self.new_data = False # Flag to indicate if new data was parsed
+        self.edges = 0          # controller's cumulative commutation edge count
+        self.has_edges = False  # True once a version 2 frame supplied edges
+        self.on_message = None  # optional callback(manager) after every decoded message
+
+        # Link statistics
+        self.bytes_received = 0
+        self.parse_errors = 0
+        self.overruns = 0
+        self.binary_frames = 0
+        self.crc_errors = 0
+        self.dropped_frames = 0
 
     def update(self):
         """
@@ -19,34 +155,183 @@ class UartManager:
         Should be called once per main loop iteration.
         """
         self.new_data = False
-        if self.uart.any():
-            data = self.uart.read()
-            if data:
-                # Convert bytes to printable characters
-                for b in data:
-                    if 32 <= b <= 126 or b == 10:
-                        self.buffer += chr(b)
-
-                # Process complete lines
-                while "\n" in self.buffer:
-                    line, self.buffer = self.buffer.split("\n", 1)
-                    line = line.strip()
-                    if not line:
-                        continue
-
-                    self._parse_line(line)
-                    self.new_data = True
-                    self.uart_blink = not self.uart_blink
-
-    def _parse_line(self, line):
-        """Parses a single line of data from the UART."""
-        try:
-            if line.startswith("s"):
-                self.voltage = float(line[1:4]) / 10
-                self.current = float(line[4:10]) / 1000
-                self.rpm = int(line[10:13])
-                self.duty = int(line[13:16])
-                self.throttle = int(line[16:19])
-                self.eco = bool(int(line[19:]))
-        except Exception as e:
-            print("Parse error:", e, "on line:", line)
\ No newline at end of file
+        if self._views is None:
+            self._views = self._make_views()
+        n = self.uart.any()
+        while n > 0:
+            # Read straight into the ring, up to the wrap point
+            chunk = self._reserve()
+            if chunk > n: chunk = n
+            got = self.uart.readinto(self._views[self._head], chunk)
+            if not got:
+                break
+            n -= got
+            self._commit(got)
+
+    def _make_views(self):
+        mv = memoryview(self._ring)
+        return tuple(mv[i:] for i in range(RX_RING_SIZE))
+
+    def feed(self, buf, n):
+        """
+        Parse n bytes the caller already read from the UART, e.g. through a
+        uasyncio StreamReader. Sets new_data when a message completes but,
+        unlike update(), never clears it; the consumer does that.
+        """
+        ring = self._ring
+        i = 0
+        while i < n:
+            chunk = self._reserve()
+            if chunk > n - i: chunk = n - i
+            _copy_bytes(ring, self._head, buf, i, chunk)
+            i += chunk
+            self._commit(chunk)
+
+    def _reserve(self):
+        """Free bytes from head up to the wrap point; a full ring is dropped first."""
+        head = self._head
+        free = (self._tail - head - 1) & RX_MASK
+        if free == 0:
+            # A full ring with no newline is garbage; start over
+            self._tail = self._scan = head
+            self.overruns += 1
+            free = RX_MASK
+        chunk = RX_RING_SIZE - head
+        return chunk if chunk < free else free
+
+    def _commit(self, got):
+        self._head = (self._head + got) & RX_MASK
+        self.bytes_received += got
+        self._consume()
+
+    def _consume(self):
+        """
+        Parse every complete message in the ring. A sync byte starts a binary
+        frame; anything else is treated as a legacy ASCII line up to its newline.
+        """
+        ring = self._ring
+        while self._tail != self._head:
+            tail = self._tail
+            if ring[tail] == FRAME_SYNC:
+                if not self._take_frame(tail):
+                    break  # frame not fully received yet
+                continue
+
+            head = self._head
+            i = _scan_line(ring, self._scan, head)
+            self._scan = i
+            if i == head:
+                break
+            if ring[i] == 10:
+                self._handle_line(tail, i)
+                i = (i + 1) & RX_MASK
+            # else: a binary frame cut the line short, drop the fragment
+            self._tail = self._scan = i
+
+    def _take_frame(self, tail):
+        """
+        Validate and decode the binary frame starting at ring index tail.
+        Returns False if more bytes are needed. On a bad version or CRC only
+        the sync byte is dropped so the scan can resynchronise.
+        """
+        ring = self._ring
+        avail = (self._head - tail) & RX_MASK
+        if avail < 2:
+            return False
+        version = ring[(tail + 1) & RX_MASK]
+        if version == FRAME_VERSION:
+            length = FRAME_LEN
+        elif version == 1:
+            length = FRAME_LEN_V1
+        else:
+            self.parse_errors += 1
+            self._tail = self._scan = (tail + 1) & RX_MASK
+            return True
+        if avail < length:
+            return False
+
+        frame = self._frame
+        for k in range(length):
+            frame[k] = ring[(tail + k) & RX_MASK]
+        if crc16_ccitt(frame, length - 2) != frame[length - 2] | (frame[length - 1] << 8):
+            self.crc_errors += 1
+            self._tail = self._scan = (tail + 1) & RX_MASK
+            return True
+
+        self._tail = self._scan = (tail + length) & RX_MASK
+        self._parse_frame(version)
+        self.new_data = True
+        self.uart_blink = not self.uart_blink
+        if self.on_message:
+            self.on_message(self)
+        return True
+
+    def _parse_frame(self, version):
+        """Decode a CRC-checked binary frame from the preallocated frame buffer."""
+        if version == FRAME_VERSION:
+            _, _, seq, voltage, current, rpm, duty, throttle, flags, edges, _ = \
+                struct.unpack_from(FRAME_FMT, self._frame)
+            self.edges = edges
+            self.has_edges = True
+        else:
+            _, _, seq, voltage, current, rpm, duty, throttle, flags, _ = \
+                struct.unpack_from(FRAME_FMT_V1, self._frame)
+
+        if self._last_seq >= 0:
+            self.dropped_frames += (seq - self._last_seq - 1) & 0xFF
+        self._last_seq = seq
+        self.binary_frames += 1
+
+        self.voltage = voltage / 10
+        self.current = current / 1000
+        self.rpm = rpm
+        self.duty = duty
+        self.throttle = throttle
+        self.eco = (flags & FLAG_ECO) != 0
+
+    def _handle_line(self, start, end):
+        """Trim whitespace from ring[start:end] and parse it if anything is left."""
+        ring = self._ring
+        while start != end and ring[start] <= 32:
+            start = (start + 1) & RX_MASK
+        while end != start and ring[(end - 1) & RX_MASK] <= 32:
+            end = (end - 1) & RX_MASK
+        length = (end - start) & RX_MASK
+        if not length:
+            return
+
+        if self._parse_line(start, length):
+            if self.on_message:
+                self.on_message(self)
+        self.new_data = True
+        self.uart_blink = not self.uart_blink
+
+    def _parse_line(self, start, length):
+        """Parses a single line of data straight out of the ring buffer. Returns True if it decoded."""
+        if self._ring[start] != 115:  # 's'
+            return False
+        if length < LINE_MIN_LEN:
+            self.parse_errors += 1
+            print("Parse error on line:", self._line_bytes(start, length))
+            return False
+
+        fields = self._fields
+        if not _decode_line(self._ring, start, length, LINE_FIELDS, fields):
+            self.parse_errors += 1
+            print("Parse error on line:", self._line_bytes(start, length))
+            return False
+
+        self.voltage = fields[0] / 10
+        self.current = fields[1] / 1000
+        self.rpm = fields[2]
+        self.duty = fields[3]
+        self.throttle = fields[4]
+        self.eco = fields[5] != 0
+        return True
+
+    def _line_bytes(self, start, length):
+        """Copy a line out of the ring (error path only)."""
+        out = bytearray(length)
+        for k in range(length):
+            out[k] = self._ring[(start + k) & RX_MASK]
+        return bytes(out)
@@ -1,7 +1,59 @@
 import framebuf
 
+# Default glyph cache budget per font: bitmap bytes plus object overhead.
+GLYPH_CACHE_BYTES = 3072
+_GLYPH_OVERHEAD = 32  # approx. FrameBuffer + bytearray + tuple headers
+
+# One cache per font module, shared by every Writer using that font
+_font_caches = {}
+
+
+class _GlyphCache:
+    """
+    Ready-to-blit glyph FrameBuffers for one font, keyed by character.
+    Entries past the byte budget are evicted oldest-first.
+    """
+    def __init__(self, font, fmt, max_bytes):
+        self.font = font
+        self.map = fmt
+        self.max_bytes = max_bytes
+        self.glyphs = {}
+        self.order = []
+        self.bytes = 0
+        self.misses = 0
+
+    def get(self, c):
+        """Return (framebuffer, height, width, size) for c, or None if unsupported."""
+        entry = self.glyphs.get(c)
+        if entry is None:
+            entry = self._load(c)
+        return entry
+
+    def _load(self, c):
+        glyph, ht, wd = self.font.get_ch(c)
+        if glyph is None:
+            return None
+        self.misses += 1
+
+        # FrameBuffer needs it writable: copy font_to_py's memoryview, keep
+        # an RleFont's freshly decoded bytearray as is
+        buf = glyph if isinstance(glyph, bytearray) else bytearray(glyph)
+        size = len(buf) + _GLYPH_OVERHEAD
+        entry = (framebuf.FrameBuffer(buf, wd, ht, self.map), ht, wd, size)
+        if size > self.max_bytes:
+            return entry  # too big to ever cache; draw it uncached
+
+        while self.bytes + size > self.max_bytes:
+            old = self.order.pop(0)
+            self.bytes -= self.glyphs.pop(old)[3]
+        self.glyphs[c] = entry
+        self.order.append(c)
+        self.bytes += size
+        return entry
+
+
 class Writer:
-    def __init__(self, device, font, verbose = True):
+    def __init__(self, device, font, verbose = True, cache_bytes=GLYPH_CACHE_BYTES):
         self.device = device
         self.font = font
 
@@ -9,6 +61,13 @@ class Writer:
         # So we render as MONO_HMSB directly.
         self.map = framebuf.MONO_HLSB
 
+        cache = _font_caches.get(font)
+        if cache is None:
+            cache = _font_caches[font] = _GlyphCache(font, self.map, cache_bytes)
+        elif cache_bytes > cache.max_bytes:
+            cache.max_bytes = cache_bytes
+        self._cache = cache
+
         self.height = font.height()
         self.reverse = font.reverse()  # will be False here
 
@@ -46,6 +105,11 @@ class Writer:
     def home(self):
         self.set_textpos(0, 0)
 
+    def warm(self, chars):
+        """Pre-render glyphs so the first frame that draws them doesn't allocate."""
+        for c in chars:
+            self._cache.get(c)
+
     # ----------------- Printing ---------------------
 
     def _newline(self):
@@ -67,9 +131,10 @@ class Writer:
             self.col = (self.col + self.tab) // self.tab * self.tab
             return
 
-        glyph, ht, wd = self.font.get_ch(c)
-        if glyph is None:
+        entry = self._cache.get(c)
+        if entry is None:
             return  # unsupported character
+        fbc, ht, wd, _ = entry
 
         # Wrap / clip checks
         if self.col + wd > self.device.width:
@@ -100,9 +165,6 @@ class Writer:
         if style & 1:
             color = 0 if color else 1
 
-        buf = bytearray(glyph)   # memoryview → bytes
-        fbc = framebuf.FrameBuffer(buf, wd, ht, self.map)
-
         self.device.blit(fbc, self.col, self.row, -1)
 
         if style & 2:
@@ -114,9 +176,10 @@ class Writer:
     # ------------ Metrics ------------
 
     def stringlen(self, s):
+        # Measured strings are about to be drawn, so load glyphs through the cache
         l = 0
         for c in s:
-            glyph, ht, wd = self.font.get_ch(c)
-            if glyph:
-                l += wd
+            entry = self._cache.get(c)
+            if entry is not None:
+                l += entry[2]
         return l
@@ -0,0 +1,366 @@
+"""
+Season log analysis: energy, efficiency and pacing from telemetry logs.
+
+Loads flight recorder logs (logs/run*.bin from the DIS, memory-mapped) and
+raw serial captures of controller output (ASCII lines and/or binary
+frames) into NumPy column arrays and computes, per run: energy [Wh],
+mi/kWh, average power, eco-mode duty, a time-weighted current histogram,
+per-lap splits and pacing error against main.py's target speed
+(remaining distance / remaining time). Every metric is a handful of array
+operations, so a season of runs takes seconds.
+
+    python DIS/host/analyze.py LOG|DIR [...] [--out summary.csv] [--laps laps.csv]
+                               [--hist hist.csv] [--lap-mi MI] [--goal-mi MI]
+                               [--goal-min MIN] [--period S] [--parquet DIR]
+
+Directories are searched for *.bin recorder logs and *.cap / *.txt
+captures. A file is read as a recorder log if it starts with the
+recorder's magic, whatever its name, and as a capture otherwise, so a
+raw binary capture saved as .bin still loads. Captures carry no timestamps, so their messages are spaced
+--period apart like the controller sends them. Needs NumPy; --parquet
+also needs pyarrow.
+"""
+import argparse
+import os
+import struct
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    sys.exit("analyze.py needs NumPy: pip install numpy")
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import emu  # noqa: E402
+
+emu.install()
+
+from derived import INCHES_PER_MILE, mph_from_rpm  # noqa: E402
+from odometry import EDGES_PER_REV, MAX_EDGE_DELTA  # noqa: E402
+from recorder import CM_PER_MILE, FLAG_ECO, HEADER_FMT, MAGIC, RECORD_SIZE, read_header  # noqa: E402
+from uart_manager import FLAG_ECO as FRAME_FLAG_ECO, FRAME_LEN, FRAME_LEN_V1, FRAME_SYNC, crc16_ccitt  # noqa: E402
+from emu.telemetry import CONTROLLER_PERIOD_S  # noqa: E402
+
+# main.py race setup
+RACE_DISTANCE_MI = 1
+RACE_TIME_MIN = 4
+WHEEL_DIAMETER_IN = 16
+
+# recorder.RECORD_FMT as a NumPy record
+RECORD_DTYPE = np.dtype([("t_ms", "<u4"), ("dist_cm", "<u4"), ("voltage", "<u2"), ("current", "<i2"),
+                         ("rpm", "<u2"), ("duty", "u1"), ("throttle", "u1")])
+assert RECORD_DTYPE.itemsize == RECORD_SIZE
+
+# uart_manager.FRAME_FMT / FRAME_FMT_V1, from the voltage field on
+FRAME_FIELDS = [("voltage", "<u2"), ("current", "<i2"), ("rpm", "<u2"), ("duty", "u1"),
+                ("throttle", "u1"), ("flags", "u1")]
+FRAME_V2_DTYPE = np.dtype([("sync", "u1"), ("version", "u1"), ("seq", "u1")] + FRAME_FIELDS
+                          + [("edges", "<u4"), ("crc", "<u2")])
+FRAME_V1_DTYPE = np.dtype([("sync", "u1"), ("version", "u1"), ("seq", "u1")] + FRAME_FIELDS
+                          + [("crc", "<u2")])
+assert FRAME_V2_DTYPE.itemsize == FRAME_LEN and FRAME_V1_DTYPE.itemsize == FRAME_LEN_V1
+
+# Legacy ASCII line: s VVV CCCCCC RRR DDD TTT E, fixed width
+LINE_LEN = 20
+LINE_FIELDS = ((1, 3), (4, 6), (10, 3), (13, 3), (16, 3), (19, 1))
+
+CURRENT_BINS = np.arange(-2.0, 32.0, 2.0)  # A
+
+SUMMARY_COLUMNS = ("run", "source", "samples", "duration_s", "distance_mi", "energy_wh", "mi_per_kwh",
+                   "avg_power_w", "peak_current_a", "avg_mph", "eco_duty", "pace_err_mph",
+                   "pace_rms_mph", "below_target")
+LAP_COLUMNS = ("run", "lap", "start_s", "time_s", "energy_wh", "mi_per_kwh", "avg_mph")
+
+
+# ---------------- Loaders ----------------
+
+def is_recorder_log(path):
+    """True if the file starts with the flight recorder's magic."""
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def load_recorder(path):
+    """Memory-map a flight recorder log into columns."""
+    with open(path, "rb") as f:
+        head = f.read(struct.calcsize(HEADER_FMT))
+    version, record_size, header_size, _, _, _ = read_header(head)
+    if record_size != RECORD_SIZE:
+        raise ValueError("{}: record size {} (this tool reads {})".format(path, record_size, RECORD_SIZE))
+    count = (os.path.getsize(path) - header_size) // record_size
+    if count <= 0:
+        return None
+    rec = np.memmap(path, dtype=RECORD_DTYPE, mode="r", offset=header_size, shape=(count,))
+    distance = rec["dist_cm"] / CM_PER_MILE
+    if version < 2:
+        # Version 1 logged the trip distance, which drops to 0 on a timer
+        # reset and holds while the timer is paused; add up its rises only
+        rise = np.maximum(np.diff(distance, prepend=distance[0]), 0)
+        distance = np.cumsum(rise)
+    return {
+        "t": rec["t_ms"] / 1000.0,
+        "voltage": rec["voltage"] / 10.0,
+        "current": rec["current"] / 100.0,
+        "rpm": rec["rpm"].astype(np.float64),
+        "duty": rec["duty"].astype(np.float64),
+        "throttle": (rec["throttle"] & 0x7F).astype(np.float64),
+        "eco": (rec["throttle"] & FLAG_ECO) != 0,
+        "distance": distance,
+    }
+
+
+def _crc_ok(rows, length):
+    """CRC-16/CCITT-FALSE of every row of an (n, length) byte matrix, checked in one pass per column."""
+    # One-byte CRCs from a zero seed are exactly the lookup table
+    table = np.array([crc16_ccitt(bytes((i,)), 1, 0) for i in range(256)], dtype=np.uint32)
+    crc = np.full(rows.shape[0], 0xFFFF, dtype=np.uint32)
+    for k in range(length - 2):
+        crc = ((crc << 8) & 0xFFFF) ^ table[((crc >> 8) ^ rows[:, k]) & 0xFF]
+    return crc == (rows[:, length - 2].astype(np.uint32) | (rows[:, length - 1].astype(np.uint32) << 8))
+
+
+def _frames(buf, version, length, dtype):
+    """(byte offsets, decoded records) of every CRC-valid frame of one version."""
+    n = len(buf)
+    starts = np.flatnonzero(buf[:n - length + 1] == FRAME_SYNC) if n >= length else np.zeros(0, np.intp)
+    starts = starts[buf[starts + 1] == version]
+    rows = buf[starts[:, None] + np.arange(length)]
+    starts = starts[_crc_ok(rows, length)]
+    # A sync byte inside a payload that happens to pass the CRC would start
+    # inside the frame before it; drop those
+    if len(starts) > 1:
+        keep = np.ones(len(starts), bool)
+        keep[1:] = starts[1:] >= starts[:-1] + length
+        starts = starts[keep]
+    rows = np.ascontiguousarray(buf[starts[:, None] + np.arange(length)])
+    return starts, rows.view(dtype).reshape(-1)
+
+
+def _lines(buf):
+    """(byte offsets, field matrix) of every well-formed ASCII telemetry line."""
+    # Lines are fixed width, so each one is the LINE_LEN bytes before its
+    # newline; that also holds when a binary frame comes right before it
+    end = np.flatnonzero(buf == 10)
+    end[(end > 0) & (buf[np.maximum(end - 1, 0)] == 13)] -= 1  # \r\n
+    start = end - LINE_LEN
+    start = start[start >= 0]
+    start = start[buf[start] == ord("s")]
+    chars = buf[start[:, None] + np.arange(LINE_LEN)].astype(np.int64)
+    digits = chars - 48
+    valid = ((digits >= 0) & (digits <= 9)) | (chars == 32) | (chars == 45)
+    ok = valid[:, 1:].all(axis=1)
+    start, chars, digits = start[ok], chars[ok], digits[ok]
+    fields = np.empty((len(start), len(LINE_FIELDS)))
+    for j, (pos, width) in enumerate(LINE_FIELDS):
+        d = digits[:, pos:pos + width]
+        d = np.where((d >= 0) & (d <= 9), d, 0)
+        value = d @ (10 ** np.arange(width - 1, -1, -1))
+        fields[:, j] = np.where((chars[:, pos:pos + width] == 45).any(axis=1), -value, value)
+    return start, fields
+
+
+def load_capture(path, period_s=CONTROLLER_PERIOD_S, wheel_circumference_in=np.pi * WHEEL_DIAMETER_IN):
+    """Decode a raw serial capture (ASCII lines and binary frames, any mix) into columns."""
+    buf = np.fromfile(path, dtype=np.uint8)
+    parts = []
+    for version, length, dtype in ((2, FRAME_LEN, FRAME_V2_DTYPE), (1, FRAME_LEN_V1, FRAME_V1_DTYPE)):
+        at, f = _frames(buf, version, length, dtype)
+        edges = f["edges"].astype(np.float64) if version == 2 else np.full(len(at), np.nan)
+        parts.append((at, f["voltage"] / 10.0, f["current"] / 1000.0, f["rpm"], f["duty"], f["throttle"],
+                      (f["flags"] & FRAME_FLAG_ECO) != 0, edges))
+    at, fl = _lines(buf)
+    parts.append((at, fl[:, 0] / 10.0, fl[:, 1] / 1000.0, fl[:, 2], fl[:, 3], fl[:, 4], fl[:, 5] != 0,
+                  np.full(len(at), np.nan)))
+
+    cols = [np.concatenate([p[i] for p in parts]) for i in range(8)]
+    if not len(cols[0]):
+        return None
+    order = np.argsort(cols[0], kind="stable")  # back into wire order
+    at, voltage, current, rpm, duty, throttle, eco, edges = (c[order] for c in cols)
+    t = np.arange(len(at)) * period_s
+    rpm = rpm.astype(np.float64)
+    mph = mph_from_rpm(rpm, wheel_circumference_in)
+
+    # Distance: counted edges between the first and last frame that carries
+    # them (messages in between are interpolated), trapezoidal mph x dt like
+    # the device fallback before and after, where only ASCII lines or v1
+    # frames arrived
+    distance = _cumtrapz(mph, t) / 3600
+    has = np.isfinite(edges)
+    if has.any():
+        e = edges[has].astype(np.int64)
+        delta = np.zeros(len(e), np.int64)
+        delta[1:] = (e[1:] - e[:-1]) & 0xFFFFFFFF
+        reset = delta > MAX_EDGE_DELTA  # controller rebooted: count restarted from zero
+        delta[reset] = np.where(e[reset] <= MAX_EDGE_DELTA, e[reset], 0)
+        counted = np.cumsum(delta) * wheel_circumference_in / EDGES_PER_REV / INCHES_PER_MILE
+        first, last = np.flatnonzero(has)[[0, -1]]
+        after = distance[last + 1:] - distance[last]
+        distance[first:last + 1] = distance[first] + np.interp(t[first:last + 1], t[has], counted)
+        distance[last + 1:] = distance[last] + after
+    return {
+        "t": t, "voltage": voltage, "current": current, "rpm": rpm,
+        "duty": duty.astype(np.float64), "throttle": throttle.astype(np.float64),
+        "eco": eco, "distance": distance,
+    }
+
+
+# ---------------- Metrics ----------------
+
+def _cumtrapz(y, t):
+    out = np.zeros(len(t))
+    out[1:] = np.cumsum((y[1:] + y[:-1]) / 2 * np.diff(t))
+    return out
+
+
+def analyze(run, cols, wheel_circumference_in, goal_mi, goal_s, lap_mi):
+    """Summary row, lap rows and current histogram for one run."""
+    t = cols["t"]
+    t = t - t[0]
+    dt = np.diff(t, append=t[-1])  # time each sample was current
+    total_t = t[-1]
+    power = cols["voltage"] * cols["current"]
+    energy_wh = _cumtrapz(power, t) / 3600
+    distance = cols["distance"] - cols["distance"][0]
+    mph = mph_from_rpm(cols["rpm"], wheel_circumference_in)
+
+    # Same formula as derived.remaining()/target_speed(), timer started at t=0
+    rem_d = np.maximum(goal_mi - distance, 0)
+    rem_t = np.maximum(goal_s - t, 0.001)
+    target = rem_d / (rem_t / 3600)
+    racing = (t < goal_s) & (rem_d > 0)
+    err = (mph - target)[racing]
+    w = dt[racing]
+
+    dist = distance[-1]
+    wh = energy_wh[-1]
+    weight = dt.sum() or 1.0
+    summary = {
+        "run": run,
+        "samples": len(t),
+        "duration_s": total_t,
+        "distance_mi": dist,
+        "energy_wh": wh,
+        "mi_per_kwh": dist / (wh / 1000) if wh > 0 else float("nan"),
+        "avg_power_w": wh * 3600 / total_t if total_t > 0 else float("nan"),
+        "peak_current_a": float(cols["current"].max()),
+        "avg_mph": dist / (total_t / 3600) if total_t > 0 else float("nan"),
+        "eco_duty": float((dt * cols["eco"]).sum() / weight),
+        "pace_err_mph": float((err * w).sum() / w.sum()) if w.sum() else float("nan"),
+        "pace_rms_mph": float(np.sqrt((err * err * w).sum() / w.sum())) if w.sum() else float("nan"),
+        "below_target": float(w[err < 0].sum() / w.sum()) if w.sum() else float("nan"),
+    }
+
+    laps = []
+    if lap_mi and dist >= lap_mi:
+        marks = np.arange(0, dist + 1e-9, lap_mi)
+        # Both loaders give a distance that never decreases, so crossings interpolate directly
+        cross_t = np.interp(marks, distance, t)
+        cross_e = np.interp(marks, distance, energy_wh)
+        lap_t = np.diff(cross_t)
+        lap_e = np.diff(cross_e)
+        for i in range(len(lap_t)):
+            laps.append({
+                "run": run, "lap": i + 1, "start_s": cross_t[i], "time_s": lap_t[i], "energy_wh": lap_e[i],
+                "mi_per_kwh": lap_mi / (lap_e[i] / 1000) if lap_e[i] > 0 else float("nan"),
+                "avg_mph": lap_mi / (lap_t[i] / 3600) if lap_t[i] > 0 else float("nan"),
+            })
+
+    hist, _ = np.histogram(cols["current"], bins=CURRENT_BINS, weights=dt)
+    return summary, laps, hist
+
+
+# ---------------- Output ----------------
+
+def _fmt(v):
+    if isinstance(v, (float, np.floating)):
+        return "{:.6g}".format(v)
+    return str(v)
+
+
+def write_csv(path, columns, rows):
+    out = open(path, "w") if path and path != "-" else sys.stdout
+    out.write(",".join(columns) + "\n")
+    for r in rows:
+        out.write(",".join(_fmt(r[c]) for c in columns) + "\n")
+    if out is not sys.stdout:
+        out.close()
+
+
+def write_parquet(path, columns, rows):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        sys.exit("--parquet needs pyarrow: pip install pyarrow")
+    pq.write_table(pa.table({c: [r[c] for r in rows] for c in columns}), path)
+
+
+def find_logs(paths):
+    for p in paths:
+        if os.path.isdir(p):
+            for name in sorted(os.listdir(p)):
+                if name.endswith((".bin", ".cap", ".txt")):
+                    yield os.path.join(p, name)
+        else:
+            yield p
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    ap.add_argument("logs", nargs="+", help="recorder logs, captures or directories of them")
+    ap.add_argument("--out", default="-", help="per-run summary CSV (default stdout)")
+    ap.add_argument("--laps", help="per-lap splits CSV")
+    ap.add_argument("--hist", help="time-weighted current histogram CSV, one row per run")
+    ap.add_argument("--parquet", metavar="DIR", help="also write summary/laps .parquet files here")
+    ap.add_argument("--lap-mi", type=float, default=0.0, help="lap length for splits (0 = none)")
+    ap.add_argument("--goal-mi", type=float, default=RACE_DISTANCE_MI, help="race distance for pacing")
+    ap.add_argument("--goal-min", type=float, default=RACE_TIME_MIN, help="race time limit for pacing")
+    ap.add_argument("--wheel-in", type=float, default=WHEEL_DIAMETER_IN, help="wheel diameter")
+    ap.add_argument("--period", type=float, default=CONTROLLER_PERIOD_S, help="capture message spacing")
+    args = ap.parse_args()
+
+    circ = np.pi * args.wheel_in
+    t0 = time.perf_counter()
+    summaries, laps, hists = [], [], []
+    samples = 0
+    for path in find_logs(args.logs):
+        run = os.path.basename(path)
+        try:
+            if is_recorder_log(path):
+                cols, source = load_recorder(path), "recorder"
+            else:
+                cols, source = load_capture(path, args.period, circ), "capture"
+        except (OSError, ValueError) as e:
+            sys.stderr.write("skipping {}: {}\n".format(path, e))
+            continue
+        if cols is None or len(cols["t"]) < 2:
+            sys.stderr.write("skipping {}: no telemetry\n".format(path))
+            continue
+        s, lap_rows, hist = analyze(run, cols, circ, args.goal_mi, args.goal_min * 60, args.lap_mi)
+        s["source"] = source
+        summaries.append(s)
+        laps.extend(lap_rows)
+        hists.append((run, hist))
+        samples += s["samples"]
+
+    write_csv(args.out, SUMMARY_COLUMNS, summaries)
+    if args.laps:
+        write_csv(args.laps, LAP_COLUMNS, laps)
+    if args.hist:
+        labels = ["{:g}..{:g}A".format(a, b) for a, b in zip(CURRENT_BINS[:-1], CURRENT_BINS[1:])]
+        write_csv(args.hist, ["run"] + labels,
+                  [dict(zip(["run"] + labels, [run] + list(h))) for run, h in hists])
+    if args.parquet:
+        os.makedirs(args.parquet, exist_ok=True)
+        write_parquet(os.path.join(args.parquet, "summary.parquet"), SUMMARY_COLUMNS, summaries)
+        write_parquet(os.path.join(args.parquet, "laps.parquet"), LAP_COLUMNS, laps)
+    wall = time.perf_counter() - t0
+    sys.stderr.write("{} runs, {} samples in {:.2f} s ({:.0f} samples/s)\n".format(
+        len(summaries), samples, wall, samples / wall if wall else 0))
+
+
+if __name__ == "__main__":
+    main()
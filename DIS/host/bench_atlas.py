@@ -0,0 +1,95 @@
+"""
+Host-side benchmark: sprite atlas copy vs Writer + FrameBuffer.blit.
+
+Draws the DD.D, MM:SS and distance digit layouts both ways into the
+emulator's MONO_HMSB framebuffer (see emu/), checks the results are
+identical and reports time per layout and the framebuffer work each path
+does (pixels touched by blit vs bytes written by the atlas copy).
+
+    python DIS/host/bench_atlas.py [iterations]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import emu  # noqa: E402
+
+emu.install()
+import framebuf  # noqa: E402
+from fonts import atlas_digits_large, atlas_digits_med  # noqa: E402
+from fonts import font_digits_large, font_digits_med  # noqa: E402
+from sprites import SpriteAtlas  # noqa: E402
+from writer import Writer  # noqa: E402
+
+
+class Screen(framebuf.FrameBuffer):
+    """128x64 MONO_HMSB target that counts the pixels blit() sets one by one."""
+    def __init__(self):
+        self.buffer = bytearray(128 * 64 // 8)
+        super().__init__(self.buffer, 128, 64, framebuf.MONO_HMSB)
+        self.pixels_touched = 0
+
+    def _set(self, x, y, c):
+        self.pixels_touched += 1
+        super()._set(x, y, c)
+
+
+# (layout, font, [(x, y, char), ...]) using DisplayManager's slot positions
+LAYOUTS = (
+    ("DD.D", "large", ((9, 0, "4"), (43, 0, "2"), (79, 0, "."), (93, 0, "7"))),
+    ("MM:SS", "med", ((-4, 5, "1"), (26, 5, "3"), (56, -2, ":"), (68, 5, "5"), (98, 5, "9"))),
+    ("distance", "large", ((0, 0, "."), (14, 0, "8"), (53, 0, "0"), (91, 0, "6"))),
+)
+
+
+def draw(renderer, glyphs):
+    for x, y, c in glyphs:
+        renderer.set_textpos(x, y)
+        renderer.printstring(c)
+
+
+def bench(make, glyphs, iterations):
+    screen = Screen()
+    renderer = make(screen)
+    draw(renderer, glyphs)  # fill any glyph caches first
+    screen.pixels_touched = 0
+    t0 = time.perf_counter()
+    for _ in range(iterations):
+        draw(renderer, glyphs)
+    elapsed = time.perf_counter() - t0
+    return elapsed / iterations * 1e6, screen.pixels_touched // iterations, screen.buffer
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    fonts = {
+        "large": (font_digits_large, atlas_digits_large),
+        "med": (font_digits_med, atlas_digits_med),
+    }
+    print("Digit layout benchmark: {} iterations (host CPython; viper code runs interpreted)".format(iterations))
+    print("{:<10}{:<8}{:>12}{:>16}{:>14}".format("layout", "path", "us/layout", "pixels set", "bytes copied"))
+    for name, size, glyphs in LAYOUTS:
+        font, atlas = fonts[size]
+
+        def make_writer(screen, font=font):
+            w = Writer(screen, font, verbose=False)
+            w.set_wrap(False)
+            return w
+
+        def make_atlas(screen, atlas=atlas):
+            return SpriteAtlas(screen, atlas)
+
+        w_us, w_px, w_buf = bench(make_writer, glyphs, iterations)
+        a_us, _, a_buf = bench(make_atlas, glyphs, iterations)
+        assert w_buf == a_buf, "atlas output differs from Writer for " + name
+        copied = sum(atlas.height() * (((x & 7) + atlas.widths[atlas.chars().index(c)] + 7) // 8)
+                     for x, _, c in glyphs)
+        print("{:<10}{:<8}{:>12.1f}{:>16}{:>14}".format(name, "blit", w_us, w_px, "-"))
+        print("{:<10}{:<8}{:>12.1f}{:>16}{:>14}".format(name, "atlas", a_us, "-", copied))
+    print("outputs identical: yes")
+
+
+if __name__ == "__main__":
+    main()
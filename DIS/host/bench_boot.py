@@ -0,0 +1,157 @@
+"""
+Host-side boot benchmark: time from starting main.py to the splash frame,
+to the first UART parse and to the first dashboard frame.
+
+main.py runs on the emulator with the synthetic controller, in a fresh
+interpreter per run and in two modes:
+
+    source      every module compiled from .py at import, as the Pico does
+                with plain .py files on its filesystem
+    compiled    bytecode cached by an earlier run, standing in for the .mpy
+                build from build_mpy.py (main.py loaded as dis_main)
+
+Times are host wall clock (the emulator's virtual clock does not charge
+for imports), so compare them with each other, not with a Pico. The
+slowest firmware imports in source mode are listed as well (python -X
+importtime, self time).
+
+    python DIS/host/bench_boot.py [--runs N] [--top N]
+"""
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+
+HOST_DIR = os.path.dirname(os.path.abspath(__file__))
+MODES = ("source", "compiled")
+EVENTS = ("splash", "ingest", "first_frame")
+
+
+def measure():
+    """Boot main.py once in this (fresh) interpreter and print event times [ms] as JSON."""
+    import contextlib
+    import importlib.util
+    import io
+    import time
+
+    sys.path.insert(0, HOST_DIR)
+    import emu
+    from emu.__main__ import make_flash
+    from emu.board import EmulatorExit
+
+    board = emu.dis_board(speed=0, step_us=100, limit_s=1.0)
+    emu.install(board)
+    from emu.telemetry import SyntheticController  # imports odometry, so not timed below
+    SyntheticController(board).start()
+    os.chdir(make_flash(emu.DEVICE_DIR))
+    script = os.path.join(emu.DEVICE_DIR, "main.py")
+    spec = importlib.util.spec_from_file_location("dis_main", script)
+    events = {}
+
+    start = time.perf_counter()
+    # main.py's first two imports, loaded here to timestamp the firmware's
+    # own flushes and first parse; their import time still counts
+    import config
+    import uart_manager
+    show = config.OLED_1inch3.show
+    feed = uart_manager.UartManager.feed
+
+    def timed_show(self, *args, **kwargs):
+        events.setdefault("first_frame" if "splash" in events else "splash", time.perf_counter())
+        return show(self, *args, **kwargs)
+
+    def timed_feed(self, *args):
+        events.setdefault("ingest", time.perf_counter())
+        return feed(self, *args)
+
+    config.OLED_1inch3.show = timed_show
+    uart_manager.UartManager.feed = timed_feed
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            spec.loader.exec_module(importlib.util.module_from_spec(spec))
+    except EmulatorExit:
+        pass
+    print(json.dumps({k: (v - start) * 1000 for k, v in events.items()}))
+
+
+def run_child(pycache, write_bytecode, importtime=False):
+    env = dict(os.environ, PYTHONPYCACHEPREFIX=pycache)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    if not write_bytecode:
+        env["PYTHONDONTWRITEBYTECODE"] = "1"
+    cmd = [sys.executable] + (["-X", "importtime"] if importtime else []) + [os.path.abspath(__file__), "--child"]
+    proc = subprocess.run(cmd, env=env, capture_output=True, text=True, check=True)
+    return json.loads(proc.stdout.strip().splitlines()[-1]), proc.stderr
+
+
+def compile_ms(device_dir):
+    """Host time to compile every firmware source: the work .mpy files take off the device."""
+    import time
+    t0 = time.perf_counter()
+    for root, _, files in os.walk(device_dir):
+        for name in files:
+            if name.endswith(".py"):
+                path = os.path.join(root, name)
+                with open(path) as f:
+                    compile(f.read(), path, "exec")
+    return (time.perf_counter() - t0) * 1000
+
+
+def device_imports(importtime_log):
+    """(self us, module) for firmware modules in a -X importtime log, slowest first."""
+    device = set()
+    for root, _, files in os.walk(os.path.join(HOST_DIR, "..", "device")):
+        rel = os.path.relpath(root, os.path.join(HOST_DIR, "..", "device"))
+        prefix = "" if rel == "." else rel.replace(os.sep, ".") + "."
+        device.update(prefix + f[:-3] for f in files if f.endswith(".py"))
+    out = []
+    for line in importtime_log.splitlines():
+        m = re.match(r"import time:\s+(\d+) \|\s+\d+ \|\s+(\S+)", line)
+        if m and m.group(2).strip() in device:
+            out.append((int(m.group(1)), m.group(2).strip()))
+    return sorted(out, reverse=True)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    ap.add_argument("--runs", type=int, default=5, help="interpreters per mode; the median is kept")
+    ap.add_argument("--top", type=int, default=6, help="slowest firmware imports to list")
+    ap.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = ap.parse_args()
+    if args.child:
+        measure()
+        return
+
+    results = {}
+    with tempfile.TemporaryDirectory() as cached:
+        for mode in MODES:
+            runs = []
+            for _ in range(args.runs):
+                if mode == "source":
+                    with tempfile.TemporaryDirectory() as empty:
+                        runs.append(run_child(empty, False)[0])
+                else:
+                    runs.append(run_child(cached, True)[0])  # the first run fills the cache
+            if mode == "compiled":
+                runs = runs[1:] or runs
+            runs.sort(key=lambda r: r["first_frame"])
+            results[mode] = runs[len(runs) // 2]
+        with tempfile.TemporaryDirectory() as empty:
+            imports = device_imports(run_child(empty, False, importtime=True)[1])
+
+    print("Boot: host wall time from running main.py [ms], median of {} runs".format(args.runs))
+    print("{:<10}".format("") + "".join("{:>13}".format(e.replace("_", " ")) for e in EVENTS))
+    for mode in MODES:
+        r = results[mode]
+        print("{:<10}".format(mode) + "".join("{:>13.1f}".format(r.get(e, float("nan"))) for e in EVENTS))
+    print("compiling all firmware sources: {:.1f} ms".format(compile_ms(os.path.join(HOST_DIR, "..", "device"))))
+    print("slowest firmware imports from source (self time):")
+    for us, name in imports[:args.top]:
+        print("  {:<24}{:>8.1f} ms".format(name, us / 1000))
+
+
+if __name__ == "__main__":
+    main()
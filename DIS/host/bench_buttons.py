@@ -0,0 +1,114 @@
+"""
+Host-side benchmark: IRQ-driven Buttons vs the old per-frame pin polling.
+
+Runs main.py's task layout on the emulator: a render task released every
+frame_ms that blocks for draw_ms drawing, and taps KEY0 at random moments
+with random hold times. The polled path reads the key after each frame,
+as the old main loop did, so taps that fit inside a frame can vanish.
+The IRQ path is button_task: it sleeps on the Buttons ThreadSafeFlag,
+wakes as soon as the render task yields after an edge, and drains the
+queue; while a key is down it polls every BUTTON_PERIOD_MS. Reports
+presses caught and edge-to-action latency.
+
+    python DIS/host/bench_buttons.py [taps] [frame_ms] [tap_ms] [draw_ms]
+"""
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import emu  # noqa: E402
+
+PIN = emu.PIN_KEY0
+BUTTON_PERIOD_MS = 10  # as in main.py
+
+
+def schedule_taps(board, taps, tap_ms, seed=1):
+    """Random taps ~0.5 s apart; returns their press times in us."""
+    rnd = random.Random(seed)
+    t = 0.2
+    times = []
+    for _ in range(taps):
+        t += rnd.uniform(0.3, 0.7)
+        hold = rnd.uniform(0.5, 1.5) * tap_ms / 1000
+        board.press(PIN, t, hold)
+        times.append(int(t * 1e6))
+    return times, t + 1.0
+
+
+def run(mode, taps, frame_ms, tap_ms, draw_ms):
+    board = emu.dis_board(speed=0)
+    emu.install(board)
+    import uasyncio as asyncio
+    import utime as time
+    from machine import Pin
+    from buttons import Buttons, EV_DOWN
+    from scheduler import Periodic
+
+    key = Pin(PIN, Pin.IN, Pin.PULL_UP)
+    presses, end_s = schedule_taps(board, taps, tap_ms)
+    end_us = int(end_s * 1e6)
+    latencies = []
+
+    async def render_task():
+        render_period = Periodic("render", frame_ms)
+        last = key.value()
+        while board.clock.peek_us() < end_us:
+            await render_period.wait()
+            time.sleep_ms(draw_ms)  # the frame being drawn; nothing else runs
+            if mode == "polled":
+                now = time.ticks_us()
+                level = key.value()
+                if last == 1 and level == 0:
+                    # Edge happened some time during the frame; latency from the real press
+                    pressed = max(t for t in presses if t <= now)
+                    latencies.append(now - pressed)
+                last = level
+
+    async def button_task():
+        # main.py's button_task, down to the flag and BUTTON_PERIOD_MS polling
+        buttons = Buttons((key,), debounce_ms=150)
+        buttons.flag = asyncio.ThreadSafeFlag()
+        button_period = Periodic("buttons", BUTTON_PERIOD_MS)
+        while True:
+            if buttons.busy():
+                await button_period.wait()
+            else:
+                await buttons.flag.wait()  # sleep until a key IRQ
+                button_period.restart()
+            buttons.poll()
+            while True:
+                ev = buttons.get()
+                if ev is None:
+                    break
+                if ev[1] == EV_DOWN:
+                    latencies.append(ev[2])
+
+    if mode == "irq":
+        asyncio.create_task(button_task())
+    asyncio.run(render_task())
+    return latencies
+
+
+def main():
+    taps = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    frame_ms = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    tap_ms = int(sys.argv[3]) if len(sys.argv) > 3 else 60
+    draw_ms = int(sys.argv[4]) if len(sys.argv) > 4 else 30
+    print("Button benchmark: {} taps of ~{} ms, {} ms frames drawn in {} ms (emulated time)".format(
+        taps, tap_ms, frame_ms, draw_ms))
+    print("{:<8}{:>10}{:>12}{:>12}{:>12}".format("path", "caught", "avg us", "p95 us", "max us"))
+    for mode in ("polled", "irq"):
+        lat = sorted(run(mode, taps, frame_ms, tap_ms, draw_ms))
+        if lat:
+            avg = sum(lat) / len(lat)
+            p95 = lat[(len(lat) * 95 - 1) // 100]
+            print("{:<8}{:>10}{:>12.0f}{:>12}{:>12}".format(
+                mode, "{}/{}".format(len(lat), taps), avg, p95, lat[-1]))
+        else:
+            print("{:<8}{:>10}".format(mode, "0/{}".format(taps)))
+
+
+if __name__ == "__main__":
+    main()
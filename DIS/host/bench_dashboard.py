@@ -0,0 +1,126 @@
+"""
+Host-side frame-time benchmark: the composite dashboard against the
+single-value speed screen.
+
+Replays the same drive into each path on the emulated board (see emu/):
+speed wandering around the target at the 20 fps render rate, the clock
+ticking, the UART blink toggling with each controller message and the
+eco line coming and going. Each path gets its own OLED and
+DisplayManager; the first (full) frame is not timed.
+
+    draw_large_num   DisplayManager.draw_large_num(mph, "MPH", ...), as the
+                     speed screen was drawn before screens were declarative
+    MPH screen       the same screen built with number_screen()
+    dashboard        dashboard_screen(): speed, MM:SS and target delta
+
+It reports host time per frame for render plus flush (best of the
+repeats, run interleaved), the pages and SPI bytes sent per frame and their wire time, and
+checks the panel RAM matches the framebuffer.
+
+    python DIS/host/bench_dashboard.py [frames] [repeats]
+"""
+import math
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import emu  # noqa: E402
+
+SPI_HZ = 30_000_000
+FPS = 20
+TARGET_MPH = 15.2
+
+BOARD = emu.install(emu.dis_board(speed=0, step_us=0))
+import config  # noqa: E402
+
+os.chdir(emu.DEVICE_DIR)  # fonts are opened relative to the flash root
+from display import DisplayManager, StatusRow, shown_delta  # noqa: E402
+
+
+def drive(frames):
+    """(mph, elapsed s, uart blink, eco) per render frame."""
+    out = []
+    for f in range(frames):
+        t = f / FPS
+        mph = TARGET_MPH + 3 * math.sin(t / 7) + 0.4 * math.sin(t * 1.3)
+        out.append((mph, 30 + t, (f // 2) % 2 == 0, math.sin(t / 3) > 0.5))
+    return out
+
+
+class Live:
+    """The values main.py's sources read, set per frame by the replay."""
+    mph = 0.0
+    elapsed = 0.0
+    blink = False
+    eco = False
+
+
+def paths(display, live):
+    status = StatusRow(display.height, lambda: live.blink, lambda: "running")
+    below = lambda: live.mph < TARGET_MPH  # noqa: E731
+    eco = lambda: live.eco  # noqa: E731
+    number = display.number_screen(lambda: live.mph, "MPH", status, invert=below, eco=eco)
+    dashboard = display.dashboard_screen(lambda: live.mph, lambda: live.elapsed,
+                                         lambda: shown_delta(live.mph, TARGET_MPH), status,
+                                         invert=below, eco=eco)
+    return {
+        "draw_large_num": lambda: display.draw_large_num(live.mph, "MPH", live.blink, "running",
+                                                         invert=live.mph < TARGET_MPH, eco=live.eco),
+        "MPH screen": lambda: display.draw_screen(number),
+        "dashboard": lambda: display.draw_screen(dashboard),
+    }
+
+
+def bench(name, trace):
+    oled = config.OLED_1inch3()
+    display = DisplayManager(oled)
+    live = Live()
+    draw = paths(display, live)[name]
+    spi = BOARD.spi(1)
+
+    live.mph, live.elapsed, live.blink, live.eco = trace[0]
+    draw()  # full frame, fonts loaded
+    spi.reset_stats()
+    pages = 0
+    elapsed = 0.0
+    for sample in trace[1:]:
+        live.mph, live.elapsed, live.blink, live.eco = sample
+        oled.last_pages_sent = 0
+        t0 = time.perf_counter()
+        draw()
+        elapsed += time.perf_counter() - t0
+        pages += oled.last_pages_sent
+    assert emu.framebuffer_matches(BOARD, oled), "panel RAM differs from the framebuffer"
+    n = len(trace) - 1
+    return {"host_us": elapsed / n * 1e6, "pages": pages / n, "bytes": spi.bytes / n,
+            "wire_us": spi.bytes / n * 8 / SPI_HZ * 1e6}
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 1200
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    trace = drive(frames)
+    names = ("draw_large_num", "MPH screen", "dashboard")
+    runs = {name: [] for name in names}
+    for _ in range(repeats):
+        for name in names:  # interleaved, so load changes hit every path alike
+            runs[name].append(bench(name, trace))
+    results = {name: min(runs[name], key=lambda r: r["host_us"]) for name in names}
+
+    print("Frame time: {} frames at {} fps, best of {} runs (host CPython; viper code runs interpreted)".format(
+        frames, FPS, repeats))
+    print("{:<16}{:>12}{:>10}{:>10}{:>10}".format("path", "host us", "pages", "bytes", "wire us"))
+    for name in names:
+        r = results[name]
+        print("{:<16}{:>12.1f}{:>10.1f}{:>10.0f}{:>10.1f}".format(
+            name, r["host_us"], r["pages"], r["bytes"], r["wire_us"]))
+    base, dash = results["draw_large_num"], results["dashboard"]
+    print("dashboard vs draw_large_num: {:.2f}x host time, {:.2f}x wire time -> {}".format(
+        dash["host_us"] / base["host_us"], dash["wire_us"] / base["wire_us"],
+        "ok" if dash["host_us"] <= base["host_us"] else "SLOWER"))
+
+
+if __name__ == "__main__":
+    main()
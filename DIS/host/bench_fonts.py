@@ -0,0 +1,112 @@
+"""
+Host-side benchmark: font memory and boot cost, eager modules vs lazy RLE fonts.
+
+Each scenario runs in a fresh interpreter that compiles the firmware from
+source (no cached bytecode), as MicroPython does for .py files on flash:
+
+    eager   what display.py did before: import all three font_to_py modules
+            and both atlases at boot and build every writer
+    lazy    DisplayManager as it is now: nothing is loaded until a screen
+            needs it, and alert letters come from fonts/letters_large.rlf
+
+It reports heap growth (tracemalloc, the emulator's memory counter; see
+emu/gc.py) after boot and after the first speed, MM:SS and alert frames,
+plus the wall time from importing display to the first speed frame.
+
+    python DIS/host/bench_fonts.py [--runs N]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+HOST_DIR = os.path.dirname(os.path.abspath(__file__))
+SCENARIOS = ("eager", "lazy")
+STEPS = ("boot", "speed", "time", "alert")
+
+
+def measure(scenario):
+    """Run one scenario in this (fresh) interpreter and print the result as JSON."""
+    import gc
+    import time
+    import tracemalloc
+
+    sys.path.insert(0, HOST_DIR)
+    import emu
+
+    emu.install(emu.dis_board(speed=0, step_us=0))
+    import config
+    oled = config.OLED_1inch3()
+    os.chdir(emu.DEVICE_DIR)  # fonts are opened relative to the flash root
+
+    gc.collect()
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    heap = {}
+
+    def mark(step):
+        gc.collect()
+        heap[step] = tracemalloc.get_traced_memory()[0] - base
+
+    t0 = time.perf_counter()
+    from display import DisplayManager
+    display = DisplayManager(oled)
+    if scenario == "eager":
+        from fonts import font_digits_large, font_digits_med, font_letters_large  # noqa: F401
+        from writer import Writer
+        display.w_digits_large
+        display.w_digits_med
+        display._w_letters_big = Writer(oled, font_letters_large, verbose=False, cache_bytes=1024)
+    boot_s = time.perf_counter() - t0
+    mark("boot")
+
+    t0 = time.perf_counter()
+    display.draw_large_num(42.7, "MPH", True, "running")
+    frame_s = time.perf_counter() - t0
+    mark("speed")
+    display.screen_changed()
+    display.draw_time(754, "ELAPSED", True, "running")
+    mark("time")
+    display.draw_alert("TIMER", "RESET")
+    mark("alert")
+    print(json.dumps({"heap": heap, "boot_ms": boot_s * 1000, "first_frame_ms": (boot_s + frame_s) * 1000}))
+
+
+def run_child(scenario):
+    with tempfile.TemporaryDirectory() as pycache:
+        env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1", PYTHONPYCACHEPREFIX=pycache)
+        out = subprocess.run([sys.executable, os.path.abspath(__file__), "--child", scenario],
+                             env=env, capture_output=True, text=True, check=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    ap.add_argument("--runs", type=int, default=3, help="interpreters per scenario; the fastest is kept")
+    ap.add_argument("--child", choices=SCENARIOS, help=argparse.SUPPRESS)
+    args = ap.parse_args()
+    if args.child:
+        measure(args.child)
+        return
+
+    results = {}
+    for scenario in SCENARIOS:
+        runs = [run_child(scenario) for _ in range(args.runs)]
+        results[scenario] = min(runs, key=lambda r: r["first_frame_ms"])
+
+    print("Font loading: heap growth [bytes] after each step, boot time [ms] (host CPython, compiled from source)")
+    print("{:<8}".format("") + "".join("{:>10}".format(s) for s in STEPS) + "{:>10}{:>13}".format("boot", "first frame"))
+    for scenario in SCENARIOS:
+        r = results[scenario]
+        print("{:<8}".format(scenario) + "".join("{:>10}".format(r["heap"][s]) for s in STEPS)
+              + "{:>10.1f}{:>13.1f}".format(r["boot_ms"], r["first_frame_ms"]))
+    eager, lazy = results["eager"], results["lazy"]
+    print("lazy saves {} bytes at boot, {} after an alert; first frame {:.0f}% sooner".format(
+        eager["heap"]["boot"] - lazy["heap"]["boot"], eager["heap"]["alert"] - lazy["heap"]["alert"],
+        100 * (1 - lazy["first_frame_ms"] / eager["first_frame_ms"])))
+
+
+if __name__ == "__main__":
+    main()
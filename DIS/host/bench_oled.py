@@ -0,0 +1,91 @@
+"""
+Host-side benchmark for the SH1107 frame flush in config.OLED_1inch3.
+
+Runs the driver on the emulated board (see emu/), counting SPI write()
+calls, bytes and CS assertions, and compares the original per-byte-command
+flush with the batched and streaming flushes for a full frame and a
+status-row blink. Each case also checks the panel RAM ends up matching
+the framebuffer.
+
+    python DIS/host/bench_oled.py [frames]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import emu  # noqa: E402
+
+SPI_HZ = 30_000_000
+
+BOARD = emu.install(emu.dis_board(speed=0))
+import config  # noqa: E402
+
+
+class LegacyOLED(config.OLED_1inch3):
+    """The original flush: two single-byte command transactions plus a slice per page."""
+    def write_cmd(self, cmd):
+        self.cs(1); self.dc(0); self.cs(0)
+        self.spi.write(bytearray([cmd]))
+        self.cs(1)
+
+    def show(self, full=False):
+        self.write_cmd(0xB0)
+        for page in range(0, 64):
+            column = page if self.rotate == 180 else (63 - page)
+            self.write_cmd(0x00 + (column & 0x0F))
+            self.write_cmd(0x10 + (column >> 4))
+            start_index = page * 16
+            end_index = start_index + 16
+            self.write_data(self.buffer[start_index:end_index])
+
+
+def touch_rows(oled, frame, rows):
+    """Change the given framebuffer rows so the dirty tracker sees them."""
+    for r in rows:
+        oled.buffer[r * 16] = frame & 0xFF
+
+
+def bench(oled, rows, frames):
+    spi = BOARD.spi(1)
+    cs = BOARD.pin(emu.PIN_CS)
+    spi.reset_stats()
+    cs_start = cs.falls
+    t0 = time.perf_counter()
+    for f in range(1, frames + 1):
+        touch_rows(oled, f, rows)
+        oled.show()
+    elapsed = time.perf_counter() - t0
+    assert emu.framebuffer_matches(BOARD, oled), "panel RAM differs from the framebuffer"
+    writes = spi.writes / frames
+    nbytes = spi.bytes / frames
+    return {
+        "host_us": elapsed / frames * 1e6,
+        "writes": writes,
+        "bytes": nbytes,
+        "cs": (cs.falls - cs_start) / frames,
+        "wire_us": nbytes * 8 / SPI_HZ * 1e6,
+    }
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    scenarios = (("full frame", range(64)), ("status blink", range(56, 64)))
+    drivers = (
+        ("legacy", lambda: LegacyOLED()),
+        ("batched", lambda: config.OLED_1inch3(streaming=False)),
+        ("streaming", lambda: config.OLED_1inch3(streaming=True)),
+    )
+    print("OLED flush benchmark: {} frames per case, SPI {} MHz".format(frames, SPI_HZ // 1_000_000))
+    print("{:<14}{:<11}{:>10}{:>10}{:>10}{:>8}{:>10}".format(
+        "scenario", "driver", "host us", "writes", "bytes", "CS", "wire us"))
+    for scen, rows in scenarios:
+        for name, make in drivers:
+            r = bench(make(), rows, frames)
+            print("{:<14}{:<11}{:>10.1f}{:>10.0f}{:>10.0f}{:>8.0f}{:>10.1f}".format(
+                scen, name, r["host_us"], r["writes"], r["bytes"], r["cs"], r["wire_us"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Host-side throughput test: can the DIS keep up with the controller's
+telemetry rate?
+
+Runs the unmodified main.py on the emulator while the synthetic
+controller sends binary frames at each rate up to the UART wire limit
+(115200 baud, one 18-byte frame every ~1.6 ms), then reports what the DIS
+decoded against what was sent, frames lost to sequence gaps, bytes lost
+to receive-buffer overruns and how idle the CPU stayed. CPU cost is the
+emulator's model (--step-us per clock read), not a cycle count; pair it
+with bench_uart.py's parser figures when judging device headroom.
+
+    python DIS/host/bench_rate.py [--seconds S] [--step-us N] [RATE_HZ ...]
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import emu  # noqa: E402
+
+emu.install()
+from emu.__main__ import make_flash  # noqa: E402
+from emu.board import EmulatorExit  # noqa: E402
+from emu.telemetry import SyntheticController  # noqa: E402
+from uart_manager import FRAME_LEN  # noqa: E402
+
+RATES_HZ = (4, 20, 50, 100, 200, 400)
+BAUD = 115200
+
+
+def run(rate_hz, seconds, step_us, flash):
+    board = emu.dis_board(speed=0, step_us=step_us, limit_s=seconds)
+    emu.install(board)
+    import uasyncio
+    uasyncio.new_event_loop()
+    # Fresh firmware modules for every run: config binds to the current board
+    for name, module in list(sys.modules.items()):
+        if getattr(module, "__file__", None) and os.path.dirname(module.__file__) == emu.DEVICE_DIR:
+            del sys.modules[name]
+
+    controller = SyntheticController(board, period_s=1.0 / rate_hz).start()
+    script = os.path.join(emu.DEVICE_DIR, "main.py")
+    scope = {"__name__": "__main__", "__file__": script}
+    cwd = os.getcwd()
+    os.chdir(flash)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            exec(compile(open(script).read(), script, "exec"), scope)
+    except EmulatorExit:
+        pass
+    finally:
+        os.chdir(cwd)
+
+    mgr = scope["uart_manager"]
+    port = board.uart(1)
+    return {
+        "sent": controller.sent,
+        "decoded": mgr.binary_frames,
+        "lost": mgr.dropped_frames,
+        "crc": mgr.crc_errors,
+        "overrun": port.overruns + mgr.overruns,
+        "idle": 100.0 * board.idle_us / max(1, board.clock.peek_us()),
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    ap.add_argument("rates", nargs="*", type=float, help="telemetry rates to test [Hz]")
+    ap.add_argument("--seconds", type=float, default=10.0, help="virtual seconds per rate")
+    ap.add_argument("--step-us", type=int, default=100, help="virtual us charged per ticks read")
+    args = ap.parse_args()
+
+    wire_hz = BAUD / 10 / FRAME_LEN
+    rates = args.rates or RATES_HZ + (int(wire_hz),)
+    flash = make_flash(emu.DEVICE_DIR)
+    print("DIS receive path vs telemetry rate ({:.0f} virtual s each, wire limit {:.0f} Hz)".format(
+        args.seconds, wire_hz))
+    print("{:>8}{:>9}{:>9}{:>7}{:>6}{:>9}{:>9}".format("rate Hz", "sent", "decoded", "lost", "crc", "overrun", "idle %"))
+    ok = True
+    for rate in rates:
+        r = run(rate, args.seconds, args.step_us, flash)
+        # The last frame or two can still be on the wire when the run stops
+        missing = r["sent"] - r["decoded"]
+        print("{:>8g}{:>9}{:>9}{:>7}{:>6}{:>9}{:>9.1f}".format(
+            rate, r["sent"], r["decoded"], r["lost"], r["crc"], r["overrun"], r["idle"]))
+        if r["lost"] or r["crc"] or r["overrun"] or missing > 2:
+            ok = False
+    print("kept up at every rate: {}".format("yes" if ok else "no"))
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""
+Host-side benchmark for the DIS UART receive path.
+
+Feeds a synthetic controller stream through the legacy string-building
+parser and the ring-buffer UartManager and reports throughput (best of
+the repeats, run interleaved) and per-frame heap churn (tracemalloc peak
+above the steady-state baseline). The ring is driven two ways:
+
+    ring-update  update(): readinto() straight into the ring (dual-core
+                 ingest build)
+    ring-feed    feed() from a 64-byte read buffer, as main.py's
+                 uart_task does in the default build
+
+Figures are CPython's. The ring path's newline scan and field decode are
+viper functions, which run interpreted here, so on the host it parses at
+roughly 0.6x the legacy path's rate, whose str.split and "in" run in C;
+that says nothing about the device. The heap churn is the figure that
+carries over; ints above 256 are boxed here but not on MicroPython, so
+the ring path's residual churn overstates the device.
+
+    python DIS/host/bench_uart.py [frames] [bytes_per_poll] [repeats] [--binary]
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import emu  # noqa: E402
+
+emu.install()
+
+from uart_manager import UartManager  # noqa: E402
+from emu.telemetry import make_stream as encode_stream, random_samples  # noqa: E402
+
+
+class LegacyUartManager:
+    """The pre-ring-buffer receive path, kept verbatim for comparison."""
+    def __init__(self, uart_instance):
+        self.uart = uart_instance
+        self.buffer = ""
+        self.voltage = 0.0
+        self.current = 0.0
+        self.rpm = 0
+        self.duty = 0
+        self.throttle = 0.0
+        self.eco = False
+        self.uart_blink = False
+        self.new_data = False
+
+    def update(self):
+        self.new_data = False
+        if self.uart.any():
+            data = self.uart.read()
+            if data:
+                for b in data:
+                    if 32 <= b <= 126 or b == 10:
+                        self.buffer += chr(b)
+                while "\n" in self.buffer:
+                    line, self.buffer = self.buffer.split("\n", 1)
+                    line = line.strip()
+                    if not line:
+                        continue
+                    self._parse_line(line)
+                    self.new_data = True
+                    self.uart_blink = not self.uart_blink
+
+    def _parse_line(self, line):
+        try:
+            if line.startswith("s"):
+                self.voltage = float(line[1:4]) / 10
+                self.current = float(line[4:10]) / 1000
+                self.rpm = int(line[10:13])
+                self.duty = int(line[13:16])
+                self.throttle = int(line[16:19])
+                self.eco = bool(int(line[19:]))
+        except Exception as e:
+            print("Parse error:", e, "on line:", line)
+
+
+class FakeUart:
+    """Byte stream that releases at most `chunk` bytes per poll, like a FIFO between loop passes."""
+    def __init__(self, data, chunk):
+        self.data = data
+        self.pos = 0
+        self.chunk = chunk
+        self.limit = 0
+
+    def poll(self):
+        self.limit = min(len(self.data), self.pos + self.chunk)
+
+    def any(self):
+        return self.limit - self.pos
+
+    def read(self, n=-1):
+        end = self.limit if n < 0 else min(self.limit, self.pos + n)
+        out = self.data[self.pos:end]
+        self.pos = end
+        return out or None
+
+    def readinto(self, buf, nbytes=None):
+        n = min(len(buf) if nbytes is None else nbytes, self.limit - self.pos)
+        if n <= 0:
+            return None
+        buf[:n] = self.data[self.pos:self.pos + n]
+        self.pos += n
+        return n
+
+
+class FeedUartManager(UartManager):
+    """UartManager driven like main.py's uart_task: 64-byte reads passed to feed()."""
+    def __init__(self, uart_instance):
+        super().__init__(uart_instance)
+        self._buf = bytearray(64)
+
+    def update(self):
+        self.new_data = False
+        while True:
+            n = self.uart.readinto(self._buf)
+            if not n:
+                break
+            self.feed(self._buf, n)
+
+
+def make_stream(frames, seed=1, binary=False):
+    """Generate controller output in the easycontroller.c ASCII or binary format."""
+    return encode_stream(random_samples(frames, seed), binary)
+
+
+def throughput(cls, stream, chunk):
+    """Seconds to parse the whole stream, and the manager afterwards."""
+    uart = FakeUart(stream, chunk)
+    mgr = cls(uart)
+    t0 = time.perf_counter()
+    while uart.pos < len(stream):
+        uart.poll()
+        mgr.update()
+    return time.perf_counter() - t0, mgr
+
+
+def churn(cls, stream, chunk):
+    """Peak transient allocation per poll, summed over the stream."""
+    uart = FakeUart(stream, chunk)
+    mgr = cls(uart)
+    mgr.update()  # nothing to read yet; sets up update()'s ring views outside the count
+    tracemalloc.start()
+    total = 0
+    while uart.pos < len(stream):
+        uart.poll()
+        base = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        mgr.update()
+        total += tracemalloc.get_traced_memory()[1] - base
+    tracemalloc.stop()
+    return total
+
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    binary = "--binary" in sys.argv
+    frames = int(args[0]) if len(args) > 0 else 20000
+    chunk = int(args[1]) if len(args) > 1 else 32
+    repeats = int(args[2]) if len(args) > 2 else 5
+    stream = make_stream(frames)
+    print("UART parse benchmark: {} frames, {} bytes, {} bytes/poll, best of {} runs".format(
+        frames, len(stream), chunk, repeats))
+    print("{:<12}{:>14}{:>14}{:>18}".format("impl", "bytes/s", "frames/s", "heap B/frame"))
+    cases = [("legacy", LegacyUartManager, stream), ("ring-update", UartManager, stream),
+             ("ring-feed", FeedUartManager, stream)]
+    if binary:
+        cases.append(("ring-bin", FeedUartManager, make_stream(frames, binary=True)))
+    best = {name: None for name, _, _ in cases}
+    rpm = {}
+    for _ in range(repeats):
+        for name, cls, data in cases:  # interleaved, so load changes hit every path alike
+            elapsed, mgr = throughput(cls, data, chunk)
+            if best[name] is None or elapsed < best[name]:
+                best[name] = elapsed
+            rpm[name] = mgr.rpm
+    results = {}
+    for name, cls, data in cases:
+        r = results[name] = {
+            "bytes_per_s": len(data) / best[name],
+            "frames_per_s": frames / best[name],
+            "churn_per_frame": churn(cls, data, chunk) / frames,
+        }
+        print("{:<12}{:>14.0f}{:>14.0f}{:>18.1f}".format(
+            name, r["bytes_per_s"], r["frames_per_s"], r["churn_per_frame"]))
+    assert rpm["legacy"] == rpm["ring-update"] == rpm["ring-feed"], "decoders disagree"
+    legacy = results["legacy"]
+    for name in ("ring-update", "ring-feed"):
+        ring = results[name]
+        print("{} vs legacy: {:.2f}x throughput (viper runs interpreted on the host), {:.2f}x heap churn".format(
+            name, ring["frames_per_s"] / legacy["frames_per_s"], ring["churn_per_frame"] / legacy["churn_per_frame"]))
+    if binary:
+        assert rpm["ring-bin"] == rpm["ring-feed"], "binary decoder disagrees"
+        print("wire bytes/frame: ascii {:.0f}, binary {:.0f}".format(
+            len(stream) / frames, len(cases[3][2]) / frames))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+On-device benchmark for the DIS UART receive path.
+
+bench_uart.py runs on CPython, where viper functions are interpreted, so
+it cannot show what moving the byte loops into viper buys on the Pico.
+This script runs on the Pico itself, with DIS/device on its filesystem:
+
+    mpremote run DIS/host/bench_uart_pico.py
+
+It feeds the same synthetic controller output through feed() from a
+64-byte buffer, as main.py's uart_task does, twice: with the current
+viper copy, newline scan and field decode, and with those three done in
+plain Python as they were before. It reports us per frame and heap
+allocated per frame for ASCII lines and binary frames, and the RAM the
+update() ring views take when they are built.
+"""
+import gc
+import struct
+import time
+
+from uart_manager import (FLAG_ECO, FRAME_FMT, FRAME_SYNC, FRAME_VERSION, LINE_MIN_LEN, RX_MASK,
+                          UartManager, crc16_ccitt)
+
+FRAMES = 2000
+CHUNK = 64
+
+
+class PyUartManager(UartManager):
+    """The receive path with its byte loops in plain Python, as before viper."""
+    def feed(self, buf, n):
+        ring = self._ring
+        i = 0
+        while i < n:
+            chunk = self._reserve()
+            if chunk > n - i: chunk = n - i
+            head = self._head
+            for k in range(chunk):
+                ring[head + k] = buf[i + k]
+            i += chunk
+            self._commit(chunk)
+
+    def _consume(self):
+        ring = self._ring
+        while self._tail != self._head:
+            tail = self._tail
+            if ring[tail] == FRAME_SYNC:
+                if not self._take_frame(tail):
+                    break
+                continue
+            head = self._head
+            i = self._scan
+            while i != head:
+                b = ring[i]
+                if b == 10 or b == FRAME_SYNC:
+                    break
+                i = (i + 1) & RX_MASK
+            self._scan = i
+            if i == head:
+                break
+            if ring[i] == 10:
+                self._handle_line(tail, i)
+                i = (i + 1) & RX_MASK
+            self._tail = self._scan = i
+
+    def _parse_line(self, start, length):
+        if self._ring[start] != 115 or length < LINE_MIN_LEN:
+            return False
+        voltage = self._field(start + 1, 3)
+        current = self._field(start + 4, 6)
+        rpm = self._field(start + 10, 3)
+        duty = self._field(start + 13, 3)
+        throttle = self._field(start + 16, 3)
+        eco = self._field(start + 19, length - 19)
+        if voltage is None or current is None or rpm is None or duty is None \
+                or throttle is None or eco is None:
+            self.parse_errors += 1
+            return False
+        self.voltage = voltage / 10
+        self.current = current / 1000
+        self.rpm = rpm
+        self.duty = duty
+        self.throttle = throttle
+        self.eco = eco != 0
+        return True
+
+    def _field(self, pos, n):
+        ring = self._ring
+        val = 0
+        neg = False
+        seen = False
+        while n > 0:
+            b = ring[pos & RX_MASK]
+            if 48 <= b <= 57:
+                val = val * 10 + b - 48
+                seen = True
+            elif b == 45 and not seen and not neg:
+                neg = True
+            elif b != 32:
+                return None
+            pos += 1
+            n -= 1
+        if not seen:
+            return None
+        return -val if neg else val
+
+
+def make_stream(frames, binary):
+    """Controller output in the easycontroller.c format; see emu/telemetry.py."""
+    out = bytearray()
+    edges = 0
+    for i in range(frames):
+        rpm = (i * 7) % 400
+        current = (i * 131) % 15000
+        eco = i & 1
+        edges += rpm
+        if binary:
+            frame = bytearray(struct.pack(FRAME_FMT, FRAME_SYNC, FRAME_VERSION, i & 0xFF, 400, current,
+                                          rpm, 50, 60, FLAG_ECO if eco else 0, edges, 0))
+            crc = crc16_ccitt(frame, len(frame) - 2)
+            frame[-2] = crc & 0xFF
+            frame[-1] = crc >> 8
+            out += frame
+        else:
+            out += b"s%03d%06d%03d%03d%03d%1d\n" % (400, current, rpm, 50, 60, eco)
+    return out
+
+
+def run(cls, stream):
+    """(us per frame, heap bytes per frame, final rpm) for feeding the whole stream."""
+    mgr = cls(None)
+    src = memoryview(stream)
+    reads = [src[pos:pos + CHUNK] for pos in range(0, len(stream), CHUNK)]  # sliced before timing
+    gc.collect()
+    gc.disable()
+    alloc0 = gc.mem_alloc()
+    t0 = time.ticks_us()
+    for buf in reads:
+        mgr.feed(buf, len(buf))
+    us = time.ticks_diff(time.ticks_us(), t0)
+    alloc = gc.mem_alloc() - alloc0
+    gc.enable()
+    return us / FRAMES, alloc / FRAMES, mgr.rpm
+
+
+def main():
+    print("UART feed() on the device: {} frames, {}-byte reads".format(FRAMES, CHUNK))
+    print("{:<8}{:<10}{:>12}{:>14}".format("format", "impl", "us/frame", "heap B/frame"))
+    for binary in (False, True):
+        stream = make_stream(FRAMES, binary)
+        fmt = "binary" if binary else "ascii"
+        rows = []
+        for name, cls in (("python", PyUartManager), ("viper", UartManager)):
+            us, alloc, rpm = run(cls, stream)
+            rows.append((us, rpm))
+            print("{:<8}{:<10}{:>12.1f}{:>14.1f}".format(fmt, name, us, alloc))
+        assert rows[0][1] == rows[1][1], "decoders disagree"
+        print("{} viper vs python: {:.2f}x faster".format(fmt, rows[0][0] / rows[1][0]))
+
+    mgr = UartManager(None)
+    gc.collect()
+    free0 = gc.mem_free()
+    views = mgr._make_views()
+    gc.collect()
+    print("update() ring views: {} bytes for {} views (built on the first update() only)".format(
+        free0 - gc.mem_free(), len(views)))
+
+
+main()
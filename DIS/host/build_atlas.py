@@ -0,0 +1,95 @@
+"""
+Bake a font_to_py digit font into a sprite atlas for sprites.SpriteAtlas.
+
+Every glyph is converted from the font's MONO_HLSB rows (bit 7 leftmost)
+to the OLED framebuffer's MONO_HMSB layout (bit 0 leftmost) and padded to
+a common byte stride, so glyph i starts at i * height * stride and each
+of its rows is byte-aligned and ready to copy into the framebuffer.
+
+    python DIS/host/build_atlas.py            # rebuild every atlas below
+"""
+import importlib
+import os
+import sys
+
+DEVICE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "device")
+sys.path.insert(0, DEVICE_DIR)
+
+# (source font module, character set, output module)
+ATLASES = (
+    ("font_digits_large", "0123456789.", "atlas_digits_large"),
+    ("font_digits_med", "0123456789:", "atlas_digits_med"),
+)
+
+_REV = bytes(int("{:08b}".format(i)[::-1], 2) for i in range(256))
+
+
+def bake(font, chars):
+    """Return (height, stride, widths, atlas bytes) for chars of a font_to_py module."""
+    if not font.hmap() or font.reverse():
+        raise ValueError("atlas baking needs a horizontally mapped, non-reversed font")
+    height = font.height()
+    glyphs = [font.get_ch(c) for c in chars]
+    stride = max((wd - 1) // 8 + 1 for _, _, wd in glyphs)
+
+    atlas = bytearray()
+    widths = bytearray()
+    for glyph, ht, wd in glyphs:
+        src_stride = (wd - 1) // 8 + 1
+        for row in range(ht):
+            line = bytearray(stride)
+            for k in range(src_stride):
+                line[k] = _REV[glyph[row * src_stride + k]]
+            # Clear pad bits past the glyph width so copies stay exact
+            if wd % 8:
+                line[src_stride - 1] &= (1 << (wd % 8)) - 1
+            atlas += line
+        widths.append(wd)
+    return height, stride, bytes(widths), bytes(atlas)
+
+
+def _bytes_literal(name, data, per_line=16):
+    lines = ["{} =\\".format(name)]
+    for i in range(0, len(data), per_line):
+        chunk = "".join("\\x{:02x}".format(b) for b in data[i:i + per_line])
+        lines.append("b'{}'{}".format(chunk, "\\" if i + per_line < len(data) else ""))
+    return "\n".join(lines)
+
+
+def render_module(src_name, chars, height, stride, widths, atlas):
+    return "\n".join((
+        "# Code generated by build_atlas.py. Do not edit.",
+        "# Source: {}.py Char set: {}".format(src_name, chars),
+        "# Glyph rows are MONO_HMSB (bit 0 = leftmost pixel), {} bytes per row.".format(stride),
+        "",
+        "def chars():",
+        "    return {!r}".format(chars),
+        "",
+        "def height():",
+        "    return {}".format(height),
+        "",
+        "def stride():",
+        "    return {}".format(stride),
+        "",
+        _bytes_literal("widths", widths),
+        "",
+        _bytes_literal("_atlas", atlas),
+        "",
+        "atlas = memoryview(_atlas)",
+        "",
+    ))
+
+
+def main():
+    for src_name, chars, out_name in ATLASES:
+        font = importlib.import_module("fonts." + src_name)
+        height, stride, widths, atlas = bake(font, chars)
+        path = os.path.join(DEVICE_DIR, "fonts", out_name + ".py")
+        with open(path, "w", newline="\n") as f:
+            f.write(render_module(src_name, chars, height, stride, widths, atlas))
+        print("{}: {} glyphs, {}x{} px cells, {} bytes".format(
+            out_name, len(chars), stride * 8, height, len(atlas)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Compile font_to_py fonts into run-length encoded glyph files for rlefont.RleFont.
+
+A font_to_py module is a bytes literal that MicroPython loads whole into
+RAM on import. The .rlf file holds the same glyphs run-length encoded and
+stays on flash; RleFont reads its small index at open and decodes a glyph
+only when a Writer's glyph cache misses.
+
+File layout (little-endian):
+
+    header  "<4sBBBBBH"   magic b"RLF1", height, baseline, max width,
+                          glyph count, default glyph, largest glyph [bytes]
+    index   "<BBH" x count  char code, width, offset of its runs from the
+                            data start; then one more entry (0, 0, data end)
+    data    glyph runs
+
+A glyph is its pixels in row-major order as alternating runs of off and on
+pixels, starting with off, one run per 4-bit nibble (high nibble first).
+Runs of 15 and up are a 15 nibble followed by a byte holding length - 15;
+a run longer than 270 continues after a zero-length run of the other
+colour. The decoded glyph is font_to_py's MONO_HLSB rows, so Writer blits
+it unchanged.
+
+    python DIS/host/build_fonts.py            # rebuild every font below
+"""
+import importlib
+import os
+import struct
+import sys
+
+DEVICE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "device")
+sys.path.insert(0, DEVICE_DIR)
+
+# (source font module, output file in DIS/device/fonts)
+FONTS = (
+    ("font_digits_large", "digits_large.rlf"),
+    ("font_digits_med", "digits_med.rlf"),
+    ("font_letters_large", "letters_large.rlf"),
+)
+
+MAGIC = b"RLF1"
+HEADER_FMT = "<4sBBBBBH"
+ENTRY_FMT = "<BBH"
+RUN_ESCAPE = 15
+RUN_MAX = RUN_ESCAPE + 255
+
+
+def glyph_runs(glyph, height, width):
+    """Alternating off/on pixel runs of a MONO_HLSB glyph, starting with off."""
+    stride = (width - 1) // 8 + 1
+    runs = []
+    colour = 0
+    n = 0
+    for row in range(height):
+        line = glyph[row * stride:(row + 1) * stride]
+        for x in range(width):
+            bit = (line[x >> 3] >> (7 - (x & 7))) & 1
+            if bit != colour:
+                runs.append(n)
+                colour = bit
+                n = 0
+            n += 1
+    runs.append(n)
+    return runs
+
+
+def encode_runs(runs):
+    nibbles = []
+    for n in runs:
+        while n > RUN_MAX:
+            # Emit RUN_MAX, a zero run of the other colour, then the rest
+            nibbles += (RUN_ESCAPE, (RUN_MAX - RUN_ESCAPE) >> 4, (RUN_MAX - RUN_ESCAPE) & 15, 0)
+            n -= RUN_MAX
+        if n >= RUN_ESCAPE:
+            nibbles += (RUN_ESCAPE, (n - RUN_ESCAPE) >> 4, (n - RUN_ESCAPE) & 15)
+        else:
+            nibbles.append(n)
+    if len(nibbles) & 1:
+        nibbles.append(0)  # pad; the decoder stops once the glyph is full
+    return bytes((nibbles[i] << 4) | nibbles[i + 1] for i in range(0, len(nibbles), 2))
+
+
+def compile_font(font):
+    """Return the .rlf file contents and the raw glyph byte count of a font_to_py module."""
+    if not font.hmap() or font.reverse():
+        raise ValueError("RLE fonts need a horizontally mapped, non-reversed font")
+    height = font.height()
+    codes = range(font.min_ch(), font.max_ch() + 1)
+    entries = []
+    data = bytearray()
+    raw = 0
+    for code in codes:
+        glyph, ht, wd = font.get_ch(chr(code))
+        raw += len(glyph)
+        entries.append((code, wd, len(data)))
+        data += encode_runs(glyph_runs(bytes(glyph), ht, wd))
+    if len(data) > 0xFFFF:
+        raise ValueError("font too large for 16-bit glyph offsets")
+
+    ends = [e[2] for e in entries[1:]] + [len(data)]
+    largest = max(end - e[2] for e, end in zip(entries, ends))
+    # font_to_py draws characters outside its range as one of its glyphs
+    unknown = bytes(font.get_ch(chr(0))[0])
+    default = [bytes(font.get_ch(chr(code))[0]) for code in codes].index(unknown)
+    out = bytearray(struct.pack(HEADER_FMT, MAGIC, height, font.baseline(), font.max_width(),
+                                len(entries), default, largest))
+    for entry in entries:
+        out += struct.pack(ENTRY_FMT, *entry)
+    out += struct.pack(ENTRY_FMT, 0, 0, len(data))
+    out += data
+    return bytes(out), raw
+
+
+def main():
+    for src_name, out_name in FONTS:
+        font = importlib.import_module("fonts." + src_name)
+        blob, raw = compile_font(font)
+        path = os.path.join(DEVICE_DIR, "fonts", out_name)
+        with open(path, "wb") as f:
+            f.write(blob)
+        print("{}: {} glyphs, {} bytes of bitmaps -> {} bytes ({:.0f}%)".format(
+            out_name, font.max_ch() - font.min_ch() + 1, raw, len(blob), 100 * len(blob) / raw))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+Precompile the DIS firmware so the Pico doesn't compile it at every boot.
+
+MicroPython compiles each imported .py on the device, which is most of
+the time between power-up and the first frame. This writes a directory
+to copy to the Pico's filesystem instead (mpremote cp -r DIS/build/flash/. :):
+
+    *.mpy           every module under DIS/device, compiled with mpy-cross
+                    for the RP2040 (-march=armv6m, needed by the viper code)
+    dis_main.mpy    main.py, compiled like the rest
+    main.py         a stub that imports dis_main; MicroPython only runs a
+                    main.py source file at boot
+    fonts/*.rlf, tracks/*.csv and other data files, copied as they are
+
+--frozen additionally stages the same modules as source plus a
+manifest.py for baking them into a custom firmware build
+(make BOARD=RPI_PICO FROZEN_MANIFEST=.../manifest.py in ports/rp2).
+Frozen modules run from flash: their bytecode and bytes literals (the
+digit atlases) take no heap at all. The flash directory then only needs
+main.py and the data files.
+
+mpy-cross must match the MicroPython version on the Pico (pip install
+mpy-cross==<firmware version>, or a build from the MicroPython tree).
+
+    python DIS/host/build_mpy.py [--out DIR] [--mpy-cross PATH] [--frozen]
+"""
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+
+DEVICE_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "device"))
+BUILD_DIR = os.path.normpath(os.path.join(DEVICE_DIR, "..", "build"))
+
+MAIN_MODULE = "dis_main"
+MAIN_STUB = "# Generated by build_mpy.py: the firmware is {}\nimport " + MAIN_MODULE + "\n"
+MARCH = "armv6m"  # RP2040 Cortex-M0+; viper and native code is compiled for it
+
+# font_to_py sources, only read on the host by build_atlas.py and build_fonts.py
+HOST_ONLY = ("fonts/font_digits_large.py", "fonts/font_digits_med.py", "fonts/font_letters_large.py")
+
+
+def sources(device_dir):
+    """(path relative to device_dir, is_python) for every file to ship, sorted."""
+    out = []
+    for root, dirs, files in os.walk(device_dir):
+        dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+        for name in sorted(files):
+            rel = os.path.relpath(os.path.join(root, name), device_dir)
+            if name.endswith((".pyc", ".mpy")) or rel.replace(os.sep, "/") in HOST_ONLY:
+                continue
+            out.append((rel, name.endswith(".py")))
+    return out
+
+
+def module_path(rel):
+    """Where a source file lands in the build: main.py becomes dis_main."""
+    return MAIN_MODULE + ".py" if rel == "main.py" else rel
+
+
+def compile_flash(device_dir, flash_dir, mpy_cross):
+    os.makedirs(flash_dir, exist_ok=True)
+    compiled = copied = 0
+    py_bytes = mpy_bytes = 0
+    for rel, is_py in sources(device_dir):
+        src = os.path.join(device_dir, rel)
+        if not is_py:
+            dst = os.path.join(flash_dir, rel)
+            os.makedirs(os.path.dirname(dst), exist_ok=True)
+            shutil.copyfile(src, dst)
+            copied += 1
+            continue
+        dst = os.path.join(flash_dir, module_path(rel)[:-3] + ".mpy")
+        os.makedirs(os.path.dirname(dst), exist_ok=True)
+        # -s keeps tracebacks naming the source file rather than the build path
+        subprocess.run([mpy_cross, "-march=" + MARCH, "-s", rel, "-o", dst, src], check=True)
+        compiled += 1
+        py_bytes += os.path.getsize(src)
+        mpy_bytes += os.path.getsize(dst)
+    with open(os.path.join(flash_dir, "main.py"), "w", newline="\n") as f:
+        f.write(MAIN_STUB.format("precompiled in " + MAIN_MODULE + ".mpy"))
+    return compiled, copied, py_bytes, mpy_bytes
+
+
+def stage_frozen(device_dir, frozen_dir, flash_dir):
+    """Copy the modules to freeze into frozen_dir and write its manifest.py."""
+    modules = os.path.join(frozen_dir, "modules")
+    os.makedirs(modules, exist_ok=True)
+    os.makedirs(flash_dir, exist_ok=True)
+    names = []
+    for rel, is_py in sources(device_dir):
+        src = os.path.join(device_dir, rel)
+        dst = os.path.join(modules if is_py else flash_dir, module_path(rel) if is_py else rel)
+        os.makedirs(os.path.dirname(dst), exist_ok=True)
+        shutil.copyfile(src, dst)
+        if is_py:
+            names.append(module_path(rel).replace(os.sep, "/"))
+    with open(os.path.join(flash_dir, "main.py"), "w", newline="\n") as f:
+        f.write(MAIN_STUB.format("frozen into the firmware image"))
+    lines = ["# Generated by build_mpy.py --frozen. The board's own manifest first, then the DIS.",
+             'include("$(PORT_DIR)/boards/manifest.py")',
+             "freeze({!r}, (".format(os.path.abspath(modules))]
+    lines += ["    {!r},".format(n) for n in names]
+    lines += ["), opt=2)", ""]
+    manifest = os.path.join(frozen_dir, "manifest.py")
+    with open(manifest, "w", newline="\n") as f:
+        f.write("\n".join(lines))
+    return manifest, len(names)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    ap.add_argument("--out", default=BUILD_DIR, help="build directory (default DIS/build)")
+    ap.add_argument("--mpy-cross", default=shutil.which("mpy-cross"), help="mpy-cross executable")
+    ap.add_argument("--frozen", action="store_true", help="also stage a frozen-module manifest")
+    args = ap.parse_args()
+
+    for sub in ("flash", "flash-frozen", "frozen"):
+        shutil.rmtree(os.path.join(args.out, sub), ignore_errors=True)
+    if args.frozen:
+        manifest, n = stage_frozen(DEVICE_DIR, os.path.join(args.out, "frozen"),
+                                   os.path.join(args.out, "flash-frozen"))
+        print("frozen: {} modules, manifest {}".format(n, manifest))
+    if not args.mpy_cross:
+        msg = "mpy-cross not found; pip install mpy-cross==<firmware version> or pass --mpy-cross"
+        if args.frozen:
+            print("skipping .mpy build: " + msg)
+            return
+        sys.exit(msg)
+    flash = os.path.join(args.out, "flash")
+    compiled, copied, py_bytes, mpy_bytes = compile_flash(DEVICE_DIR, flash, args.mpy_cross)
+    print("flash: {} modules compiled ({} bytes of source -> {} bytes of .mpy), {} data files, in {}".format(
+        compiled, py_bytes, mpy_bytes, copied, flash))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Host-side torn-read check for the dual-core ingest snapshot (ingest.py).
+
+A writer thread publishes samples whose fields all encode the same counter
+while a reader thread copies them out as fast as it can, once through
+SeqlockSnapshot.read() and once with a plain field copy for comparison.
+The thread switch interval is forced down so CPython interleaves the two
+threads between individual field stores, the way the RP2040's two cores
+interleave without a GIL.
+
+    python DIS/host/check_seqlock.py [samples]
+
+Exits non-zero if the seqlock read ever returns a mixed sample.
+"""
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import emu  # noqa: E402
+
+emu.install()
+from array import array  # noqa: E402
+
+from ingest import ECO, SAMPLE_FIELDS, SeqlockSnapshot  # noqa: E402
+
+
+class Counter:
+    """Stands in for UartManager: every field carries the same value k."""
+    def __init__(self):
+        self.set(0)
+
+    def set(self, k):
+        self.voltage = self.current = self.rpm = self.duty = self.throttle = k
+        self.eco = self.uart_blink = bool(k & 1)
+        self.edges = k
+
+
+def torn(out, edges):
+    k = out[0]
+    return any(out[i] != k for i in range(1, ECO)) or out[ECO] != (int(k) & 1) or edges[0] != k
+
+
+def run(samples, use_seqlock):
+    snap = SeqlockSnapshot()
+    done = threading.Event()
+    result = {"reads": 0, "torn": 0}
+
+    def writer():
+        src = Counter()
+        for k in range(1, samples + 1):
+            src.set(k)
+            snap.publish(src)
+        done.set()
+
+    def reader():
+        out = array("f", [0.0] * SAMPLE_FIELDS)
+        edges = array("I", [0])
+        while not done.is_set():
+            if use_seqlock:
+                snap.read(out, edges)
+            else:
+                for i in range(SAMPLE_FIELDS):
+                    out[i] = snap._data[i]
+                edges[0] = snap._edges[0]
+            result["reads"] += 1
+            if torn(out, edges):
+                result["torn"] += 1
+
+    threads = [threading.Thread(target=writer), threading.Thread(target=reader)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    result["retries"] = snap.retries
+    return result
+
+
+def main():
+    samples = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    sys.setswitchinterval(1e-6)
+    print("Seqlock torn-read check: {} published samples".format(samples))
+    print("{:<10}{:>12}{:>12}{:>12}".format("read", "reads", "torn", "retries"))
+    naive = run(samples, use_seqlock=False)
+    locked = run(samples, use_seqlock=True)
+    print("{:<10}{:>12}{:>12}{:>12}".format("plain", naive["reads"], naive["torn"], "-"))
+    print("{:<10}{:>12}{:>12}{:>12}".format("seqlock", locked["reads"], locked["torn"], locked["retries"]))
+    if locked["torn"]:
+        sys.exit("seqlock returned torn samples")
+    print("seqlock reads consistent: yes")
+
+
+if __name__ == "__main__":
+    main()
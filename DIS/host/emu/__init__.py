@@ -0,0 +1,87 @@
+"""
+Host-side emulator for the DIS firmware.
+
+install() registers stand-ins for machine, framebuf, utime/time, gc,
+micropython, neopixel and uasyncio so DIS/device modules import unmodified under
+CPython, then dis_board() wires up the hardware the DIS uses: the SH1107
+panel on SPI1 (DC=8, CS=9, RST=12), KEY0/KEY1 on GP15/GP17 and the
+controller link on UART1. Time is virtual; see board.Clock.
+
+    import emu
+    board = emu.dis_board(speed=0, step_us=50, limit_s=10)
+    emu.install(board)
+    import main   # runs until EmulatorExit at 10 virtual seconds
+"""
+import builtins
+import os
+import sys
+
+from .board import Board, EmulatorExit, current, set_current  # noqa: F401
+
+DEVICE_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "..", "device"))
+
+# Pin assignments from config.py
+PIN_DC, PIN_CS, PIN_RST = 8, 9, 12
+PIN_KEY0, PIN_KEY1 = 15, 17
+
+_saved = {}
+
+
+def _identity(buf):
+    return buf
+
+
+def install(board=None):
+    """Make the emulated modules importable and put DIS/device on sys.path."""
+    from . import framebuf, gc, machine, micropython, neopixel, uasyncio, utime
+
+    if board is not None:
+        set_current(board)
+    modules = {
+        "machine": machine,
+        "framebuf": framebuf,
+        "utime": utime,
+        "time": utime,
+        "gc": gc,
+        "micropython": micropython,
+        "neopixel": neopixel,
+        "uasyncio": uasyncio,
+    }
+    for name, module in modules.items():
+        if name not in _saved:
+            _saved[name] = sys.modules.get(name)
+        sys.modules[name] = module
+    builtins.ptr8 = builtins.ptr16 = builtins.ptr32 = _identity
+    if DEVICE_DIR not in sys.path:
+        sys.path.insert(0, DEVICE_DIR)
+    return current()
+
+
+def uninstall():
+    """Restore the host modules replaced by install()."""
+    for name, module in _saved.items():
+        if module is None:
+            sys.modules.pop(name, None)
+        else:
+            sys.modules[name] = module
+    _saved.clear()
+
+
+def dis_board(speed=1.0, step_us=0, limit_s=None):
+    """A Board with the DIS peripherals attached and made current."""
+    from .sh1107 import SH1107
+
+    board = set_current(Board(speed, step_us, limit_s))
+    board.panel = SH1107(board, dc=PIN_DC, cs=PIN_CS, rst=PIN_RST, bus=1)
+    board.uart(1, 115200)
+    board.keys = (PIN_KEY0, PIN_KEY1)
+    return board
+
+
+def framebuffer_matches(board, oled):
+    """True when the panel RAM holds exactly what the driver last drew."""
+    return bytes(board.panel.ram_as_framebuffer(oled.height, oled.rotate)) == bytes(oled.buffer)
+
+
+__all__ = ["Board", "EmulatorExit", "DEVICE_DIR", "current", "dis_board", "framebuffer_matches",
+           "install", "set_current", "uninstall"]
@@ -0,0 +1,125 @@
+"""
+Run DIS firmware on the host.
+
+    cd DIS/host
+    python -m emu [script] [--seconds S] [--speed X] [--step-us N]
+                  [--synthetic | --feed FILE] [--ascii]
+                  [--press KEY0@T[:HOLD]] [--flash DIR] [--trace-mem] [--dump]
+
+script defaults to DIS/device/main.py. --speed 0 --step-us N gives a
+deterministic run where every ticks read costs N virtual microseconds;
+otherwise virtual time follows wall time scaled by --speed. --feed
+replays a raw capture of controller output (ASCII lines or binary frames)
+at the wire rate, --synthetic generates a drive cycle instead.
+
+The script runs in a scratch copy of its directory standing in for the
+Pico's filesystem, so anything it writes (flight recorder logs) stays out
+of the source tree; --flash DIR keeps that directory. --trace-mem makes
+gc.mem_alloc()/mem_free() count the firmware's allocations (emu/gc.py).
+"""
+import argparse
+import atexit
+import os
+import runpy
+import shutil
+import sys
+import tempfile
+import time as host_time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import emu  # noqa: E402
+from emu.board import EmulatorExit  # noqa: E402
+
+
+def parse_press(spec):
+    """KEY0@2.5 or KEY1@4:3.2 -> (pin, at_s, hold_s)"""
+    name, _, when = spec.partition("@")
+    at, _, hold = when.partition(":")
+    pins = {"KEY0": emu.PIN_KEY0, "KEY1": emu.PIN_KEY1}
+    if name.upper() not in pins:
+        raise argparse.ArgumentTypeError("unknown key " + name)
+    return pins[name.upper()], float(at), float(hold) if hold else 0.1
+
+
+def make_flash(source_dir, flash_dir=None):
+    """A directory holding links to everything in source_dir, to run the firmware in."""
+    if flash_dir is None:
+        flash_dir = tempfile.mkdtemp(prefix="dis-flash-")
+        atexit.register(shutil.rmtree, flash_dir, True)
+    os.makedirs(flash_dir, exist_ok=True)
+    for name in os.listdir(source_dir):
+        link = os.path.join(flash_dir, name)
+        if not os.path.lexists(link):
+            os.symlink(os.path.join(source_dir, name), link)
+    return flash_dir
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="python -m emu", description=__doc__.split("\n")[1])
+    ap.add_argument("script", nargs="?", default=os.path.join(emu.DEVICE_DIR, "main.py"))
+    ap.add_argument("--seconds", type=float, default=5.0, help="virtual seconds to run")
+    ap.add_argument("--speed", type=float, default=0.0, help="virtual/wall time ratio (0 = step only)")
+    ap.add_argument("--step-us", type=int, default=100, help="virtual us charged per ticks read")
+    ap.add_argument("--synthetic", action="store_true", help="generate controller telemetry")
+    ap.add_argument("--ascii", action="store_true", help="synthetic controller sends legacy lines")
+    ap.add_argument("--feed", metavar="FILE", help="replay raw controller output from FILE")
+    ap.add_argument("--press", type=parse_press, action="append", default=[],
+                    metavar="KEY@T[:HOLD]", help="press KEY0/KEY1 at T seconds")
+    ap.add_argument("--flash", metavar="DIR", help="keep the emulated filesystem in DIR")
+    ap.add_argument("--trace-mem", action="store_true", help="count heap use for gc.mem_alloc()")
+    ap.add_argument("--dump", action="store_true", help="print the panel contents at exit")
+    args = ap.parse_args(argv)
+
+    board = emu.dis_board(speed=args.speed, step_us=args.step_us, limit_s=args.seconds)
+    emu.install(board)
+    from emu.telemetry import SyntheticController
+
+    controller = None
+    if args.synthetic:
+        controller = SyntheticController(board, binary=not args.ascii).start()
+    if args.feed:
+        with open(args.feed, "rb") as f:
+            board.uart(1).feed(f.read(), at_s=0)
+    for pin, at_s, hold_s in args.press:
+        board.press(pin, at_s, hold_s)
+
+    script = os.path.abspath(args.script)
+    flash = make_flash(os.path.dirname(script), args.flash)
+    cwd = os.getcwd()
+    os.chdir(flash)
+    if args.trace_mem:
+        sys.modules["gc"].trace((flash, emu.DEVICE_DIR))
+    t0 = host_time.perf_counter()
+    try:
+        runpy.run_path(script, run_name="__main__")
+    except EmulatorExit:
+        pass
+    finally:
+        os.chdir(cwd)
+    wall = host_time.perf_counter() - t0
+
+    spi = board.spi(1)
+    port = board.uart(1)
+    panel = board.panel
+    print()
+    print("---- emulator ----")
+    print("virtual {:.2f} s in {:.2f} s wall ({:.1f}x)".format(
+        board.clock.peek_us() / 1e6, wall, board.clock.peek_us() / 1e6 / wall if wall else 0))
+    if board.idle_us:
+        print("cpu idle {:.1f}% (uasyncio had nothing to run)".format(
+            100.0 * board.idle_us / max(1, board.clock.peek_us())))
+    print("spi1: {} writes, {} bytes; panel {} commands, {} data bytes".format(
+        spi.writes, spi.bytes, panel.commands, panel.data_bytes))
+    print("uart1: {} bytes received, {} dropped by rx overrun, {} still queued".format(
+        port.received, port.overruns, port.pending()))
+    if controller:
+        print("controller: {} messages sent".format(controller.sent))
+    if args.trace_mem:
+        print("heap: {} bytes allocated by the firmware".format(sys.modules["gc"].mem_alloc()))
+    if args.dump:
+        print(panel.render())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+Virtual board state shared by the emulated MicroPython modules.
+
+The Board owns the virtual clock, the pin levels, the UART and SPI ports and
+a queue of timed events (button presses, telemetry arrivals, scheduled
+callbacks). Every emulated module looks the active board up through
+current(), so device code needs no changes to run against it.
+"""
+import heapq
+import time as _time
+
+TICKS_PERIOD = 1 << 30
+TICKS_MAX = TICKS_PERIOD - 1
+
+
+class EmulatorExit(BaseException):
+    """Raised from inside device code when the run's time limit is reached."""
+
+
+class Clock:
+    """
+    Virtual microsecond clock.
+
+    now = sleeps + charged peripheral time + reads * step_us
+          + real elapsed time * speed
+
+    speed=1 tracks wall time, speed=100 runs 100x faster than real time and
+    speed=0 with a non-zero step_us gives a fully deterministic run where
+    each ticks_*() read by device code costs step_us.
+    """
+    def __init__(self, board, speed=1.0, step_us=0, limit_us=None):
+        self.board = board
+        self.speed = speed
+        self.step_us = step_us
+        self.limit_us = limit_us
+        self._real0 = _time.perf_counter()
+        self._offset_us = 0
+        self._reads = 0
+
+    def peek_us(self):
+        """Current virtual time without counting as a device read."""
+        real = (_time.perf_counter() - self._real0) * 1e6 * self.speed if self.speed else 0
+        return self._offset_us + self._reads * self.step_us + int(real)
+
+    def now_us(self):
+        """Virtual time as seen by device code: runs due events and enforces the limit."""
+        self._reads += 1
+        t = self.peek_us()
+        if self.limit_us is not None and t >= self.limit_us:
+            raise EmulatorExit()
+        self.board.run_due(t)
+        return t
+
+    def advance(self, us):
+        """
+        Charge time spent sleeping or busy in a peripheral. Events that fall
+        inside the interval run at their own time, so an IRQ timestamps its
+        edge correctly rather than at the end of the sleep.
+        """
+        if us <= 0:
+            return
+        board = self.board
+        end = self._offset_us + int(us)
+        while not board._running:
+            t = board.next_event_us()
+            other = self.peek_us() - self._offset_us  # reads and wall-clock share
+            if t is None or t > end + other:
+                break
+            self._offset_us = max(self._offset_us, t - other)
+            board.run_due(self.peek_us())
+        self._offset_us = end
+        board.run_due(self.peek_us())
+
+
+class Board:
+    def __init__(self, speed=1.0, step_us=0, limit_s=None):
+        limit_us = None if limit_s is None else int(limit_s * 1e6)
+        self.clock = Clock(self, speed, step_us, limit_us)
+        self.pins = {}
+        self.uarts = {}
+        self.spis = {}
+        self.panel = None
+        self.heap_locks = 0
+        self.idle_us = 0  # virtual time uasyncio spent with nothing to run
+        self._events = []
+        self._seq = 0
+        self._running = False
+
+    # ---------------- Ports ----------------
+
+    def pin(self, pin_id):
+        from .machine import PinState
+        state = self.pins.get(pin_id)
+        if state is None:
+            state = self.pins[pin_id] = PinState(self, pin_id)
+        return state
+
+    def uart(self, uart_id, baudrate=115200):
+        from .machine import UartPort
+        port = self.uarts.get(uart_id)
+        if port is None:
+            port = self.uarts[uart_id] = UartPort(self, uart_id, baudrate)
+        return port
+
+    def spi(self, spi_id):
+        from .machine import SpiBus
+        bus = self.spis.get(spi_id)
+        if bus is None:
+            bus = self.spis[spi_id] = SpiBus(self, spi_id)
+        return bus
+
+    # ---------------- Events ----------------
+
+    def at(self, t_us, fn, *args):
+        """Run fn(*args) once virtual time reaches t_us."""
+        self._seq += 1
+        heapq.heappush(self._events, (int(t_us), self._seq, fn, args))
+
+    def after(self, dt_us, fn, *args):
+        self.at(self.clock.peek_us() + dt_us, fn, *args)
+
+    def run_due(self, now_us):
+        if self._running:
+            return
+        self._running = True
+        try:
+            events = self._events
+            while events and events[0][0] <= now_us:
+                _, _, fn, args = heapq.heappop(events)
+                fn(*args)
+        finally:
+            self._running = False
+
+    def next_event_us(self):
+        return self._events[0][0] if self._events else None
+
+    def press(self, pin_id, at_s, hold_s=0.1):
+        """Pull an active-low button to ground at at_s for hold_s seconds."""
+        state = self.pin(pin_id)
+        self.at(at_s * 1e6, state.drive, 0)
+        self.at((at_s + hold_s) * 1e6, state.drive, None)
+
+
+_current = None
+
+
+def current():
+    global _current
+    if _current is None:
+        _current = Board()
+    return _current
+
+
+def set_current(board):
+    global _current
+    _current = board
+    return board
@@ -0,0 +1,243 @@
+"""
+Pure-Python stand-in for MicroPython's framebuf module.
+
+Pixel layouts, clipping, line drawing and blit semantics follow
+extmod/modframebuf.c for the MONO_VLSB, MONO_HLSB, MONO_HMSB and GS8
+formats. text() uses a built-in 5x7 stand-in font inside the same 8x8
+cell, so label glyph shapes differ from the device but their extent,
+position and transparency match.
+"""
+MONO_VLSB = 0
+MVLSB = MONO_VLSB
+RGB565 = 1
+GS4_HMSB = 2
+MONO_HLSB = 3
+MONO_HMSB = 4
+GS2_HMSB = 5
+GS8 = 6
+
+_FONT5X7 = {
+    " ": (0x00, 0x00, 0x00, 0x00, 0x00),
+    "0": (0x3E, 0x51, 0x49, 0x45, 0x3E), "1": (0x00, 0x42, 0x7F, 0x40, 0x00),
+    "2": (0x42, 0x61, 0x51, 0x49, 0x46), "3": (0x21, 0x41, 0x45, 0x4B, 0x31),
+    "4": (0x18, 0x14, 0x12, 0x7F, 0x10), "5": (0x27, 0x45, 0x45, 0x45, 0x39),
+    "6": (0x3C, 0x4A, 0x49, 0x49, 0x30), "7": (0x01, 0x71, 0x09, 0x05, 0x03),
+    "8": (0x36, 0x49, 0x49, 0x49, 0x36), "9": (0x06, 0x49, 0x49, 0x29, 0x1E),
+    "A": (0x7E, 0x11, 0x11, 0x11, 0x7E), "B": (0x7F, 0x49, 0x49, 0x49, 0x36),
+    "C": (0x3E, 0x41, 0x41, 0x41, 0x22), "D": (0x7F, 0x41, 0x41, 0x22, 0x1C),
+    "E": (0x7F, 0x49, 0x49, 0x49, 0x41), "F": (0x7F, 0x09, 0x09, 0x09, 0x01),
+    "G": (0x3E, 0x41, 0x49, 0x49, 0x7A), "H": (0x7F, 0x08, 0x08, 0x08, 0x7F),
+    "I": (0x00, 0x41, 0x7F, 0x41, 0x00), "J": (0x20, 0x40, 0x41, 0x3F, 0x01),
+    "K": (0x7F, 0x08, 0x14, 0x22, 0x41), "L": (0x7F, 0x40, 0x40, 0x40, 0x40),
+    "M": (0x7F, 0x02, 0x0C, 0x02, 0x7F), "N": (0x7F, 0x04, 0x08, 0x10, 0x7F),
+    "O": (0x3E, 0x41, 0x41, 0x41, 0x3E), "P": (0x7F, 0x09, 0x09, 0x09, 0x06),
+    "Q": (0x3E, 0x41, 0x51, 0x21, 0x5E), "R": (0x7F, 0x09, 0x19, 0x29, 0x46),
+    "S": (0x46, 0x49, 0x49, 0x49, 0x31), "T": (0x01, 0x01, 0x7F, 0x01, 0x01),
+    "U": (0x3F, 0x40, 0x40, 0x40, 0x3F), "V": (0x1F, 0x20, 0x40, 0x20, 0x1F),
+    "W": (0x3F, 0x40, 0x38, 0x40, 0x3F), "X": (0x63, 0x14, 0x08, 0x14, 0x63),
+    "Y": (0x07, 0x08, 0x70, 0x08, 0x07), "Z": (0x61, 0x51, 0x49, 0x45, 0x43),
+    ".": (0x00, 0x60, 0x60, 0x00, 0x00), ":": (0x00, 0x36, 0x36, 0x00, 0x00),
+    "-": (0x08, 0x08, 0x08, 0x08, 0x08), "+": (0x08, 0x08, 0x3E, 0x08, 0x08),
+    "/": (0x20, 0x10, 0x08, 0x04, 0x02), "%": (0x23, 0x13, 0x08, 0x64, 0x62),
+    "=": (0x14, 0x14, 0x14, 0x14, 0x14), "!": (0x00, 0x00, 0x5F, 0x00, 0x00),
+}
+_BOX = (0x7F, 0x41, 0x41, 0x41, 0x7F)
+
+
+def _glyph(ch):
+    cols = _FONT5X7.get(ch) or _FONT5X7.get(ch.upper()) or _BOX
+    return (0,) + cols + (0, 0)
+
+
+def _writable(buf):
+    if isinstance(buf, (bytes, str)) or (isinstance(buf, memoryview) and buf.readonly):
+        raise TypeError("object with buffer protocol required")
+    return buf
+
+
+class FrameBuffer:
+    def __init__(self, buffer, width, height, format, stride=None):
+        self.buf = _writable(buffer)
+        self.width = width
+        self.height = height
+        self.format = format
+        stride = width if stride is None else stride
+        if format in (MONO_HLSB, MONO_HMSB):
+            stride = (stride + 7) & ~7
+        elif format not in (MONO_VLSB, GS8):
+            raise ValueError("invalid format")
+        self.stride = stride
+
+        if format == MONO_VLSB:
+            need = ((height + 7) >> 3) * stride
+        elif format == GS8:
+            need = height * stride
+        else:
+            need = (height * stride) >> 3
+        if len(buffer) < need:
+            raise ValueError("buffer too small")
+
+    # ---------------- pixel access ----------------
+
+    def _locate(self, x, y):
+        f = self.format
+        if f == MONO_HMSB:
+            return (x + y * self.stride) >> 3, x & 7
+        if f == MONO_HLSB:
+            return (x + y * self.stride) >> 3, 7 - (x & 7)
+        if f == MONO_VLSB:
+            return (y >> 3) * self.stride + x, y & 7
+        return y * self.stride + x, -1
+
+    def _set(self, x, y, c):
+        i, bit = self._locate(x, y)
+        if bit < 0:
+            self.buf[i] = c & 0xFF
+        elif c:
+            self.buf[i] |= 1 << bit
+        else:
+            self.buf[i] &= ~(1 << bit) & 0xFF
+
+    def _get(self, x, y):
+        i, bit = self._locate(x, y)
+        if bit < 0:
+            return self.buf[i]
+        return (self.buf[i] >> bit) & 1
+
+    def pixel(self, x, y, c=None):
+        if 0 <= x < self.width and 0 <= y < self.height:
+            if c is None:
+                return self._get(x, y)
+            self._set(x, y, c)
+        return None
+
+    # ---------------- fills ----------------
+
+    def fill(self, c):
+        self.fill_rect(0, 0, self.width, self.height, c)
+
+    def fill_rect(self, x, y, w, h, c):
+        if h < 1 or w < 1 or x + w <= 0 or y + h <= 0 or y >= self.height or x >= self.width:
+            return
+        xend = min(self.width, x + w)
+        yend = min(self.height, y + h)
+        x = max(x, 0)
+        y = max(y, 0)
+        if self.format in (MONO_HMSB, MONO_HLSB):
+            for yy in range(y, yend):
+                self._hspan_mono(x, xend, yy, c)
+        else:
+            for yy in range(y, yend):
+                for xx in range(x, xend):
+                    self._set(xx, yy, c)
+
+    def _hspan_mono(self, x0, x1, y, c):
+        """Set pixels [x0, x1) of row y in a horizontally mapped mono buffer, a byte at a time."""
+        buf = self.buf
+        base = (y * self.stride) >> 3
+        hmsb = self.format == MONO_HMSB
+        fill = 0xFF if c else 0x00
+        while x0 < x1:
+            bit0 = x0 & 7
+            n = min(8 - bit0, x1 - x0)
+            mask = ((1 << n) - 1) << bit0 if hmsb else (((1 << n) - 1) << (8 - bit0 - n))
+            i = base + (x0 >> 3)
+            buf[i] = (buf[i] & ~mask & 0xFF) | (fill & mask)
+            x0 += n
+
+    def hline(self, x, y, w, c):
+        self.fill_rect(x, y, w, 1, c)
+
+    def vline(self, x, y, h, c):
+        self.fill_rect(x, y, 1, h, c)
+
+    def rect(self, x, y, w, h, c, f=False):
+        if f:
+            self.fill_rect(x, y, w, h, c)
+            return
+        self.fill_rect(x, y, w, 1, c)
+        self.fill_rect(x, y + h - 1, w, 1, c)
+        self.fill_rect(x, y, 1, h, c)
+        self.fill_rect(x + w - 1, y, 1, h, c)
+
+    def line(self, x1, y1, x2, y2, c):
+        dx = x2 - x1
+        if dx > 0:
+            sx = 1
+        else:
+            dx = -dx
+            sx = -1
+        dy = y2 - y1
+        if dy > 0:
+            sy = 1
+        else:
+            dy = -dy
+            sy = -1
+        steep = dy > dx
+        if steep:
+            x1, y1 = y1, x1
+            dx, dy = dy, dx
+            sx, sy = sy, sx
+        e = 2 * dy - dx
+        for _ in range(dx):
+            if steep:
+                self.pixel(y1, x1, c)
+            else:
+                self.pixel(x1, y1, c)
+            while e >= 0:
+                y1 += sy
+                e -= 2 * dx
+            x1 += sx
+            e += 2 * dy
+        self.pixel(x2, y2, c)
+
+    # ---------------- text / blit / scroll ----------------
+
+    def text(self, s, x0, y0, c=1):
+        for ch in s:
+            for j, col in enumerate(_glyph(ch)):
+                x = x0 + j
+                if 0 <= x < self.width:
+                    y = y0
+                    while col:
+                        if col & 1 and 0 <= y < self.height:
+                            self._set(x, y, c)
+                        col >>= 1
+                        y += 1
+            x0 += 8
+
+    def blit(self, fbuf, x, y, key=-1, palette=None):
+        if isinstance(fbuf, tuple):
+            buf, w, h, fmt = fbuf[:4]
+            fbuf = FrameBuffer(bytearray(buf), w, h, fmt, *fbuf[4:])
+        if x >= self.width or y >= self.height or -x >= fbuf.width or -y >= fbuf.height:
+            return
+        x0 = max(0, x)
+        y0 = max(0, y)
+        x1 = max(0, -x)
+        y1 = max(0, -y)
+        x0end = min(self.width, x + fbuf.width)
+        y0end = min(self.height, y + fbuf.height)
+        for cy in range(y0, y0end):
+            cx1 = x1
+            for cx0 in range(x0, x0end):
+                col = fbuf._get(cx1, y1)
+                if palette is not None:
+                    col = palette._get(col, 0)
+                if col != key:
+                    self._set(cx0, cy, col)
+                cx1 += 1
+            y1 += 1
+
+    def scroll(self, xstep, ystep):
+        w, h = self.width, self.height
+        src = FrameBuffer(bytearray(self.buf), w, h, self.format, self.stride)
+        for y in range(h):
+            for x in range(w):
+                sx, sy = x - xstep, y - ystep
+                if 0 <= sx < w and 0 <= sy < h:
+                    self._set(x, y, src._get(sx, sy))
+
+
+def FrameBuffer1(buffer, width, height, stride=None):
+    return FrameBuffer(buffer, width, height, MONO_VLSB, stride)
@@ -0,0 +1,56 @@
+"""
+Stand-in for MicroPython's gc module.
+
+Everything CPython's gc has is passed through. mem_alloc() and mem_free()
+are added; after trace(dirs) they count the live allocations tracemalloc
+saw made from code in those directories (anywhere in the call stack, so
+modules the firmware imports and the code compiled for them count too).
+Without tracing, mem_alloc() reads 0.
+
+CPython objects are larger than MicroPython's, so compare figures between
+emulator runs rather than against a Pico; bytes literals and buffers, which
+dominate the DIS heap, are close to their device size.
+"""
+import gc as _gc
+import os
+import tracemalloc
+
+# Roughly the GC heap MicroPython gets on an RP2040 (264 KiB SRAM)
+HEAP_BYTES = 192 * 1024
+
+collect = _gc.collect
+enable = _gc.enable
+disable = _gc.disable
+isenabled = _gc.isenabled
+
+_filters = None
+
+
+def trace(dirs, frames=12):
+    """Start counting allocations made from code under any of dirs."""
+    global _filters
+    _filters = [tracemalloc.Filter(True, os.path.join(os.path.realpath(d), "*"), all_frames=True)
+                for d in dirs]
+    _filters += [tracemalloc.Filter(True, os.path.join(os.path.abspath(d), "*"), all_frames=True)
+                 for d in dirs]
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(frames)
+
+
+def mem_alloc():
+    if _filters is None or not tracemalloc.is_tracing():
+        return 0
+    snapshot = tracemalloc.take_snapshot().filter_traces(_filters)
+    return sum(stat.size for stat in snapshot.statistics("filename"))
+
+
+def mem_free():
+    return max(0, HEAP_BYTES - mem_alloc())
+
+
+def threshold(amount=None):
+    return -1 if amount is None else None
+
+
+def __getattr__(name):
+    return getattr(_gc, name)
@@ -0,0 +1,355 @@
+"""
+Stand-in for MicroPython's machine module (rp2 port subset used by the DIS).
+
+Pin, SPI and UART objects are thin handles onto per-id state held by the
+active Board, so two Pin(15) objects see the same level, and the host can
+drive inputs or feed UART bytes before the device code constructs them.
+"""
+from collections import deque
+
+from .board import EmulatorExit, current
+
+
+# ------------------------------------------------------------------ Pins
+
+class PinState:
+    """Electrical state of one GPIO, shared by every Pin handle for it."""
+    def __init__(self, board, pin_id):
+        self.board = board
+        self.id = pin_id
+        self.mode = Pin.IN
+        self.pull = None
+        self.out = 0
+        self.external = None  # level forced by the host, None = floating
+        self.handlers = []    # (handler, trigger, pin object)
+        self.listeners = []   # callables(level) for emulated peripherals
+        self.rises = 0
+        self.falls = 0
+        self._level = self.level()
+
+    def level(self):
+        if self.mode in (Pin.OUT, Pin.OPEN_DRAIN) and self.external is None:
+            return self.out
+        if self.external is not None:
+            return self.external
+        return 1 if self.pull == Pin.PULL_UP else 0
+
+    def drive(self, level):
+        """Host side: force the pin to level (0/1) or release it with None."""
+        self.external = level
+        self._update()
+
+    def _update(self):
+        new = self.level()
+        old = self._level
+        if new == old:
+            return
+        self._level = new
+        if new:
+            self.rises += 1
+            edge = Pin.IRQ_RISING
+        else:
+            self.falls += 1
+            edge = Pin.IRQ_FALLING
+        for fn in self.listeners:
+            fn(new)
+        for handler, trigger, pin in self.handlers:
+            if trigger & edge:
+                handler(pin)
+
+
+class _Irq:
+    def __init__(self, state, entry):
+        self._state = state
+        self._entry = entry
+
+    def trigger(self):
+        return self._entry[1]
+
+    def flags(self):
+        return 0
+
+
+class Pin:
+    IN = 0
+    OUT = 1
+    OPEN_DRAIN = 2
+    ALT = 3
+    PULL_UP = 1
+    PULL_DOWN = 2
+    IRQ_FALLING = 4
+    IRQ_RISING = 8
+
+    def __init__(self, id, mode=-1, pull=-1, *, value=None, alt=None):
+        if isinstance(id, Pin):
+            id = id.id
+        self.id = id
+        self._state = current().pin(id)
+        self.init(mode, pull, value=value)
+
+    def init(self, mode=-1, pull=-1, *, value=None, alt=None):
+        s = self._state
+        if mode != -1:
+            s.mode = mode
+        if pull != -1:
+            s.pull = pull
+        if value is not None:
+            s.out = 1 if value else 0
+        s._update()
+
+    def value(self, x=None):
+        if x is None:
+            return self._state.level()
+        self._state.out = 1 if x else 0
+        self._state._update()
+
+    __call__ = value
+
+    def on(self):
+        self.value(1)
+
+    def off(self):
+        self.value(0)
+
+    def high(self):
+        self.value(1)
+
+    def low(self):
+        self.value(0)
+
+    def toggle(self):
+        self.value(0 if self._state.out else 1)
+
+    def irq(self, handler=None, trigger=IRQ_FALLING | IRQ_RISING, *, priority=1, wake=None, hard=False):
+        s = self._state
+        s.handlers = [h for h in s.handlers if h[2] is not self]
+        entry = (handler, trigger, self)
+        if handler is not None:
+            s.handlers.append(entry)
+        return _Irq(s, entry)
+
+    def __repr__(self):
+        return "Pin({})".format(self.id)
+
+
+# ------------------------------------------------------------------ SPI
+
+class SpiBus:
+    """Shared state of one SPI peripheral: transfer counters and attached devices."""
+    def __init__(self, board, spi_id):
+        self.board = board
+        self.id = spi_id
+        self.baudrate = 1000000
+        self.devices = []
+        self.call_us = 0  # fixed per-call overhead charged to the clock
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.writes = 0
+        self.bytes = 0
+
+    def attach(self, device):
+        self.devices.append(device)
+
+    def transfer(self, buf):
+        n = len(buf)
+        self.writes += 1
+        self.bytes += n
+        self.board.clock.advance(self.call_us + n * 8e6 / self.baudrate)
+        for dev in self.devices:
+            dev.on_spi_write(buf)
+
+
+class SPI:
+    MSB = 0
+    LSB = 1
+
+    def __init__(self, id, baudrate=1000000, *, polarity=0, phase=0, bits=8, firstbit=MSB,
+                 sck=None, mosi=None, miso=None):
+        self._bus = current().spi(id)
+        self.init(baudrate=baudrate)
+
+    def init(self, baudrate=1000000, **kwargs):
+        self._bus.baudrate = baudrate
+
+    def deinit(self):
+        pass
+
+    def write(self, buf):
+        self._bus.transfer(bytes(buf))
+
+    def read(self, nbytes, write=0x00):
+        self._bus.transfer(bytes([write]) * nbytes)
+        return bytes(nbytes)
+
+    def readinto(self, buf, write=0x00):
+        self._bus.transfer(bytes([write]) * len(buf))
+        for i in range(len(buf)):
+            buf[i] = 0
+
+    def write_readinto(self, write_buf, read_buf):
+        self._bus.transfer(bytes(write_buf))
+        for i in range(len(read_buf)):
+            read_buf[i] = 0
+
+
+# ------------------------------------------------------------------ UART
+
+class UartPort:
+    """
+    Receive side of one UART as the wire delivers it. Bytes fed by the host
+    arrive one character time (10 bits) apart and land in an rxbuf-sized
+    buffer; bytes arriving while it is full are dropped and counted.
+    """
+    def __init__(self, board, uart_id, baudrate):
+        self.board = board
+        self.id = uart_id
+        self.baudrate = baudrate
+        self.rxbuf = 256
+        self.rx = bytearray()
+        self.tx = bytearray()
+        self.overruns = 0
+        self.received = 0
+        self._pending = deque()  # [data, start_us, byte_us, taken]
+        self._feed_end = 0
+
+    def feed(self, data, at_s=None, paced=True):
+        """Queue bytes to arrive at at_s (default: now, or after earlier feeds)."""
+        now = self.board.clock.peek_us()
+        start = now if at_s is None else int(at_s * 1e6)
+        start = max(start, self._feed_end)
+        byte_us = 10e6 / self.baudrate if paced else 0.0
+        self._pending.append([bytes(data), start, byte_us, 0])
+        self._feed_end = start + len(data) * byte_us
+
+    def pending(self):
+        return sum(len(p[0]) - p[3] for p in self._pending)
+
+    def next_arrival_us(self):
+        """Virtual time the next queued byte lands in rx, or None."""
+        for data, start, byte_us, taken in self._pending:
+            if taken < len(data):
+                return start + int(-(-taken * byte_us // 1))
+        return None
+
+    def pump(self):
+        now = self.board.clock.peek_us()
+        pending = self._pending
+        while pending:
+            entry = pending[0]
+            data, start, byte_us, taken = entry
+            if now < start:
+                break
+            if byte_us:
+                arrived = min(len(data), int((now - start) / byte_us) + 1)
+            else:
+                arrived = len(data)
+            if arrived > taken:
+                chunk = data[taken:arrived]
+                room = self.rxbuf - len(self.rx)
+                if len(chunk) > room:
+                    self.overruns += len(chunk) - room
+                    chunk = chunk[:max(room, 0)]
+                self.rx += chunk
+                self.received += len(chunk)
+                entry[3] = arrived
+            if arrived < len(data):
+                break
+            pending.popleft()
+
+
+class UART:
+    INV_TX = 1
+    INV_RX = 2
+
+    def __init__(self, id, baudrate=115200, bits=8, parity=None, stop=1, *, tx=None, rx=None,
+                 txbuf=None, rxbuf=None, timeout=0, timeout_char=0, invert=0, flow=0):
+        self._port = current().uart(id, baudrate)
+        self.init(baudrate, rxbuf=rxbuf)
+
+    def init(self, baudrate=115200, bits=8, parity=None, stop=1, *, rxbuf=None, **kwargs):
+        self._port.baudrate = baudrate
+        if rxbuf:
+            self._port.rxbuf = rxbuf
+
+    def deinit(self):
+        pass
+
+    def any(self):
+        current().clock.now_us()  # device polling lets virtual time move on
+        self._port.pump()
+        return len(self._port.rx)
+
+    def read(self, nbytes=None):
+        self._port.pump()
+        rx = self._port.rx
+        if not rx:
+            return None
+        n = len(rx) if nbytes is None else min(nbytes, len(rx))
+        out = bytes(rx[:n])
+        del rx[:n]
+        return out
+
+    def readinto(self, buf, nbytes=None):
+        self._port.pump()
+        rx = self._port.rx
+        n = len(buf) if nbytes is None else min(nbytes, len(buf))
+        n = min(n, len(rx))
+        if not n:
+            return None
+        buf[:n] = rx[:n]
+        del rx[:n]
+        return n
+
+    def readline(self):
+        self._port.pump()
+        rx = self._port.rx
+        i = rx.find(b"\n")
+        if i < 0:
+            return None
+        out = bytes(rx[:i + 1])
+        del rx[:i + 1]
+        return out
+
+    def write(self, buf):
+        self._port.tx += buf
+        return len(buf)
+
+    def flush(self):
+        pass
+
+    def txdone(self):
+        return True
+
+
+# ------------------------------------------------------------------ misc
+
+def freq(hz=None):
+    return 125_000_000
+
+
+def unique_id():
+    return b"\xe6\x61\x38\x52\x03\x0b\x2f\x2a"
+
+
+def reset():
+    raise EmulatorExit()
+
+
+soft_reset = reset
+
+
+def idle():
+    current().clock.advance(100)
+
+
+def lightsleep(time_ms=None):
+    current().clock.advance((time_ms or 0) * 1000)
+
+
+def disable_irq():
+    return 0
+
+
+def enable_irq(state=0):
+    pass
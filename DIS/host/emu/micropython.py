@@ -0,0 +1,60 @@
+"""
+Stand-in for the micropython module.
+
+Code emitters are no-ops, so @micropython.viper / @native functions run as
+plain Python; emu.install() provides ptr8/ptr16/ptr32 as identity builtins
+so viper buffer indexing works unchanged on bytearray and array objects.
+"""
+from .board import current
+
+
+def const(expr):
+    return expr
+
+
+def native(f):
+    return f
+
+
+viper = native
+asm_thumb = native
+
+
+def opt_level(level=None):
+    return 0 if level is None else None
+
+
+def alloc_emergency_exception_buf(size):
+    pass
+
+
+def mem_info(verbose=False):
+    print("mem: emulated (see tracemalloc)")
+
+
+def qstr_info(verbose=False):
+    pass
+
+
+def stack_use():
+    return 0
+
+
+def heap_lock():
+    current().heap_locks += 1
+    return current().heap_locks - 1
+
+
+def heap_unlock():
+    board = current()
+    board.heap_locks = max(0, board.heap_locks - 1)
+    return board.heap_locks
+
+
+def kbd_intr(chr):
+    pass
+
+
+def schedule(func, arg):
+    """Run func(arg) at the next point device code reads the clock, like a soft IRQ."""
+    current().after(0, func, arg)
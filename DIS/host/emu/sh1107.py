@@ -0,0 +1,98 @@
+"""
+Minimal SH1107 panel model for the emulated SPI bus.
+
+Decodes the command subset config.OLED_1inch3 uses (column/page address,
+addressing mode, invert, display on/off and the two-byte setup commands)
+and stores data writes in display RAM, honouring CS and sampling DC per
+byte like the real controller. ram_as_framebuffer() maps the RAM back to
+the driver's 1 KB MONO_HMSB layout so tests can compare what the panel
+shows with what the firmware drew.
+"""
+
+# Commands followed by one argument byte
+_TWO_BYTE = {0x81, 0xA8, 0xAD, 0xD3, 0xD5, 0xD9, 0xDA, 0xDB, 0xDC}
+
+
+class SH1107:
+    COLUMNS = 128
+    PAGES = 16
+
+    def __init__(self, board, dc, cs, rst=None, bus=1):
+        self.board = board
+        self._dc = board.pin(dc)
+        self._cs = board.pin(cs)
+        self.ram = bytearray(self.COLUMNS * self.PAGES)
+        self.column = 0
+        self.page = 0
+        self.vertical = False
+        self.inverted = False
+        self.on = False
+        self.commands = 0
+        self.data_bytes = 0
+        self._arg_for = None
+        board.spi(bus).attach(self)
+
+    def on_spi_write(self, buf):
+        if self._cs.level():
+            return  # not selected
+        if self._dc.level():
+            self._data(buf)
+        else:
+            for b in buf:
+                self._command(b)
+
+    def _command(self, b):
+        self.commands += 1
+        if self._arg_for is not None:
+            self._arg_for = None
+            return
+        if b in _TWO_BYTE:
+            self._arg_for = b
+        elif b <= 0x0F:
+            self.column = (self.column & 0xF0) | b
+        elif 0x10 <= b <= 0x17:
+            self.column = (self.column & 0x0F) | ((b & 0x07) << 4)
+        elif 0xB0 <= b <= 0xBF:
+            self.page = b & 0x0F
+        elif b in (0x20, 0x21):
+            self.vertical = b == 0x21
+        elif b in (0xA6, 0xA7):
+            self.inverted = b == 0xA7
+        elif b in (0xAE, 0xAF):
+            self.on = b == 0xAF
+
+    def _data(self, buf):
+        for b in buf:
+            self.data_bytes += 1
+            self.ram[(self.column % self.COLUMNS) * self.PAGES + self.page] = b
+            if self.vertical:
+                self.page = (self.page + 1) % self.PAGES
+                if self.page == 0:
+                    self.column = (self.column + 1) % self.COLUMNS
+            else:
+                self.column = (self.column + 1) % self.COLUMNS
+
+    def ram_as_framebuffer(self, rows=64, rotate=180):
+        """Rebuild the driver's framebuffer: row r went to column r (or 63 - r)."""
+        out = bytearray(rows * self.PAGES)
+        for r in range(rows):
+            column = r if rotate == 180 else (rows - 1 - r)
+            start = column * self.PAGES
+            out[r * self.PAGES:(r + 1) * self.PAGES] = self.ram[start:start + self.PAGES]
+        return out
+
+    def render(self, width=128, height=64, rotate=180):
+        """ASCII-art view of the panel as the driver's framebuffer describes it."""
+        fb = self.ram_as_framebuffer(height, rotate)
+        stride = width // 8
+        lines = []
+        for y in range(0, height, 2):
+            line = []
+            for x in range(width):
+                top = (fb[y * stride + (x >> 3)] >> (x & 7)) & 1
+                bot = (fb[(y + 1) * stride + (x >> 3)] >> (x & 7)) & 1 if y + 1 < height else 0
+                if self.inverted:
+                    top, bot = 1 - top, 1 - bot
+                line.append(" ▄▀█"[bot | (top << 1)])
+            lines.append("".join(line))
+        return "\n".join(lines)
@@ -0,0 +1,143 @@
+"""
+Controller-side telemetry encoders and a synthetic motor controller.
+
+encode_line() and encode_frame() produce exactly what easycontroller.c
+sends (the legacy ASCII line and the binary frame); split_messages()
+undoes the concatenation for raw captures. SyntheticController schedules
+DriveModel samples on an emulated UART at the controller's telemetry period
+so main.py sees live data without hardware.
+"""
+import math
+import random
+import struct
+
+from odometry import EDGES_PER_REV
+from uart_manager import (FLAG_ECO, FRAME_FMT, FRAME_FMT_V1, FRAME_LEN, FRAME_LEN_V1, FRAME_SYNC,
+                          FRAME_VERSION, crc16_ccitt)
+
+# Matches TELEMETRY_PERIOD_MS in easycontroller.c (older firmware sent every 250 ms)
+CONTROLLER_PERIOD_S = 0.05
+
+# How fast the model's wheel speed follows the throttle [s]
+RPM_LAG_S = 2.4
+
+
+def encode_line(voltage_dv, current_ma, rpm, duty, throttle, eco, edges=0):
+    """Legacy ASCII line: s VVV CCCCCC RRR DDD TTT E (carries no edge count)"""
+    return b"s%03d%06d%03d%03d%03d%1d\n" % (voltage_dv, current_ma, rpm, duty, throttle, 1 if eco else 0)
+
+
+def encode_frame(seq, voltage_dv, current_ma, rpm, duty, throttle, eco, edges=0, version=FRAME_VERSION):
+    """Build a binary telemetry frame exactly as send_telemetry_frame() does (version 1 drops edges)."""
+    head = (FRAME_SYNC, version, seq & 0xFF, voltage_dv, current_ma, rpm, duty, throttle,
+            FLAG_ECO if eco else 0)
+    if version == 1:
+        frame = bytearray(struct.pack(FRAME_FMT_V1, *head, 0))
+    else:
+        frame = bytearray(struct.pack(FRAME_FMT, *head, edges & 0xFFFFFFFF, 0))
+    crc = crc16_ccitt(frame, len(frame) - 2)
+    frame[-2] = crc & 0xFF
+    frame[-1] = crc >> 8
+    return bytes(frame)
+
+
+def random_samples(count, seed=1):
+    """Uniformly random (voltage_dv, current_ma, rpm, duty, throttle, eco, edges) tuples."""
+    rnd = random.Random(seed)
+    edges = 0
+    for _ in range(count):
+        rpm = rnd.randint(0, 400)
+        edges += int(rpm * EDGES_PER_REV / 60 * CONTROLLER_PERIOD_S)
+        yield (rnd.randint(300, 420), rnd.randint(-500, 15000), rpm,
+               rnd.randint(0, 100), rnd.randint(0, 100), rnd.randint(0, 1), edges)
+
+
+def make_stream(samples, binary=False):
+    """Concatenate samples into controller output in the ASCII or binary format."""
+    out = bytearray()
+    for seq, sample in enumerate(samples):
+        out += encode_frame(seq, *sample) if binary else encode_line(*sample)
+    return bytes(out)
+
+
+def split_messages(data):
+    """
+    Cut a raw capture into the messages the controller sent, so a replay can
+    space them out like the real link. A sync byte starts a binary frame
+    whose length follows from its version byte; anything else runs to the
+    next newline (or sync byte).
+    """
+    sync = bytes((FRAME_SYNC,))
+    i = 0
+    n = len(data)
+    while i < n:
+        if data[i] == FRAME_SYNC:
+            length = FRAME_LEN_V1 if i + 1 < n and data[i + 1] == 1 else FRAME_LEN
+            end = min(i + length, n)
+        else:
+            nl = data.find(b"\n", i)
+            end = n if nl < 0 else nl + 1
+            s = data.find(sync, i, end)
+            if s > 0:
+                end = s
+        yield data[i:end]
+        i = end
+
+
+class DriveModel:
+    """
+    A plausible drive cycle: the throttle swings slowly, rpm follows with
+    some lag and current tracks throttle, so screens and derived values
+    move the way they do on the car. The commutation edge counter advances
+    with the rpm over the time since the previous sample.
+    """
+    def __init__(self, seed=1):
+        self.rnd = random.Random(seed)
+        self.rpm = 0.0
+        self.edges = 0.0
+        self._t_s = None
+
+    def sample(self, t_s):
+        throttle = int(50 + 50 * math.sin(t_s / 20.0))
+        dt = CONTROLLER_PERIOD_S if self._t_s is None else t_s - self._t_s
+        self.rpm += (throttle * 3.5 - self.rpm) * (1 - math.exp(-dt / RPM_LAG_S))
+        if self._t_s is not None:
+            self.edges += self.rpm * EDGES_PER_REV / 60.0 * dt
+        self._t_s = t_s
+        current = int(throttle * 120 + self.rnd.randint(-200, 200))
+        voltage = int(410 - current // 1000)
+        return (voltage, current, int(self.rpm), throttle, throttle, throttle < 40, int(self.edges))
+
+
+def drive_cycle(count, period_s=CONTROLLER_PERIOD_S, seed=1):
+    """count DriveModel samples taken period_s apart."""
+    model = DriveModel(seed)
+    for i in range(count):
+        yield model.sample(i * period_s)
+
+
+class SyntheticController:
+    """Feeds DriveModel samples into an emulated UART every controller period."""
+    def __init__(self, board, uart_id=1, binary=True, period_s=CONTROLLER_PERIOD_S, seed=1):
+        self.port = board.uart(uart_id)
+        self.board = board
+        self.binary = binary
+        self.period_us = int(period_s * 1e6)
+        self.model = DriveModel(seed)
+        self.seq = 0
+        self.sent = 0
+
+    def start(self, at_s=0.0):
+        self.board.at(at_s * 1e6, self._tick)
+        return self
+
+    def _tick(self):
+        sample = self.model.sample(self.board.clock.peek_us() / 1e6)
+        if self.binary:
+            data = encode_frame(self.seq, *sample)
+        else:
+            data = encode_line(*sample)
+        self.port.feed(data)
+        self.seq += 1
+        self.sent += 1
+        self.board.after(self.period_us, self._tick)
@@ -0,0 +1,325 @@
+"""
+Stand-in for MicroPython's uasyncio, scheduled on the virtual clock.
+
+Tasks are plain CPython coroutines. When every task is sleeping or waiting
+on a stream, the loop jumps the clock straight to the next wake-up (a
+sleep expiring, a UART byte arriving or a board event) the way the real
+scheduler idles in WFE, and the skipped time is added to board.idle_us.
+Only the API the DIS uses is provided: create_task, run, sleep/sleep_ms,
+gather, Event, ThreadSafeFlag and StreamReader over machine.UART.
+"""
+import heapq
+import sys
+import traceback
+from collections import deque
+
+from .board import current
+
+
+class CancelledError(BaseException):
+    pass
+
+
+class TimeoutError(Exception):
+    pass
+
+
+# ------------------------------------------------------------------ awaitables
+
+class _Yield:
+    __slots__ = ("op", "arg")
+
+    def __init__(self, op, arg=None):
+        self.op = op
+        self.arg = arg
+
+    def __await__(self):
+        return (yield self)
+
+
+def sleep_ms(ms):
+    return _Yield("sleep", max(0, int(ms * 1000)))
+
+
+def sleep(seconds):
+    return _Yield("sleep", max(0, int(seconds * 1e6)))
+
+
+class Task:
+    def __init__(self, coro):
+        self.coro = coro
+        self.result = None
+        self.exc = None
+        self.finished = False
+        self.waiters = []
+        self._token = 0
+        self._cancel = False
+
+    def done(self):
+        return self.finished
+
+    def cancel(self):
+        if self.finished:
+            return False
+        self._cancel = True
+        _loop.wake(self)
+        return True
+
+    def __await__(self):
+        if not self.finished:
+            yield _Yield("join", self)
+        if self.exc is not None:
+            raise self.exc
+        return self.result
+
+
+class Event:
+    def __init__(self):
+        self.state = False
+        self.waiters = []
+
+    def is_set(self):
+        return self.state
+
+    def set(self):
+        self.state = True
+        for task in self.waiters:
+            _loop.wake(task)
+        self.waiters = []
+
+    def clear(self):
+        self.state = False
+
+    async def wait(self):
+        if not self.state:
+            await _Yield("event", self)
+        return True
+
+
+class ThreadSafeFlag:
+    """Set from an IRQ, awaited by one task; wait() clears it."""
+    def __init__(self):
+        self.state = False
+        self.waiter = None
+
+    def set(self):
+        self.state = True
+        if self.waiter is not None:
+            task, self.waiter = self.waiter, None
+            _loop.wake(task)
+
+    def clear(self):
+        self.state = False
+
+    async def wait(self):
+        if not self.state:
+            await _Yield("flag", self)
+        self.state = False
+
+
+class StreamReader:
+    """uasyncio.StreamReader over an emulated machine.UART."""
+    def __init__(self, stream):
+        self.s = stream
+
+    async def _readable(self):
+        while not self.s.any():
+            await _Yield("read", self.s)
+
+    async def read(self, n=-1):
+        await self._readable()
+        return self.s.read(None if n < 0 else n)
+
+    async def readinto(self, buf):
+        await self._readable()
+        return self.s.readinto(buf)
+
+    async def readexactly(self, n):
+        out = b""
+        while len(out) < n:
+            out += await self.read(n - len(out))
+        return out
+
+    async def readline(self):
+        out = b""
+        while not out.endswith(b"\n"):
+            out += await self.read(1)
+        return out
+
+
+Stream = StreamReader
+
+
+# ------------------------------------------------------------------ loop
+
+class Loop:
+    def __init__(self):
+        self.ready = deque()
+        self.sleepers = []  # (wake_us, seq, token, task)
+        self.readers = []   # (uart, token, task)
+        self._seq = 0
+
+    def create_task(self, coro):
+        task = Task(coro)
+        self.ready.append((task, task._token))
+        return task
+
+    def wake(self, task):
+        task._token += 1  # invalidates any sleep/read registration
+        self.ready.append((task, task._token))
+
+    def _step(self, task, token):
+        if task.finished or token != task._token:
+            return  # stale wake-up: the task was already resumed another way
+        task._token += 1
+        try:
+            if task._cancel:
+                task._cancel = False
+                op = task.coro.throw(CancelledError())
+            else:
+                op = task.coro.send(None)
+        except StopIteration as e:
+            self._finish(task, e.value, None)
+            return
+        except CancelledError as e:
+            self._finish(task, None, e)
+            return
+        except Exception as e:  # noqa: BLE001 - mirror uasyncio's default handler
+            self._finish(task, None, e)
+            if task is not self.main:
+                print("Task exception wasn't retrieved", file=sys.stderr)
+                traceback.print_exception(type(e), e, e.__traceback__)
+            return
+
+        token = task._token
+        kind = op.op
+        if kind == "sleep":
+            self._seq += 1
+            wake = current().clock.peek_us() + op.arg
+            heapq.heappush(self.sleepers, (wake, self._seq, token, task))
+        elif kind == "read":
+            self.readers.append((op.arg, token, task))
+        elif kind == "join":
+            op.arg.waiters.append(task)
+        elif kind == "event":
+            op.arg.waiters.append(task)
+        elif kind == "flag":
+            op.arg.waiter = task
+
+    def _finish(self, task, result, exc):
+        task.finished = True
+        task.result = result
+        task.exc = exc
+        for waiter in task.waiters:
+            self.ready.append((waiter, waiter._token))
+        task.waiters = []
+
+    def _poll(self):
+        """Move due sleepers and readable streams to the ready queue."""
+        board = current()
+        now = board.clock.now_us()
+        sleepers = self.sleepers
+        while sleepers and sleepers[0][0] <= now:
+            _, _, token, task = heapq.heappop(sleepers)
+            if token == task._token:
+                self.ready.append((task, token))
+        if self.readers:
+            waiting = []
+            for uart, token, task in self.readers:
+                if token != task._token:
+                    continue
+                if uart.any():
+                    self.ready.append((task, token))
+                else:
+                    waiting.append((uart, token, task))
+            self.readers = waiting
+
+    def _idle(self):
+        """Nothing is runnable: skip the clock to the next thing that can wake a task."""
+        board = current()
+        clock = board.clock
+        times = []
+        if self.sleepers:
+            times.append(self.sleepers[0][0])
+        for uart, token, task in self.readers:
+            t = uart._port.next_arrival_us()
+            if t is not None:
+                times.append(t)
+        t = board.next_event_us()
+        if t is not None:
+            times.append(t)
+        if clock.limit_us is not None:
+            times.append(clock.limit_us)
+        if not times:
+            raise RuntimeError("all tasks blocked with nothing left to wake them")
+        delta = min(times) - clock.peek_us()
+        if delta > 0:
+            clock.advance(delta)
+            board.idle_us += delta
+
+    def run_until_complete(self, main):
+        self.main = main if isinstance(main, Task) else self.create_task(main)
+        while not self.main.finished:
+            self._poll()
+            if not self.ready:
+                self._idle()
+                continue
+            for _ in range(len(self.ready)):
+                self._step(*self.ready.popleft())
+                if self.main.finished:
+                    break
+        if self.main.exc is not None:
+            raise self.main.exc
+        return self.main.result
+
+    def run_forever(self):
+        async def forever():
+            while True:
+                await sleep(3600)
+        self.run_until_complete(forever())
+
+
+_loop = Loop()
+
+
+def new_event_loop():
+    global _loop
+    _loop = Loop()
+    return _loop
+
+
+def get_event_loop(runq_len=0, waitq_len=0):
+    return _loop
+
+
+def create_task(coro):
+    return _loop.create_task(coro)
+
+
+def run(coro):
+    return _loop.run_until_complete(coro)
+
+
+async def gather(*aws, return_exceptions=False):
+    tasks = [a if isinstance(a, Task) else create_task(a) for a in aws]
+    results = []
+    for task in tasks:
+        try:
+            results.append(await task)
+        except Exception as e:  # noqa: BLE001
+            if not return_exceptions:
+                raise
+            results.append(e)
+    return results
+
+
+async def wait_for_ms(aw, timeout_ms):
+    task = aw if isinstance(aw, Task) else create_task(aw)
+    waited = 0
+    while not task.done():
+        if waited >= timeout_ms:
+            task.cancel()
+            raise TimeoutError()
+        await sleep_ms(1)
+        waited += 1
+    return await task
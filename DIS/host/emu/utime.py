@@ -0,0 +1,57 @@
+"""
+Stand-in for MicroPython's utime/time module, driven by the virtual clock.
+
+It is registered as both "utime" and "time" while the emulator is
+installed; anything not defined here falls through to CPython's time
+module so host libraries keep working.
+"""
+import time as _host_time
+
+from .board import TICKS_MAX, TICKS_PERIOD, current
+
+_EPOCH_OFFSET = 946684800  # MicroPython epoch is 2000-01-01
+
+
+def ticks_us():
+    return current().clock.now_us() & TICKS_MAX
+
+
+def ticks_ms():
+    return (current().clock.now_us() // 1000) & TICKS_MAX
+
+
+def ticks_cpu():
+    return ticks_us()
+
+
+def ticks_add(ticks, delta):
+    return (ticks + delta) & TICKS_MAX
+
+
+def ticks_diff(ticks1, ticks2):
+    half = TICKS_PERIOD // 2
+    return ((ticks1 - ticks2 + half) & TICKS_MAX) - half
+
+
+def sleep_us(us):
+    current().clock.advance(us)
+
+
+def sleep_ms(ms):
+    current().clock.advance(ms * 1000)
+
+
+def sleep(seconds):
+    current().clock.advance(seconds * 1e6)
+
+
+def time():
+    return _EPOCH_OFFSET + current().clock.peek_us() // 1_000_000
+
+
+def time_ns():
+    return (_EPOCH_OFFSET * 1_000_000 + current().clock.peek_us()) * 1000
+
+
+def __getattr__(name):
+    return getattr(_host_time, name)
@@ -0,0 +1,194 @@
+"""
+Replay recorded controller output through the DIS receive path.
+
+Splits a raw serial capture into controller messages, delivers them on an
+emulated UART1 (wire-rate bytes, one message per controller period, rx
+overruns counted) and runs UartManager.update() plus main.py's derived
+math on every loop. Prints one CSV row per decoded message and a
+throughput summary to stderr.
+
+    python DIS/host/replay.py CAPTURE [--speed N] [--period S] [--loop-ms MS]
+                                      [--binary] [--track CSV] [--out FILE | --quiet]
+    python DIS/host/replay.py --synthetic MESSAGES [--binary] --quiet
+
+Virtual time is independent of the host: --speed 0 (default) replays as
+fast as the parser allows, --speed N paces wall time to N x real time.
+--loop-ms 0 runs the DIS loop once per arriving message; a positive value
+polls on a fixed period like the device loop does.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import emu  # noqa: E402
+
+emu.install()
+
+from derived import mph_from_rpm, remaining, target_speed  # noqa: E402
+from emu.machine import UART  # noqa: E402
+from emu.telemetry import CONTROLLER_PERIOD_S, drive_cycle, make_stream, split_messages  # noqa: E402
+from odometry import Odometer  # noqa: E402
+from pacing import Pacer, load_profile  # noqa: E402
+from uart_manager import UartManager  # noqa: E402
+
+# main.py race setup
+RACE_DISTANCE_MI = 1
+RACE_TIME_MIN = 4
+WHEEL_DIAMETER_IN = 16
+
+COLUMNS = ("t_s", "voltage", "current", "rpm", "mph", "distance_mi", "target_mph")
+
+
+class Replay:
+    """
+    One DIS receive loop on an emulated board. The timer is running from
+    t=0, as if the driver started it at the first message.
+    """
+    def __init__(self, data, period_s=CONTROLLER_PERIOD_S, loop_ms=0, speed=0.0,
+                 goal_distance_mi=RACE_DISTANCE_MI, goal_time_sec=RACE_TIME_MIN * 60,
+                 wheel_diameter_in=WHEEL_DIAMETER_IN, profile=None):
+        self.board = emu.set_current(emu.Board(speed=0))
+        self.port = self.board.uart(1, 115200)
+        self.uart = UART(1, 115200)
+        self.manager = UartManager(self.uart)
+        self.loop_us = int(loop_ms * 1000)
+        self.speed = speed
+        self.goal_distance_mi = goal_distance_mi
+        self.goal_time_sec = goal_time_sec
+        self.wheel_circumference_in = 3.141592653589793 * wheel_diameter_in
+        self.odometer = Odometer(self.wheel_circumference_in)
+        self.pacer = Pacer(profile, goal_time_sec) if profile else None
+
+        self.arrivals = []  # virtual time each message is complete on the wire
+        byte_us = 10e6 / self.port.baudrate
+        t_us = 0
+        for i, msg in enumerate(split_messages(data)):
+            start = i * period_s * 1e6
+            self.port.feed(msg, at_s=start / 1e6)
+            t_us = max(start, t_us) + len(msg) * byte_us
+            self.arrivals.append(int(t_us) + 1)
+        self.nbytes = len(data)
+
+        self.distance = 0.0
+        self.mph = 0.0
+        self.rows = 0
+        self.parse_s = 0.0
+
+    def _step(self, now_us, last_us, emit):
+        mgr = self.manager
+        dt = (now_us - last_us) / 1e6
+        if not self.loop_us and not mgr.has_edges:
+            # One loop per message: integrate the speed held since the last one
+            self.distance += self.mph * dt / 3600
+        t0 = time.perf_counter()
+        mgr.update()
+        self.parse_s += time.perf_counter() - t0
+        self.mph = mph_from_rpm(mgr.rpm, self.wheel_circumference_in)
+        if mgr.has_edges:
+            self.distance = self.odometer.update(mgr.edges)  # same as main.py
+        elif self.loop_us:
+            self.distance += self.mph * dt / 3600  # same order as main.py
+        if mgr.new_data:
+            elapsed = now_us / 1e6
+            left, time_left = remaining(self.goal_distance_mi, self.distance, self.goal_time_sec, elapsed)
+            self.rows += 1
+            if self.pacer:
+                target = self.pacer.update(self.distance, elapsed)
+            else:
+                target = target_speed(left, time_left)
+            if emit:
+                emit((elapsed, mgr.voltage, mgr.current, mgr.rpm, self.mph, self.distance, target))
+
+    def _pace(self, now_us, wall0):
+        if self.speed:
+            ahead = now_us / 1e6 / self.speed - (time.perf_counter() - wall0)
+            if ahead > 0:
+                time.sleep(ahead)
+
+    def run(self, emit=None):
+        clock = self.board.clock
+        wall0 = time.perf_counter()
+        last = 0
+        if self.loop_us:
+            end = self.arrivals[-1] + self.loop_us if self.arrivals else 0
+            while clock.peek_us() < end:
+                clock.advance(self.loop_us)
+                now = clock.peek_us()
+                self._step(now, last, emit)
+                last = now
+                self._pace(now, wall0)
+        else:
+            for t in self.arrivals:
+                clock.advance(t - clock.peek_us())
+                self._step(t, last, emit)
+                last = t
+                self._pace(t, wall0)
+        wall = time.perf_counter() - wall0
+        mgr = self.manager
+        return {
+            "virtual_s": clock.peek_us() / 1e6,
+            "wall_s": wall,
+            "messages": len(self.arrivals),
+            "rows": self.rows,
+            "bytes": self.nbytes,
+            "parse_bytes_per_s": self.nbytes / self.parse_s if self.parse_s else 0,
+            "parse_errors": mgr.parse_errors,
+            "crc_errors": mgr.crc_errors,
+            "dropped_frames": mgr.dropped_frames,
+            "rx_overruns": self.port.overruns + mgr.overruns,
+            "distance_mi": self.distance,
+            "distance_source": "edges" if mgr.has_edges else "mph x dt",
+        }
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    ap.add_argument("capture", nargs="?", help="raw controller output (ASCII lines and/or binary frames)")
+    ap.add_argument("--synthetic", type=int, metavar="MESSAGES", help="replay a generated drive cycle instead")
+    ap.add_argument("--binary", action="store_true", help="synthetic stream uses binary frames")
+    ap.add_argument("--speed", type=float, default=0.0, help="wall pacing, x real time (0 = flat out)")
+    ap.add_argument("--period", type=float, default=CONTROLLER_PERIOD_S, help="seconds between messages")
+    ap.add_argument("--loop-ms", type=float, default=0.0, help="fixed DIS loop period (0 = per message)")
+    ap.add_argument("--track", metavar="CSV", help="pace against a tracks/*.csv profile like main.py")
+    ap.add_argument("--out", help="write CSV rows here instead of stdout")
+    ap.add_argument("--quiet", action="store_true", help="no per-message rows, summary only")
+    args = ap.parse_args()
+
+    if args.synthetic:
+        data = make_stream(drive_cycle(args.synthetic, args.period), binary=args.binary)
+    elif args.capture:
+        with open(args.capture, "rb") as f:
+            data = f.read()
+    else:
+        ap.error("give a capture file or --synthetic")
+
+    out = None
+    emit = None
+    if not args.quiet:
+        out = open(args.out, "w") if args.out else sys.stdout
+        out.write(",".join(COLUMNS) + "\n")
+
+        def emit(row):
+            out.write("{:.3f},{:.1f},{:.3f},{},{:.2f},{:.5f},{:.2f}\n".format(*row))
+
+    profile = load_profile(args.track) if args.track else None
+    r = Replay(data, period_s=args.period, loop_ms=args.loop_ms, speed=args.speed, profile=profile).run(emit)
+    if out is not None and out is not sys.stdout:
+        out.close()
+
+    log = sys.stderr
+    log.write("replayed {} messages ({} bytes, {:.1f} min of driving) in {:.2f} s: {:.0f}x real time\n".format(
+        r["messages"], r["bytes"], r["virtual_s"] / 60, r["wall_s"],
+        r["virtual_s"] / r["wall_s"] if r["wall_s"] else 0))
+    log.write("parser: {:.0f} bytes/s inside update(); {} rows decoded\n".format(
+        r["parse_bytes_per_s"], r["rows"]))
+    log.write("errors: parse {}, crc {}, dropped frames {}, rx overruns {}\n".format(
+        r["parse_errors"], r["crc_errors"], r["dropped_frames"], r["rx_overruns"]))
+    log.write("distance: {:.3f} mi ({})\n".format(r["distance_mi"], r["distance_source"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -8,12 +8,31 @@
 #include "hardware/gpio.h"
 #include "hardware/sync.h"
 #include "hardware/uart.h"
+#include "rpm_estimator.h"
+#include "telemetry_policy.h"
 
 #define UART_ID   uart1
 #define TX_PIN    4       
 #define RX_PIN    5       
 #define BAUD_RATE 115200
 
+// Binary telemetry frame, decoded by DIS/device/uart_manager.py
+#define TELEMETRY_SYNC      0xA5
+#define TELEMETRY_VERSION   2
+#define TELEMETRY_FRAME_LEN 18
+#define TELEMETRY_FLAG_ECO  0x01
+
+// Legacy ASCII line: 's', 3+6+3+3+3+1 digits and '\n'
+#define TELEMETRY_ASCII_LEN 21
+
+// A sample of len bytes takes len * 10 bits on the wire (~1.6 ms for a
+// binary frame, ~1.8 ms for an ASCII line at 115200); sending faster than
+// that would block the main loop in the UART write
+#define TELEMETRY_WIRE_MS(len) (((len) * 10 * 1000 + BAUD_RATE - 1) / BAUD_RATE)
+
+// Status LED toggles at this period while the main loop runs
+#define LED_BLINK_MS        250
+
 // Begin user config section ---------------------------
 
 const bool IDENTIFY_HALLS_ON_BOOT = false;   
@@ -25,6 +44,12 @@ int BATTERY_MAX_CURRENT_MA = 15000;
 const int THROTTLE_LOW = 700;               
 const int THROTTLE_HIGH = 2000;
 int ECO_CURRENT_ma=6000;
+const bool TELEMETRY_BINARY = true;         // If false, send the legacy ASCII line instead of the binary frame
+const int TELEMETRY_PERIOD_MS = 50;         // Regular send period (was a fixed 250)
+const bool TELEMETRY_SEND_ON_CHANGE = true; // Also send early when a value moves by more than the deltas below
+const int TELEMETRY_MIN_INTERVAL_MS = 10;   // Never send closer together than this
+const int TELEMETRY_RPM_DELTA = 5;
+const int TELEMETRY_CURRENT_DELTA_MA = 500;
 uint8_t hallToMotor[8] = {255, 3, 1, 2, 5, 4, 0, 255}; 
 const bool CURRENT_CONTROL = true;          
 const int CURRENT_CONTROL_LOOP_GAIN = 200;  
@@ -73,7 +98,8 @@ uint motorState = 0;
 int fifo_level = 0;
 uint64_t ticks_since_init = 0;
 volatile int throttle = 0;  
-int motorstate_counter = 0;
+rpm_estimator_t rpm_est;                  // Edge timestamps; rpm is computed from these in the main loop
+volatile uint32_t commutation_edges = 0;  // Never reset; wraps at 2^32. Sent for odometry
 int prev_motorstate = 0;
 int rpm = 0;
 
@@ -105,7 +131,8 @@ void on_adc_fifo() {
     hall = get_halls();                 
     motorState = hallToMotor[hall];     
     if (motorState != prev_motorstate){
-        motorstate_counter += 1;
+        rpm_estimator_edge(&rpm_est, time_us_32());
+        commutation_edges += 1;
     }
     
     throttle = ((adc_throttle - THROTTLE_LOW) * 256) / (THROTTLE_HIGH - THROTTLE_LOW);  
@@ -321,6 +348,45 @@ void identify_halls()
 
 
 
+uint16_t crc16_ccitt(const uint8_t *data, uint len) {
+    uint16_t crc = 0xFFFF;
+    for (uint i = 0; i < len; i++) {
+        crc ^= (uint16_t)data[i] << 8;
+        for (uint b = 0; b < 8; b++)
+            crc = (crc & 0x8000) ? (crc << 1) ^ 0x1021 : crc << 1;
+    }
+    return crc;
+}
+
+static inline void put_u16_le(uint8_t *p, uint16_t v) {
+    p[0] = v & 0xFF;
+    p[1] = v >> 8;
+}
+
+static inline void put_u32_le(uint8_t *p, uint32_t v) {
+    put_u16_le(p, v & 0xFFFF);
+    put_u16_le(p + 2, v >> 16);
+}
+
+void send_telemetry_frame(uint8_t seq, int voltage_dv, int current, int rpm_now, int duty_norm, int throttle_norm, bool eco, uint32_t edges) {
+    uint8_t frame[TELEMETRY_FRAME_LEN];
+
+    frame[0] = TELEMETRY_SYNC;
+    frame[1] = TELEMETRY_VERSION;
+    frame[2] = seq;
+    put_u16_le(&frame[3], (uint16_t)MAX(0, MIN(0xFFFF, voltage_dv)));
+    put_u16_le(&frame[5], (uint16_t)(int16_t)MAX(-32768, MIN(32767, current)));
+    put_u16_le(&frame[7], (uint16_t)MAX(0, MIN(0xFFFF, rpm_now)));
+    frame[9] = (uint8_t)MAX(0, MIN(255, duty_norm));
+    frame[10] = (uint8_t)MAX(0, MIN(255, throttle_norm));
+    frame[11] = eco ? TELEMETRY_FLAG_ECO : 0;
+    put_u32_le(&frame[12], edges);
+    put_u16_le(&frame[16], crc16_ccitt(frame, TELEMETRY_FRAME_LEN - 2));
+
+    uart_write_blocking(UART_ID, frame, TELEMETRY_FRAME_LEN);
+}
+
+
 void wait_for_serial_command(const char *message) {
     printf("%s\n", message);
     printf("Type any key + Enter to continue...\n");
@@ -367,15 +433,32 @@ int main() {
     int duty_cycle_norm = 0;
     int throttle_norm = 0;
     int eco;
+    uint8_t telemetry_seq = 0;
+
+    telemetry_policy_t telemetry = {
+        .min_interval_ms = MAX(TELEMETRY_MIN_INTERVAL_MS,
+                               TELEMETRY_WIRE_MS(TELEMETRY_BINARY ? TELEMETRY_FRAME_LEN : TELEMETRY_ASCII_LEN)),
+        .send_on_change = TELEMETRY_SEND_ON_CHANGE,
+        .rpm_delta = TELEMETRY_RPM_DELTA,
+        .current_delta_ma = TELEMETRY_CURRENT_DELTA_MA,
+    };
+    telemetry.period_ms = MAX(TELEMETRY_PERIOD_MS, telemetry.min_interval_ms);
 
     sleep_ms(1000);
 
     pwm_set_irq_enabled(A_PWM_SLICE, true); 
+
+    uint32_t led_toggle_ms = to_ms_since_boot(get_absolute_time());
+    telemetry_policy_init(&telemetry, led_toggle_ms);
     
     while (true) {
-        gpio_put(LED_PIN, !gpio_get(LED_PIN));  
-        rpm = (motorstate_counter * 4 * 60) / 23 / 6;
-        motorstate_counter = 0;
+        uint32_t now = to_ms_since_boot(get_absolute_time());
+        if (now - led_toggle_ms >= LED_BLINK_MS) {
+            gpio_put(LED_PIN, !gpio_get(LED_PIN));  
+            led_toggle_ms = now;
+        }
+        // From the period of the latest commutation edges; decays toward 0 once they stop
+        rpm = rpm_estimator_rpm(&rpm_est, time_us_32());
         check_serial_input_for_Phase_Current(); 
         duty_cycle_norm = duty_cycle*100/DUTY_CYCLE_MAX;
         throttle_norm = throttle*100/255;
@@ -387,9 +470,20 @@ int main() {
         { 
             eco = 0;
         }
-        snprintf(message, sizeof(message), "%c%03d%06d%03d%03d%03d%1d\n", signal, UARTvoltage_mv, current_ma, rpm, duty_cycle_norm, throttle_norm,eco);
-        uart_puts(UART_ID, message);
-        sleep_ms(250);
+
+        // Send-on-change compares smoothed current; the sample sent stays raw
+        telemetry_filter_current(&telemetry, current_ma);
+        if (telemetry_due(&telemetry, now, rpm, eco)) {
+            if (TELEMETRY_BINARY) {
+                send_telemetry_frame(telemetry_seq++, UARTvoltage_mv, current_ma, rpm, duty_cycle_norm, throttle_norm, eco, commutation_edges);
+            }
+            else {
+                snprintf(message, sizeof(message), "%c%03d%06d%03d%03d%03d%1d\n", signal, UARTvoltage_mv, current_ma, rpm, duty_cycle_norm, throttle_norm,eco);
+                uart_puts(UART_ID, message);
+            }
+            telemetry_sent(&telemetry, now, rpm, eco);
+        }
+        sleep_ms(1);
     }
 
     return 0;
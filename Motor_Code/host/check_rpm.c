@@ -0,0 +1,172 @@
+// Host check for rpm_estimator.h: feeds synthetic hall sequences through the
+// same edge detection as on_adc_fifo() and compares the estimate with the
+// true wheel speed, next to the previous 250 ms edge-counting window.
+//
+//     cc -O2 -Wall -I.. check_rpm.c -o check_rpm -lm && ./check_rpm
+//
+// A last check stamps an edge just after the main loop read now_us, as
+// on_adc_fifo() can between time_us_32() and the estimator's read.
+// Exits non-zero if any scenario is outside its tolerance.
+
+#include <math.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include "rpm_estimator.h"
+
+#define ISR_PERIOD_US   64      // ADC FIFO interrupt, once per PWM period
+#define LOOP_PERIOD_US  1000    // main loop: sleep_ms(1)
+#define WINDOW_MS       250     // previous estimator's counting window
+#define LAUNCH_RPM      30      // launch boost threshold in the ADC handler
+
+// Same table as easycontroller.c
+static const int hall_to_motor[8] = {255, 3, 1, 2, 5, 4, 0, 255};
+static int motor_to_hall[6];
+
+typedef double (*speed_fn)(double t_s);
+
+typedef struct {
+    const char *name;
+    speed_fn speed;     // true wheel speed [rpm] at t
+    double seconds;
+    double hall_skew;   // every other hall edge is early by this fraction of an edge
+    double settle_s;    // errors before this are not scored
+    double tolerance;   // allowed |error| [rpm]
+} scenario_t;
+
+static double cruise(double t) { (void)t; return 250.0; }
+static double crawl(double t) { (void)t; return 12.0; }
+static double launch(double t) { return t < 4.0 ? 80.0 * t : 320.0; }
+static double coast_to_stop(double t) {
+    double v = t < 1.0 ? 200.0 : 200.0 - 100.0 * (t - 1.0);
+    return v > 0.0 ? v : 0.0;
+}
+
+static const scenario_t scenarios[] = {
+    {"cruise 250 rpm",          cruise,        3.0, 0.00, 0.5, 1.0},
+    {"cruise, 10% hall skew",   cruise,        3.0, 0.10, 0.5, 1.0},
+    {"crawl 12 rpm, 10% skew",  crawl,         5.0, 0.10, 1.5, 1.0},
+    {"launch 0-320 in 4 s",     launch,        6.0, 0.05, 0.5, 6.0},
+    {"coast 200 rpm to stop",   coast_to_stop, 5.0, 0.05, 0.5, 8.0},
+};
+
+// When the true speed, the new estimate and the old window first crossed LAUNCH_RPM
+typedef struct {
+    double t_true, t_est, t_window;
+} crossing_t;
+
+static void note_crossing(double *t, double t_now, int prev, int now, int rising) {
+    if (*t >= 0) {
+        return;
+    }
+    if (rising ? (prev < LAUNCH_RPM && now >= LAUNCH_RPM) : (prev >= LAUNCH_RPM && now < LAUNCH_RPM)) {
+        *t = t_now;
+    }
+}
+
+static int run(const scenario_t *s) {
+    rpm_estimator_t est = {0};
+    uint32_t motor_state = 0, edges_in_window = 0;
+    int window_rpm = 0, prev_est = 0, prev_window = 0, prev_true = 0;
+    double position = 0.0;      // wheel position in commutation edges
+    double err_max = 0.0, err_sum = 0.0, werr_max = 0.0, werr_sum = 0.0;
+    long scored = 0;
+    int rising = s->speed(0.0) < LAUNCH_RPM;
+    crossing_t cross = {-1, -1, -1};
+    uint32_t window_start_us = 0;
+
+    for (uint32_t now_us = 0; now_us < (uint32_t)(s->seconds * 1e6); now_us += ISR_PERIOD_US) {
+        double t = now_us / 1e6;
+        double v = s->speed(t);
+        position += v * RPM_EDGES_PER_REV / 60.0 * ISR_PERIOD_US / 1e6;
+
+        // Hall sensors: edge k sits at position k, odd edges early by the skew
+        long k = (long)floor(position);
+        if (!(k & 1) && position - k > 1.0 - s->hall_skew) {
+            k += 1;
+        }
+        int hall = motor_to_hall[k % 6];
+
+        // on_adc_fifo()
+        uint32_t prev_state = motor_state;
+        motor_state = hall_to_motor[hall];
+        if (now_us > 0 && motor_state != prev_state) {
+            rpm_estimator_edge(&est, now_us);
+            edges_in_window++;
+        }
+
+        if (now_us % LOOP_PERIOD_US >= ISR_PERIOD_US) {
+            continue;
+        }
+
+        // Main loop: the new estimator every pass, the old one per window
+        int rpm = rpm_estimator_rpm(&est, now_us);
+        uint32_t window_us = now_us - window_start_us;
+        if (window_us >= WINDOW_MS * 1000) {
+            window_rpm = (int)((uint64_t)edges_in_window * 60000000ull / ((uint64_t)window_us * RPM_EDGES_PER_REV));
+            edges_in_window = 0;
+            window_start_us = now_us;
+        }
+
+        int truth = (int)lround(v);
+        note_crossing(&cross.t_true, t, prev_true, truth, rising);
+        note_crossing(&cross.t_est, t, prev_est, rpm, rising);
+        note_crossing(&cross.t_window, t, prev_window, window_rpm, rising);
+        prev_true = truth;
+        prev_est = rpm;
+        prev_window = window_rpm;
+
+        if (t >= s->settle_s) {
+            double err = fabs(rpm - v), werr = fabs(window_rpm - v);
+            err_max = fmax(err_max, err);
+            werr_max = fmax(werr_max, werr);
+            err_sum += err;
+            werr_sum += werr;
+            scored++;
+        }
+    }
+
+    int ok = err_max <= s->tolerance;
+    printf("%-24s %7.2f %7.2f %9.2f %9.2f", s->name,
+           err_sum / scored, err_max, werr_sum / scored, werr_max);
+    if (cross.t_true >= 0) {
+        printf("   %s %d rpm: edges +%3.0f ms, window +%3.0f ms", rising ? "up" : "down", LAUNCH_RPM,
+               (cross.t_est - cross.t_true) * 1e3, (cross.t_window - cross.t_true) * 1e3);
+    }
+    printf("%s\n", ok ? "" : "   FAIL");
+    return ok;
+}
+
+// Steady edges at 250 rpm, then one stamped after now_us was read: the
+// estimate must hold instead of reading as stopped
+static int check_edge_after_now(void) {
+    rpm_estimator_t est = {0};
+    const double truth = 250.0;
+    uint32_t edge_us = (uint32_t)lround(60e6 / (truth * RPM_EDGES_PER_REV));
+    uint32_t t = 0xFFFF0000u;   // near the wrap too
+    for (int i = 0; i < 2 * RPM_AVERAGE_EDGES; i++) {
+        t += edge_us;
+        rpm_estimator_edge(&est, t);
+    }
+    uint32_t now_us = t + edge_us - 5;
+    rpm_estimator_edge(&est, t + edge_us);
+    int rpm = rpm_estimator_rpm(&est, now_us);
+    int ok = fabs(rpm - truth) <= 1.0;
+    printf("%-24s %7d rpm (true %.0f)%s\n", "edge after now_us", rpm, truth, ok ? "" : "   FAIL");
+    return ok;
+}
+
+int main(void) {
+    for (int hall = 1; hall < 7; hall++) {
+        motor_to_hall[hall_to_motor[hall]] = hall;
+    }
+
+    printf("rpm error vs true wheel speed [rpm]   (edge timestamps | %d ms window)\n", WINDOW_MS);
+    printf("%-24s %7s %7s %9s %9s\n", "scenario", "mean", "max", "win mean", "win max");
+    int ok = 1;
+    for (size_t i = 0; i < sizeof(scenarios) / sizeof(scenarios[0]); i++) {
+        ok &= run(&scenarios[i]);
+    }
+    ok &= check_edge_after_now();
+    printf("%s\n", ok ? "all within tolerance" : "FAILED");
+    return ok ? 0 : 1;
+}
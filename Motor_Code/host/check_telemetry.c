@@ -0,0 +1,103 @@
+// Host check for telemetry_policy.h: runs the main loop's send decision
+// against a noisy current signal and reports the send rate, next to the
+// previous check of the raw current sample.
+//
+//     cc -O2 -Wall -I.. check_telemetry.c -o check_telemetry -lm && ./check_telemetry
+//
+// The current is a steady draw plus Gaussian noise, quantized to the ADC's
+// 80 mA step (CURRENT_SCALING); the settings are easycontroller.c's
+// defaults. A step scenario checks that a real change still goes out early.
+// Exits non-zero if steady noise pushes the rate above the regular period
+// or a step is not sent within STEP_LATENCY_MS.
+
+#include <math.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include "telemetry_policy.h"
+
+#define LSB_MA          80      // CURRENT_SCALING
+#define RUN_MS          10000
+#define STEP_MA         3000
+#define STEP_LATENCY_MS 10
+
+static telemetry_policy_t defaults(void) {
+    telemetry_policy_t p = {
+        .period_ms = 50,
+        .min_interval_ms = 10,
+        .send_on_change = true,
+        .rpm_delta = 5,
+        .current_delta_ma = 500,
+    };
+    telemetry_policy_init(&p, 0);
+    return p;
+}
+
+static double gauss(void) {
+    double u1 = (rand() + 1.0) / (RAND_MAX + 2.0);
+    double u2 = (rand() + 1.0) / (RAND_MAX + 2.0);
+    return sqrt(-2.0 * log(u1)) * cos(2.0 * M_PI * u2);
+}
+
+static int sample(double mean_ma, double noise_lsb) {
+    return (int)lround(mean_ma / LSB_MA + noise_lsb * gauss()) * LSB_MA;
+}
+
+// Sends per second over RUN_MS; step_at >= 0 adds STEP_MA there and
+// reports how long the first send after it took in *latency
+static double run(double noise_lsb, bool raw, int step_at, int *latency) {
+    telemetry_policy_t p = defaults();
+    int sends = 0;
+    int raw_sent = 0;
+    *latency = -1;
+    srand(1);
+    for (uint32_t now = 0; now < RUN_MS; now++) {
+        double mean = 8000.0 + (step_at >= 0 && (int)now >= step_at ? STEP_MA : 0);
+        int current = sample(mean, noise_lsb);
+        telemetry_filter_current(&p, current);
+        bool due;
+        if (raw) {
+            // Before: the raw sample against the raw sample last sent
+            uint32_t since = now - p.last_send_ms;
+            due = since >= (uint32_t)p.period_ms
+                || (since >= (uint32_t)p.min_interval_ms && abs(current - raw_sent) >= p.current_delta_ma);
+        } else {
+            due = telemetry_due(&p, now, 250, 0);
+        }
+        if (due) {
+            telemetry_sent(&p, now, 250, 0);
+            raw_sent = current;
+            if (now > 100) {            // after the filter has settled
+                sends++;
+            }
+            if (step_at >= 0 && (int)now >= step_at && *latency < 0) {
+                *latency = now - step_at;
+            }
+        }
+    }
+    return sends / ((RUN_MS - 100) / 1000.0);
+}
+
+int main(void) {
+    const double noise[] = {1.0, 3.0, 5.0};
+    bool ok = true;
+    int latency;
+
+    printf("telemetry sends per second at 8 A, period 50 ms (20/s), min interval 10 ms\n");
+    printf("%-22s %10s %10s\n", "current noise", "filtered", "raw");
+    for (unsigned i = 0; i < sizeof(noise) / sizeof(noise[0]); i++) {
+        double filtered = run(noise[i], false, -1, &latency);
+        double raw = run(noise[i], true, -1, &latency);
+        bool pass = filtered <= 20.5;
+        printf("%4.0f LSB (%4.0f mA rms) %10.1f %10.1f%s\n", noise[i], noise[i] * LSB_MA, filtered, raw,
+               pass ? "" : "   FAIL");
+        ok = ok && pass;
+    }
+
+    run(3.0, false, 5003, &latency);
+    bool pass = latency >= 0 && latency <= STEP_LATENCY_MS;
+    printf("%d mA step with 3 LSB noise: sent after %d ms%s\n", STEP_MA, latency, pass ? "" : "   FAIL");
+    ok = ok && pass;
+
+    printf("%s\n", ok ? "all within tolerance" : "FAILED");
+    return ok ? 0 : 1;
+}
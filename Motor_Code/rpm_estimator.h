@@ -0,0 +1,87 @@
+// Wheel speed from the timestamps of the last few commutation edges.
+//
+// on_adc_fifo() stamps every hall state change into a small ring; the main
+// loop turns the time spanned by the newest edges into rpm whenever it
+// likes, so the estimate is never a whole counting window old and has no
+// per-window integer truncation. When edges stop arriving the estimate is
+// capped by "one more edge could arrive right now", which decays it toward
+// zero as 1/t instead of holding the last speed until a window closes.
+//
+// Header-only so Motor_Code/host/check_rpm.c can build it for the host.
+
+#ifndef RPM_ESTIMATOR_H
+#define RPM_ESTIMATOR_H
+
+#include <stdint.h>
+
+#define RPM_EDGES_PER_REV   (23 * 6)    // 23 pole pairs x 6 commutation states
+#define RPM_EDGE_HISTORY    16          // power of two
+#define RPM_AVERAGE_EDGES   12          // two electrical revolutions: evens out hall placement error
+#define RPM_MAX_SPAN_US     100000      // use fewer edges rather than average over more than this
+#define RPM_STOP_US         1000000     // no edge for this long: stopped (below ~0.4 rpm)
+#define RPM_JITTER_DIV      4           // edges up to period / 4 late are jitter, not slowing
+
+typedef struct {
+    volatile uint32_t edge_us[RPM_EDGE_HISTORY];
+    volatile uint32_t count;            // edges recorded; the newest is edge_us[(count - 1) % HISTORY]
+} rpm_estimator_t;
+
+// ISR side: record one commutation edge at now_us (time_us_32())
+static inline void rpm_estimator_edge(rpm_estimator_t *e, uint32_t now_us) {
+    uint32_t n = e->count;
+    e->edge_us[n & (RPM_EDGE_HISTORY - 1)] = now_us;
+    e->count = n + 1;   // published after the timestamp, so a reader never sees a stale slot
+}
+
+static inline uint32_t rpm_estimator_edge_at(const rpm_estimator_t *e, uint32_t index) {
+    return e->edge_us[index & (RPM_EDGE_HISTORY - 1)];
+}
+
+// Main-loop side: rpm at now_us, rounded to the nearest integer
+static inline int rpm_estimator_rpm(const rpm_estimator_t *e, uint32_t now_us) {
+    uint32_t count, newest, span = 0;
+    uint32_t intervals = 0;
+
+    // The ISR can add an edge mid-read; retry until the count is unchanged
+    do {
+        count = e->count;
+        if (count < 2) {
+            return 0;
+        }
+        newest = rpm_estimator_edge_at(e, count - 1);
+        intervals = count - 1;
+        if (intervals > RPM_AVERAGE_EDGES) {
+            intervals = RPM_AVERAGE_EDGES;
+        }
+        span = newest - rpm_estimator_edge_at(e, count - 1 - intervals);
+        // Slow wheel: one electrical revolution, else an edge pair (still
+        // cancels alternating hall error), else the last edge alone
+        while (intervals > 1 && span > RPM_MAX_SPAN_US) {
+            intervals = intervals > 6 ? 6 : intervals > 2 ? 2 : 1;
+            span = newest - rpm_estimator_edge_at(e, count - 1 - intervals);
+        }
+    } while (e->count != count);
+
+    // The caller reads now_us before calling, so an edge the ISR stamps in
+    // between is newer than now_us: nothing has been silent yet
+    uint32_t silent = (int32_t)(now_us - newest) < 0 ? 0 : now_us - newest;
+    if (silent >= RPM_STOP_US || span == 0) {
+        return 0;
+    }
+
+    // Average edge period over the window. Once the wait for the next edge
+    // outgrows that by more than edge jitter (hall placement, ISR rate), the
+    // wheel has slowed: stretch the period with the wait, continuously, so
+    // rpm falls off as 1/t
+    uint64_t period_x = (uint64_t)span;                 // period x intervals, kept exact
+    uint64_t waited_x = (uint64_t)silent * intervals;
+    uint64_t jitter_x = period_x / RPM_JITTER_DIV;
+    if (waited_x > period_x + jitter_x) {
+        period_x = waited_x - jitter_x;
+    }
+    uint64_t num = 60000000ull * intervals;             // us per minute x intervals
+    uint64_t den = period_x * RPM_EDGES_PER_REV;
+    return (int)((num + den / 2) / den);
+}
+
+#endif
@@ -0,0 +1,70 @@
+// When the main loop sends a telemetry sample to the DIS.
+//
+// A sample goes out every period_ms, and early when rpm, current or eco have
+// moved since the last one, but never closer together than min_interval_ms.
+// current_ma is a single raw ADC sample taken every PWM cycle, so its noise
+// and ripple (a few 80 mA LSBs) would trip the current delta on nearly every
+// check; it is compared through an exponential moving average updated once
+// per main-loop pass instead.
+//
+// Header-only so Motor_Code/host/check_telemetry.c can build it for the host.
+
+#ifndef TELEMETRY_POLICY_H
+#define TELEMETRY_POLICY_H
+
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+#define TELEMETRY_CURRENT_EMA_SHIFT 4   // weight 1/16 per pass: ~16 ms time constant at the 1 ms loop
+
+typedef struct {
+    int period_ms;
+    int min_interval_ms;
+    bool send_on_change;
+    int rpm_delta;
+    int current_delta_ma;
+
+    int32_t current_acc;                // filtered current << TELEMETRY_CURRENT_EMA_SHIFT
+    int sent_rpm;                       // what the DIS was last sent
+    int sent_current_ma;                // filtered current at the last send
+    int sent_eco;
+    uint32_t last_send_ms;
+} telemetry_policy_t;
+
+static inline void telemetry_policy_init(telemetry_policy_t *p, uint32_t now_ms) {
+    p->current_acc = 0;
+    p->sent_rpm = 0;
+    p->sent_current_ma = 0;
+    p->sent_eco = 0;
+    p->last_send_ms = now_ms;
+}
+
+// Once per main-loop pass: fold in the latest current sample, return the filtered current
+static inline int telemetry_filter_current(telemetry_policy_t *p, int current_ma) {
+    p->current_acc += current_ma - (p->current_acc >> TELEMETRY_CURRENT_EMA_SHIFT);
+    return p->current_acc >> TELEMETRY_CURRENT_EMA_SHIFT;
+}
+
+static inline bool telemetry_due(const telemetry_policy_t *p, uint32_t now_ms, int rpm, int eco) {
+    uint32_t since_ms = now_ms - p->last_send_ms;
+    if (since_ms >= (uint32_t)p->period_ms) {
+        return true;
+    }
+    if (!p->send_on_change || since_ms < (uint32_t)p->min_interval_ms) {
+        return false;
+    }
+    int current_ma = p->current_acc >> TELEMETRY_CURRENT_EMA_SHIFT;
+    return abs(rpm - p->sent_rpm) >= p->rpm_delta
+        || abs(current_ma - p->sent_current_ma) >= p->current_delta_ma
+        || eco != p->sent_eco;
+}
+
+static inline void telemetry_sent(telemetry_policy_t *p, uint32_t now_ms, int rpm, int eco) {
+    p->sent_rpm = rpm;
+    p->sent_current_ma = p->current_acc >> TELEMETRY_CURRENT_EMA_SHIFT;
+    p->sent_eco = eco;
+    p->last_send_ms = now_ms;
+}
+
+#endif